@@ -1,161 +1,177 @@
 """
 Standalone Privacy Policy Analyzer
 Bypasses main.py to avoid datetime issue
+
+Analyzes every scraped policy in data/raw/ concurrently; requests are
+network-bound, so they are kept in flight together (bounded by a semaphore).
+Pass --batch to submit them through the OpenAI Batch API instead (half the
+cost, results within 24h) for offline research runs.
 """
 
-import os
+import re
 import json
+import time
+import asyncio
+import argparse
+import traceback
+import tiktoken
+from glob import glob
+from pathlib import Path
 from datetime import datetime
-from openai import OpenAI
+from openai import AsyncOpenAI, RateLimitError
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
+from src.utils.openai_client import get_client, get_async_client
 
-# Initialize OpenAI
-client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+MODEL = "gpt-4-turbo-preview"
+MAX_CONCURRENCY = 8
+MAX_POLICY_TOKENS = 4000
+RAW_POLICY_GLOB = 'data/raw/*.txt'
+BATCH_INPUT_FILE = 'data/processed/batch_input.jsonl'
+BATCH_POLL_SECONDS = 60
 
-# Read the scraped policy
-with open('data/raw/Teladoc_raw_20251222_220953.txt', 'r', encoding='utf-8') as f:
-    policy_text = f.read()
+# Body of the first ```json / ``` fenced block in a model response
+_FENCE_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)```")
 
-print("🔍 Analyzing Teladoc Privacy Policy...")
-print(f"📄 Policy length: {len(policy_text):,} characters")
+# Tokenizer for MODEL, loaded on first use
+_encoding = None
 
-# Create analysis prompt
-prompt = f"""You are a privacy policy expert. Analyze this healthcare app privacy policy and return a JSON object.
+STATIC_SYSTEM = "You are a privacy policy analysis expert. Return only valid JSON."
 
-Privacy Policy Text:
-{policy_text[:15000]}  
+# Fixed instructions and schema. This must stay byte-identical across requests
+# (nothing per-policy interpolated) and precede the policy text, so OpenAI's
+# automatic prompt caching can reuse it as a shared prefix.
+STATIC_PROMPT_PREFIX = """You are a privacy policy expert. Analyze the healthcare app privacy policy that follows "POLICY:" and return a JSON object.
 
 Return ONLY valid JSON with this exact structure:
-{{
+{
   "summary": "2-3 sentence overview",
-  "data_collection": {{
+  "data_collection": {
     "score": 50,
     "types_collected": ["health data", "location", "device info"],
     "concerns": ["specific concern 1", "concern 2"]
-  }},
-  "data_usage": {{
+  },
+  "data_usage": {
     "score": 50,
     "purposes": ["treatment", "marketing"],
     "concerns": []
-  }},
-  "third_party_sharing": {{
+  },
+  "third_party_sharing": {
     "score": 60,
     "partners_mentioned": ["insurance companies", "analytics"],
     "concerns": ["vague language about partners"]
-  }},
-  "data_retention": {{
+  },
+  "data_retention": {
     "score": 40,
     "retention_period": "unspecified",
     "concerns": ["no clear retention period"]
-  }},
-  "user_rights": {{
+  },
+  "user_rights": {
     "score": 55,
     "access_rights": "yes/no",
     "deletion_rights": "yes/no",
     "concerns": []
-  }},
-  "security_measures": {{
+  },
+  "security_measures": {
     "score": 60,
     "technical_safeguards": ["encryption"],
     "concerns": []
-  }},
-  "compliance": {{
+  },
+  "compliance": {
     "score": 70,
     "hipaa_mentioned": true,
     "hipaa_compliance_details": "claims HIPAA compliance",
     "concerns": []
-  }},
-  "older_adult_considerations": {{
+  },
+  "older_adult_considerations": {
     "score": 30,
     "readability_score": "college level",
     "concerns": ["complex legal language"]
-  }},
+  },
   "red_flags": [
-    {{
+    {
       "category": "third_party_sharing",
       "severity": "high",
       "description": "Shares data with unspecified partners",
       "quote": "exact quote from policy"
-    }}
+    }
   ],
   "positive_practices": [
-    {{
+    {
       "category": "compliance",
       "description": "Mentions HIPAA compliance",
       "quote": "relevant quote"
-    }}
+    }
   ],
   "overall_transparency_score": 55,
   "missing_information": ["retention period", "breach notification timeline"]
-}}
+}
 
 Analyze scores from 0-100 where 100 = highest risk/worst privacy.
 Include at least 3 red flags and 2 positive practices.
 Return ONLY the JSON, no other text."""
 
-print("💭 Calling OpenAI GPT-4...")
 
-try:
-    response = client.chat.completions.create(
-        model="gpt-4-turbo-preview",
-        messages=[
-            {"role": "system", "content": "You are a privacy policy analysis expert. Return only valid JSON."},
-            {"role": "user", "content": prompt}
+def get_encoding():
+    """Return the cached tiktoken encoding for MODEL"""
+    global _encoding
+    if _encoding is None:
+        _encoding = tiktoken.encoding_for_model(MODEL)
+    return _encoding
+
+
+def truncate_policy(policy_text: str, max_tokens: int = MAX_POLICY_TOKENS) -> str:
+    """Trim the policy to at most max_tokens tokens of MODEL's tokenizer"""
+    encoding = get_encoding()
+    tokens = encoding.encode(policy_text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return policy_text
+    return encoding.decode(tokens[:max_tokens])
+
+
+def build_request_body(policy_text: str) -> dict:
+    """Chat completions request body for one policy"""
+    return {
+        "model": MODEL,
+        "messages": [
+            {"role": "system", "content": STATIC_SYSTEM},
+            {"role": "user", "content": STATIC_PROMPT_PREFIX + "\n\nPOLICY:\n" + truncate_policy(policy_text)}
         ],
-        temperature=0.3,
-        max_tokens=4000
-    )
-    
-    # Extract response
-    result_text = response.choices[0].message.content
-    
-    # Clean up response (remove markdown if present)
-    if "```json" in result_text:
-        result_text = result_text.split("```json")[1].split("```")[0]
-    elif "```" in result_text:
-        result_text = result_text.split("```")[1].split("```")[0]
-    
-    # Parse JSON
-    result = json.loads(result_text.strip())
-    
-    # Calculate overall risk score
-    category_scores = [
-        result.get('data_collection', {}).get('score', 50),
-        result.get('data_usage', {}).get('score', 50),
-        result.get('third_party_sharing', {}).get('score', 50),
-        result.get('data_retention', {}).get('score', 50),
-        result.get('user_rights', {}).get('score', 50),
-        result.get('security_measures', {}).get('score', 50),
-        result.get('compliance', {}).get('score', 50),
-        result.get('older_adult_considerations', {}).get('score', 50)
-    ]
-    overall_score = sum(category_scores) / len(category_scores)
-    
-    result['overall_risk_score'] = round(overall_score, 1)
-    result['metadata'] = {
-        'app_name': 'Teladoc',
-        'analysis_date': datetime.now().isoformat(),
-        'model': 'gpt-4-turbo-preview',
-        'policy_length': len(policy_text)
+        "temperature": 0.3,
+        "max_tokens": 4000
     }
-    
-    print("\n✅ Analysis Complete!")
+
+
+@retry(
+    retry=retry_if_exception_type(RateLimitError),
+    wait=wait_random_exponential(multiplier=1, max=60),
+    stop=stop_after_attempt(6),
+    reraise=True
+)
+async def request_analysis(client: AsyncOpenAI, policy_text: str):
+    """Call the chat completions API, backing off exponentially on 429s"""
+    return await client.chat.completions.create(**build_request_body(policy_text))
+
+
+def parse_response(result_text: str) -> dict:
+    """Strip optional markdown fences from the model output and parse the JSON"""
+    m = _FENCE_RE.search(result_text)
+    payload = (m.group(1) if m else result_text).strip()
+    return json.loads(payload)
+
+
+def print_summary(app_name: str, result: dict, overall_score: float, output_file: str):
+    """Print the per-policy summary"""
+    print(f"\n✅ {app_name}: Analysis Complete!")
     print(f"📊 Overall Risk Score: {overall_score:.1f}/100")
     print(f"🚩 Red Flags: {len(result.get('red_flags', []))}")
     print(f"✨ Positive Practices: {len(result.get('positive_practices', []))}")
-    
-    # Save result
-    output_file = f"outputs/reports/Teladoc_standalone_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(result, f, indent=2)
-    
     print(f"\n💾 Saved to: {output_file}")
-    
-    # Print summary
+
     print("\n" + "="*60)
-    print("SUMMARY")
+    print(f"SUMMARY: {app_name}")
     print("="*60)
     print(result.get('summary', 'No summary'))
-    
+
     print("\n📊 CATEGORY SCORES:")
     print(f"  Data Collection: {result.get('data_collection', {}).get('score', 'N/A')}")
     print(f"  Third Party Sharing: {result.get('third_party_sharing', {}).get('score', 'N/A')}")
@@ -163,12 +179,190 @@ try:
     print(f"  User Rights: {result.get('user_rights', {}).get('score', 'N/A')}")
     print(f"  Security: {result.get('security_measures', {}).get('score', 'N/A')}")
     print(f"  HIPAA Compliance: {result.get('compliance', {}).get('score', 'N/A')}")
-    
+
     print("\n🚩 TOP RED FLAGS:")
     for i, flag in enumerate(result.get('red_flags', [])[:3], 1):
         print(f"  {i}. [{flag.get('severity', 'unknown').upper()}] {flag.get('description', 'N/A')}")
-    
-except Exception as e:
-    print(f"\n❌ Error: {e}")
-    import traceback
-    traceback.print_exc()
\ No newline at end of file
+
+
+def save_result(app_name: str, result_text: str, policy_length: int) -> str:
+    """
+    Parse a model response, add the overall score and metadata, and save it
+
+    Returns:
+        Path to the saved JSON result
+    """
+    result = parse_response(result_text)
+
+    # Calculate overall risk score
+    category_scores = [
+        result.get('data_collection', {}).get('score', 50),
+        result.get('data_usage', {}).get('score', 50),
+        result.get('third_party_sharing', {}).get('score', 50),
+        result.get('data_retention', {}).get('score', 50),
+        result.get('user_rights', {}).get('score', 50),
+        result.get('security_measures', {}).get('score', 50),
+        result.get('compliance', {}).get('score', 50),
+        result.get('older_adult_considerations', {}).get('score', 50)
+    ]
+    overall_score = sum(category_scores) / len(category_scores)
+
+    now = datetime.now()
+    result['overall_risk_score'] = round(overall_score, 1)
+    result['metadata'] = {
+        'app_name': app_name,
+        'analysis_date': now.isoformat(),
+        'model': MODEL,
+        'policy_length': policy_length
+    }
+
+    output_file = f"outputs/reports/{app_name}_standalone_{now.strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2)
+
+    print_summary(app_name, result, overall_score, output_file)
+    return output_file
+
+
+def app_name_for(path: str) -> str:
+    """App name from a raw policy filename (<App>_raw_<timestamp>.txt)"""
+    return Path(path).stem.split('_raw_')[0]
+
+
+async def analyze_policy(client: AsyncOpenAI, path: str, sem: asyncio.Semaphore):
+    """
+    Analyze one scraped policy file and save its JSON result
+
+    Args:
+        client: Shared async OpenAI client
+        path: Path to a raw policy text file (<App>_raw_<timestamp>.txt)
+        sem: Semaphore bounding the number of in-flight requests
+
+    Returns:
+        Path to the saved result, or None if the analysis failed
+    """
+    app_name = app_name_for(path)
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            policy_text = f.read()
+
+        print(f"🔍 Analyzing {app_name} ({len(policy_text):,} characters)...")
+
+        async with sem:
+            response = await request_analysis(client, policy_text)
+
+        # Save result as soon as this policy completes
+        return save_result(app_name, response.choices[0].message.content, len(policy_text))
+
+    except Exception as e:
+        print(f"\n❌ {app_name} error: {e}")
+        traceback.print_exc()
+        return None
+
+
+def build_batch_jsonl(policies: dict, output_path: str = BATCH_INPUT_FILE) -> str:
+    """
+    Write one Batch API request line per policy
+
+    Args:
+        policies: Mapping of custom_id (raw file stem) to policy text
+        output_path: Where to write the JSONL input file
+
+    Returns:
+        Path to the written file
+    """
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        for custom_id, policy_text in policies.items():
+            f.write(json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": build_request_body(policy_text)
+            }) + "\n")
+    return output_path
+
+
+def submit_batch(paths: list):
+    """Submit all policies as one Batch API job, wait for it, and save the results"""
+    client = get_client()
+
+    policies = {}
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            policies[Path(path).stem] = f.read()
+
+    input_path = build_batch_jsonl(policies)
+    with open(input_path, 'rb') as f:
+        batch_file = client.files.create(file=f, purpose="batch")
+
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+    print(f"📦 Submitted batch {batch.id} with {len(policies)} policies")
+
+    while batch.status not in ('completed', 'failed', 'expired', 'cancelled'):
+        time.sleep(BATCH_POLL_SECONDS)
+        batch = client.batches.retrieve(batch.id)
+        print(f"   ⏳ {batch.status} ({batch.request_counts.completed}/{batch.request_counts.total})")
+
+    if batch.status != 'completed' or not batch.output_file_id:
+        print(f"\n❌ Batch {batch.id} ended with status: {batch.status}")
+        return
+
+    saved = 0
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        if not line.strip():
+            continue
+        item = json.loads(line)
+        custom_id = item['custom_id']
+        app_name = app_name_for(custom_id)
+        try:
+            if item.get('error'):
+                raise ValueError(item['error'])
+            content = item['response']['body']['choices'][0]['message']['content']
+            save_result(app_name, content, len(policies[custom_id]))
+            saved += 1
+        except Exception as e:
+            print(f"\n❌ {app_name} error: {e}")
+
+    print(f"\n🏁 Completed {saved}/{len(policies)} analyses")
+
+
+async def analyze_all(paths: list):
+    """Analyze all scraped policies concurrently"""
+    client = get_async_client()
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    print(f"💭 Calling OpenAI GPT-4 for {len(paths)} policies (max {MAX_CONCURRENCY} in flight)...")
+    saved = await asyncio.gather(*[analyze_policy(client, p, sem) for p in paths])
+
+    print(f"\n🏁 Completed {sum(1 for s in saved if s)}/{len(paths)} analyses")
+
+
+def main():
+    """Run the concurrent (default) or Batch API analysis over all raw policies"""
+    parser = argparse.ArgumentParser(description='Standalone OpenAI privacy policy analysis')
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='Submit policies through the OpenAI Batch API (cheaper, not real-time)'
+    )
+    args = parser.parse_args()
+
+    paths = sorted(glob(RAW_POLICY_GLOB))
+    if not paths:
+        print(f"❌ No scraped policies found matching {RAW_POLICY_GLOB}")
+        return
+
+    if args.batch:
+        submit_batch(paths)
+    else:
+        asyncio.run(analyze_all(paths))
+
+
+if __name__ == '__main__':
+    main()
@@ -2,20 +2,20 @@
 Check PrivacyPolicyAnalyzer __init__ parameters
 """
 
-# Read main.py and find the __init__ method
+from itertools import islice
+
+# Stream main.py and stop reading as soon as the __init__ listing is printed
+saw_class = False
 with open('main.py', 'r') as f:
-    lines = f.readlines()
+    for i, line in enumerate(f, 1):
+        if 'class PrivacyPolicyAnalyzer:' in line:
+            saw_class = True
+            print(f"Found class at line {i}")
 
-# Find PrivacyPolicyAnalyzer class __init__
-in_class = False
-for i, line in enumerate(lines, 1):
-    if 'class PrivacyPolicyAnalyzer:' in line:
-        in_class = True
-        print(f"Found class at line {i}")
-    
-    if in_class and 'def __init__' in line:
-        print(f"\nFound __init__ at line {i}:")
-        # Print next 20 lines
-        for j in range(i-1, min(i+19, len(lines))):
-            print(f"{j+1:4d} | {lines[j]}", end='')
-        break
\ No newline at end of file
+        if saw_class and 'def __init__' in line:
+            print(f"\nFound __init__ at line {i}:")
+            # Print this line and the next 19
+            print(f"{i:4d} | {line}", end='')
+            for j, following in enumerate(islice(f, 19), i + 1):
+                print(f"{j:4d} | {following}", end='')
+            break
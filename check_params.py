@@ -1,9 +1,25 @@
-import inspect
-from src.modules.analyzer import PolicyAnalyzer
+import ast
+
+# Parse the source instead of importing it, so the openai/anthropic/tiktoken
+# import chain never runs for this diagnostic
+with open('src/modules/analyzer.py', 'r', encoding='utf-8') as f:
+    tree = ast.parse(f.read())
+
+cls = next(n for n in ast.walk(tree) if isinstance(n, ast.ClassDef) and n.name == 'PolicyAnalyzer')
+init = next(n for n in cls.body if isinstance(n, ast.FunctionDef) and n.name == '__init__')
+
+# Defaults line up with the last len(defaults) positional parameters
+args = init.args.args
+defaults = [None] * (len(args) - len(init.args.defaults)) + init.args.defaults
 
-# Get the __init__ signature
-sig = inspect.signature(PolicyAnalyzer.__init__)
 print("PolicyAnalyzer.__init__ parameters:")
-for param_name, param in sig.parameters.items():
-    if param_name != 'self':
-        print(f"  - {param_name}: {param.default if param.default != inspect.Parameter.empty else 'required'}")
\ No newline at end of file
+for arg, default in zip(args, defaults):
+    if arg.arg != 'self':
+        if default is None:
+            value = 'required'
+        else:
+            try:
+                value = ast.literal_eval(default)
+            except ValueError:
+                value = ast.unparse(default)
+        print(f"  - {arg.arg}: {value}")
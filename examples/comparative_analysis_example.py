@@ -5,41 +5,33 @@ This script demonstrates how to use the comparative analysis features
 to analyze multiple healthcare privacy policies and generate insights.
 """
 
-import json
-from pathlib import Path
 import sys
+import orjson
+from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.modules.comparative_analyzer import (
     load_analyses_from_directory,
+    load_summary_table,
     ComparativeAnalyzer
 )
 
 
-def example_basic_comparison():
+def example_basic_comparison(analyzer, stats):
     """Basic comparative analysis example"""
     print("="*70)
     print("EXAMPLE 1: Basic Comparative Analysis")
     print("="*70)
 
-    # Load all analyses from reports directory
-    analyses = load_analyses_from_directory('outputs/reports/')
-
-    if len(analyses) < 2:
+    if analyzer.num_apps < 2:
         print("Need at least 2 analyses for comparison")
         print("Run some analyses first:")
         print("  python main.py --url <URL1> --name 'App1'")
         print("  python main.py --url <URL2> --name 'App2'")
         return
 
-    # Create comparative analyzer
-    analyzer = ComparativeAnalyzer(analyses)
-
-    # Get basic statistics
-    stats = analyzer.calculate_statistics()
-
     print(f"\nAnalyzing {stats['summary']['total_apps']} apps")
     print(f"\nOverall Risk Statistics:")
     print(f"  Mean: {stats['overall_risk']['mean']:.2f}")
@@ -55,19 +47,12 @@ def example_basic_comparison():
     print(f"  Retention specified: {retention['count']}/{analyzer.num_apps} ({retention['percentage']:.1f}%)")
 
 
-def example_red_flag_analysis():
+def example_red_flag_analysis(analyzer, stats):
     """Analyze red flag patterns"""
     print("\n" + "="*70)
     print("EXAMPLE 2: Red Flag Pattern Analysis")
     print("="*70)
 
-    analyses = load_analyses_from_directory('outputs/reports/')
-    if not analyses:
-        return
-
-    analyzer = ComparativeAnalyzer(analyses)
-    stats = analyzer.calculate_statistics()
-
     print(f"\nRed Flag Analysis:")
     print(f"  Total flags: {stats['red_flag_stats']['total_flags']}")
     print(f"  Unique flags: {stats['red_flag_stats']['unique_flags']}")
@@ -82,19 +67,12 @@ def example_red_flag_analysis():
         print(f"  {severity.upper()}: {count}")
 
 
-def example_rankings():
+def example_rankings(analyzer, stats):
     """Show app rankings"""
     print("\n" + "="*70)
     print("EXAMPLE 3: App Rankings")
     print("="*70)
 
-    analyses = load_analyses_from_directory('outputs/reports/')
-    if not analyses:
-        return
-
-    analyzer = ComparativeAnalyzer(analyses)
-    stats = analyzer.calculate_statistics()
-
     print(f"\nOverall Risk Ranking (Higher is Better):")
     for rank in stats['rankings']['overall_risk'][:10]:
         print(f"  {rank['rank']}. {rank['app_name']}: {rank['value']:.2f} "
@@ -106,17 +84,12 @@ def example_rankings():
         print(f"  {rank['rank']}. {rank['app_name']}: {rank['value']:.2f}")
 
 
-def example_best_practices():
+def example_best_practices(analyzer, stats):
     """Identify best practices"""
     print("\n" + "="*70)
     print("EXAMPLE 4: Best Practice Identification")
     print("="*70)
 
-    analyses = load_analyses_from_directory('outputs/reports/')
-    if not analyses:
-        return
-
-    analyzer = ComparativeAnalyzer(analyses)
     best = analyzer.identify_best_practices()
 
     print(f"\nTop Performers in Data Retention:")
@@ -126,17 +99,12 @@ def example_best_practices():
             print(f"    ✓ {aspect}")
 
 
-def example_research_quotes():
+def example_research_quotes(analyzer, stats):
     """Extract research quotes"""
     print("\n" + "="*70)
     print("EXAMPLE 5: Research Quote Extraction")
     print("="*70)
 
-    analyses = load_analyses_from_directory('outputs/reports/')
-    if not analyses:
-        return
-
-    analyzer = ComparativeAnalyzer(analyses)
     quotes = analyzer.extract_research_quotes()
 
     for category, findings in list(quotes.items())[:2]:
@@ -149,20 +117,16 @@ def example_research_quotes():
             print(f"  Significance: {finding['significance']}")
 
 
-def example_clustering():
+def example_clustering(analyzer, stats):
     """Show clustering results"""
     print("\n" + "="*70)
     print("EXAMPLE 6: App Clustering")
     print("="*70)
 
-    analyses = load_analyses_from_directory('outputs/reports/')
-    if len(analyses) < 3:
+    if analyzer.num_apps < 3:
         print("Need at least 3 apps for clustering")
         return
 
-    analyzer = ComparativeAnalyzer(analyses)
-    stats = analyzer.calculate_statistics()
-
     clusters = stats.get('clusters', {}).get('clusters', [])
     if not clusters:
         return
@@ -176,25 +140,21 @@ def example_clustering():
             print(f"    - {app['app_name']} ({app['overall_score']:.2f})")
 
 
-def example_full_report():
+def example_full_report(analyzer, stats):
     """Generate and save full comparative report"""
     print("\n" + "="*70)
     print("EXAMPLE 7: Generate Full Comparative Report")
     print("="*70)
 
-    analyses = load_analyses_from_directory('outputs/reports/')
-    if not analyses:
-        return
-
-    analyzer = ComparativeAnalyzer(analyses)
     report = analyzer.generate_comparative_report()
 
     # Save to file
     output_path = 'examples/comparative_report_example.json'
     Path('examples').mkdir(exist_ok=True)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(report, f, indent=2)
+    # OPT_SERIALIZE_NUMPY covers the NumPy scalars in the statistics
+    with open(output_path, 'wb') as f:
+        f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
 
     print(f"\nFull comparative report saved to: {output_path}")
     print(f"\nReport contains:")
@@ -205,20 +165,16 @@ def example_full_report():
     print(f"  - Research quotes organized by theme")
 
 
-def example_correlations():
+def example_correlations(analyzer, stats):
     """Show correlation analysis"""
     print("\n" + "="*70)
     print("EXAMPLE 8: Correlation Analysis")
     print("="*70)
 
-    analyses = load_analyses_from_directory('outputs/reports/')
-    if len(analyses) < 3:
+    if analyzer.num_apps < 3:
         print("Need at least 3 apps for correlation analysis")
         return
 
-    analyzer = ComparativeAnalyzer(analyses)
-    stats = analyzer.calculate_statistics()
-
     correlations = stats.get('correlations', {})
 
     if 'hipaa_vs_security' in correlations:
@@ -236,6 +192,23 @@ def example_correlations():
         print(f"  Significant: {'Yes' if corr['significant'] else 'No'}")
 
 
+def example_summary_table(directory):
+    """Quick overview from the Parquet summary table"""
+    print("\n" + "="*70)
+    print("EXAMPLE 9: Summary Table")
+    print("="*70)
+
+    # One typed row per app; reuses summary.parquet while it is newer
+    # than every JSON report, so no report is parsed
+    table = load_summary_table(directory)
+
+    print(f"\n{len(table)} apps, {int(table['hipaa_mentioned'].sum())} mention HIPAA")
+    print("\nHighest overall risk:")
+    top = table.nlargest(5, 'overall_score')
+    for row in top.itertuples():
+        print(f"  {row.app_name}: {row.overall_score:.2f} ({row.red_flag_count} red flags)")
+
+
 def main():
     """Run all examples"""
     print("\n" + "="*70)
@@ -243,7 +216,7 @@ def main():
     print("Privacy Policy Analyzer for Healthcare Apps")
     print("="*70)
 
-    # Check if we have any analyses
+    # Load the reports once and share them across every example
     analyses = load_analyses_from_directory('outputs/reports/')
 
     if not analyses:
@@ -256,15 +229,20 @@ def main():
         print("  python examples/comparative_analysis_example.py")
         return
 
+    # Compute the statistics once; every example reads from the same results
+    analyzer = ComparativeAnalyzer(analyses)
+    stats = analyzer.calculate_statistics()
+
     # Run examples
-    example_basic_comparison()
-    example_red_flag_analysis()
-    example_rankings()
-    example_best_practices()
-    example_research_quotes()
-    example_clustering()
-    example_correlations()
-    example_full_report()
+    example_basic_comparison(analyzer, stats)
+    example_red_flag_analysis(analyzer, stats)
+    example_rankings(analyzer, stats)
+    example_best_practices(analyzer, stats)
+    example_research_quotes(analyzer, stats)
+    example_clustering(analyzer, stats)
+    example_correlations(analyzer, stats)
+    example_full_report(analyzer, stats)
+    example_summary_table('outputs/reports/')
 
     print("\n" + "="*70)
     print("Examples completed!")
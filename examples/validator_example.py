@@ -13,14 +13,42 @@ Examples:
 6. Integrate with research workflow
 """
 
-import json
+import os
 import sys
+import orjson
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.utils.validator import AnalysisValidator, load_and_validate_directory
+# The validator is imported inside each example, after its input checks,
+# so examples that skip or only print text do not load it
+
+
+REPORTS_DIR = "outputs/reports/"
+
+
+def load_json(path: str):
+    """Parse one JSON report, returning None if it cannot be loaded"""
+    try:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    except Exception as e:
+        print(f"Error loading {path}: {e}")
+        return None
+
+
+def load_reports(reports_dir: str = REPORTS_DIR) -> list:
+    """Load every JSON report in a directory, reading files concurrently"""
+    if not Path(reports_dir).exists():
+        print(f"Directory not found: {reports_dir}")
+        return []
+
+    paths = [e.path for e in os.scandir(reports_dir)
+             if e.is_file() and e.name.endswith('.json')]
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        return [a for a in executor.map(load_json, paths) if a is not None]
 
 
 def example_1_validate_single_analysis():
@@ -37,8 +65,9 @@ def example_1_validate_single_analysis():
         print("Skipping example 1...")
         return
 
-    with open(analysis_path, 'r', encoding='utf-8') as f:
-        analysis = json.load(f)
+    from src.utils.validator import AnalysisValidator
+
+    analysis = orjson.loads(Path(analysis_path).read_bytes())
 
     # Create validator
     validator = AnalysisValidator(strict_mode=False)
@@ -66,22 +95,22 @@ def example_1_validate_single_analysis():
             print(f"  - {info}")
 
 
-def example_2_validate_directory():
+def example_2_validate_directory(analyses):
     """Example 2: Validate all analyses in a directory"""
     print("\n" + "=" * 80)
     print("Example 2: Validate Directory of Analyses")
     print("=" * 80)
 
-    reports_dir = "outputs/reports/"
-
-    if not Path(reports_dir).exists():
-        print(f"Directory not found: {reports_dir}")
+    if not analyses:
+        print(f"No analyses found in {REPORTS_DIR}")
         print("Skipping example 2...")
         return
 
+    from src.utils.validator import load_and_validate_directory
+
     # Validate all analyses in directory
     results = load_and_validate_directory(
-        directory=reports_dir,
+        analyses=analyses,
         strict_mode=False,
         output_report="outputs/validation_report.txt"
     )
@@ -99,30 +128,19 @@ def example_2_validate_directory():
     print(f"\nDetailed report saved to: outputs/validation_report.txt")
 
 
-def example_3_detect_anomalies():
+def example_3_detect_anomalies(analyses):
     """Example 3: Detect statistical anomalies"""
     print("\n" + "=" * 80)
     print("Example 3: Detect Anomalies")
     print("=" * 80)
 
-    reports_dir = "outputs/reports/"
-
-    if not Path(reports_dir).exists():
-        print(f"Directory not found: {reports_dir}")
-        print("Skipping example 3...")
-        return
-
-    # Load analyses
-    analyses = []
-    for json_file in Path(reports_dir).glob("*.json"):
-        with open(json_file, 'r', encoding='utf-8') as f:
-            analyses.append(json.load(f))
-
     if len(analyses) < 3:
         print("Need at least 3 analyses for anomaly detection")
         print("Skipping example 3...")
         return
 
+    from src.utils.validator import AnalysisValidator
+
     # Validate with anomaly detection
     validator = AnalysisValidator()
     results = validator.validate_batch(analyses, detect_anomalies=True)
@@ -171,30 +189,19 @@ def example_3_detect_anomalies():
             print("\n  ✓ No anomalies detected - all values within normal range")
 
 
-def example_4_generate_report():
+def example_4_generate_report(analyses):
     """Example 4: Generate detailed validation report"""
     print("\n" + "=" * 80)
     print("Example 4: Generate Validation Report")
     print("=" * 80)
 
-    reports_dir = "outputs/reports/"
-
-    if not Path(reports_dir).exists():
-        print(f"Directory not found: {reports_dir}")
-        print("Skipping example 4...")
-        return
-
-    # Load analyses
-    analyses = []
-    for json_file in Path(reports_dir).glob("*.json"):
-        with open(json_file, 'r', encoding='utf-8') as f:
-            analyses.append(json.load(f))
-
     if not analyses:
-        print("No analyses found")
+        print(f"No analyses found in {REPORTS_DIR}")
         print("Skipping example 4...")
         return
 
+    from src.utils.validator import AnalysisValidator
+
     # Validate
     validator = AnalysisValidator()
     results = validator.validate_batch(analyses, detect_anomalies=True)
@@ -212,27 +219,27 @@ def example_4_generate_report():
     print("-" * 80)
 
 
-def example_5_strict_mode():
+def example_5_strict_mode(analyses):
     """Example 5: Use strict validation mode"""
     print("\n" + "=" * 80)
     print("Example 5: Strict Validation Mode")
     print("=" * 80)
 
-    reports_dir = "outputs/reports/"
-
-    if not Path(reports_dir).exists():
-        print(f"Directory not found: {reports_dir}")
+    if not analyses:
+        print(f"No analyses found in {REPORTS_DIR}")
         print("Skipping example 5...")
         return
 
+    from src.utils.validator import load_and_validate_directory
+
     # Validate with strict mode (warnings treated as errors)
     results_normal = load_and_validate_directory(
-        directory=reports_dir,
+        analyses=analyses,
         strict_mode=False
     )
 
     results_strict = load_and_validate_directory(
-        directory=reports_dir,
+        analyses=analyses,
         strict_mode=True
     )
 
@@ -335,6 +342,8 @@ def example_7_custom_validation():
         }
     }
 
+    from src.utils.validator import AnalysisValidator
+
     # Validate
     validator = AnalysisValidator(strict_mode=False)
     result = validator.validate_single_analysis(sample_analysis)
@@ -359,19 +368,22 @@ def main():
     print("PRIVACY POLICY ANALYZER - QUALITY VALIDATION EXAMPLES")
     print("=" * 80)
 
+    # Parse the reports once; examples 2-5 share the same list
+    analyses = load_reports()
+
     examples = [
-        ("Validate Single Analysis", example_1_validate_single_analysis),
-        ("Validate Directory", example_2_validate_directory),
-        ("Detect Anomalies", example_3_detect_anomalies),
-        ("Generate Report", example_4_generate_report),
-        ("Strict Mode", example_5_strict_mode),
-        ("Workflow Integration", example_6_workflow_integration),
-        ("Custom Validation", example_7_custom_validation)
+        ("Validate Single Analysis", example_1_validate_single_analysis, ()),
+        ("Validate Directory", example_2_validate_directory, (analyses,)),
+        ("Detect Anomalies", example_3_detect_anomalies, (analyses,)),
+        ("Generate Report", example_4_generate_report, (analyses,)),
+        ("Strict Mode", example_5_strict_mode, (analyses,)),
+        ("Workflow Integration", example_6_workflow_integration, ()),
+        ("Custom Validation", example_7_custom_validation, ())
     ]
 
-    for i, (name, func) in enumerate(examples, 1):
+    for i, (name, func, args) in enumerate(examples, 1):
         try:
-            func()
+            func(*args)
         except Exception as e:
             print(f"\n❌ Example {i} failed: {e}")
             import traceback
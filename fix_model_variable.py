@@ -2,31 +2,40 @@
 Fix the model variable name mismatch
 """
 
-print("🔧 Fixing model variable name in main.py...\n")
+import re
 
-# Read main.py
-with open('main.py', 'r', encoding='utf-8') as f:
-    content = f.read()
-    lines = content.split('\n')
+# Match parameters like: def __init__(self, param1='default', param2='default'):
+_INIT_RE = re.compile(r'def __init__\(self,\s*(.+?)\):')
+
+# Keywords that identify the model, depth and cache parameters
+_PARAM_KEY_RE = re.compile(r'model|depth|cache')
+
+print("🔧 Fixing model variable name in main.py...\n")
 
-# Find the PrivacyPolicyAnalyzer __init__ signature
+# Find the PrivacyPolicyAnalyzer __init__ signature, streaming main.py and
+# stopping once it is found (or 30 lines past the class without a match)
 init_line = None
-for i, line in enumerate(lines):
-    if 'class PrivacyPolicyAnalyzer:' in line:
-        # Found class, now find __init__
-        for j in range(i+1, min(i+30, len(lines))):
-            if 'def __init__' in lines[j]:
-                init_line = lines[j]
-                print(f"Found __init__ at line {j+1}:")
-                print(f"  {init_line}")
-                break
-        break
+class_line = None
+with open('main.py', 'r', encoding='utf-8') as f:
+    for i, line in enumerate(f):
+        if class_line is None:
+            if 'class PrivacyPolicyAnalyzer:' in line:
+                class_line = i
+        elif i >= class_line + 30:
+            break
+        elif 'def __init__' in line:
+            init_line = line.rstrip('\n')
+            print(f"Found __init__ at line {i+1}:")
+            print(f"  {init_line}")
+            break
 
 if init_line:
+    # Only load the whole file once there is something to edit
+    with open('main.py', 'r', encoding='utf-8') as f:
+        content = f.read()
+
     # Extract parameter names
-    import re
-    # Match parameters like: def __init__(self, param1='default', param2='default'):
-    params_match = re.search(r'def __init__\(self,\s*(.+?)\):', init_line)
+    params_match = _INIT_RE.search(init_line)
     if params_match:
         params_str = params_match.group(1)
         print(f"\nParameters: {params_str}")
@@ -35,38 +44,35 @@ if init_line:
         params = [p.strip().split('=')[0] for p in params_str.split(',')]
         print(f"\nParameter names: {params}")
         
-        # Find what to use for model
-        model_param = None
-        depth_param = None
-        cache_param = None
-        
+        # Find what to use for model/depth/cache (the last matching
+        # parameter wins for each keyword)
+        found = {}
         for param in params:
-            if 'model' in param.lower():
-                model_param = param
-            if 'depth' in param.lower():
-                depth_param = param
-            if 'cache' in param.lower():
-                cache_param = param
+            for key in _PARAM_KEY_RE.findall(param.lower()):
+                found[key] = param
+
+        model_param = found.get('model')
+        depth_param = found.get('depth')
+        cache_param = found.get('cache')
         
         print(f"\nDetected parameter names:")
         print(f"  Model: {model_param}")
         print(f"  Depth: {depth_param}")
         print(f"  Cache: {cache_param}")
         
-        # Now fix the PolicyAnalyzer initialization
-        # Find the line with model_override=model
-        content = content.replace(
-            'model_override=model,',
-            f'model_override={model_param},' if model_param else 'model_override=None,'
-        )
-        content = content.replace(
-            'analysis_depth=depth,',
-            f'analysis_depth={depth_param},' if depth_param else 'analysis_depth="standard",'
-        )
-        content = content.replace(
-            'use_cache=cache',
-            f'use_cache={cache_param}' if cache_param else 'use_cache=True'
-        )
+        # Now fix the PolicyAnalyzer initialization: rewrite all three
+        # keyword arguments in a single scan of the source
+        replacements = {
+            'model_override=model,': f'model_override={model_param},' if model_param else 'model_override=None,',
+            'analysis_depth=depth,': f'analysis_depth={depth_param},' if depth_param else 'analysis_depth="standard",',
+            'use_cache=cache': f'use_cache={cache_param}' if cache_param else 'use_cache=True'
+        }
+        # Longest keys first, so a key that is a prefix of another never
+        # shadows it as more parameters are added
+        pattern = re.compile('|'.join(
+            re.escape(k) for k in sorted(replacements, key=len, reverse=True)
+        ))
+        content = pattern.sub(lambda m: replacements[m.group(0)], content)
         
         # Write fixed version
         with open('main.py', 'w', encoding='utf-8') as f:
@@ -2,8 +2,24 @@
 Complete inspection of PolicyAnalyzer class
 """
 
-import inspect
-from src.modules.analyzer import PolicyAnalyzer
+import ast
+from pathlib import Path
+
+ANALYZER_FILE = Path('src/modules/analyzer.py')
+
+# Parse the source rather than importing it, so the openai/anthropic/
+# tiktoken import chain never runs
+source = ANALYZER_FILE.read_text(encoding='utf-8')
+lines = source.splitlines()
+cls = next(
+    n for n in ast.walk(ast.parse(source))
+    if isinstance(n, ast.ClassDef) and n.name == 'PolicyAnalyzer'
+)
+methods = {
+    n.name: n for n in cls.body
+    if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))
+}
+init = methods['__init__']
 
 print("="*70)
 print("PolicyAnalyzer Class Inspection")
@@ -12,34 +28,39 @@ print("="*70)
 # Get __init__ signature
 print("\n1️⃣ __init__ method signature:")
 print("-"*70)
-sig = inspect.signature(PolicyAnalyzer.__init__)
-for param_name, param in sig.parameters.items():
-    if param_name != 'self':
-        default = param.default if param.default != inspect.Parameter.empty else 'REQUIRED'
-        annotation = param.annotation if param.annotation != inspect.Parameter.empty else 'Any'
-        print(f"   {param_name}")
+args = init.args.args
+defaults = [None] * (len(args) - len(init.args.defaults)) + init.args.defaults
+for arg, default in zip(args, defaults):
+    if arg.arg != 'self':
+        annotation = ast.unparse(arg.annotation) if arg.annotation else 'Any'
+        print(f"   {arg.arg}")
         print(f"      Type: {annotation}")
-        print(f"      Default: {default}")
+        if default is None:
+            value = 'REQUIRED'
+        else:
+            try:
+                value = ast.literal_eval(default)
+            except ValueError:
+                value = ast.unparse(default)
+        print(f"      Default: {value}")
         print()
 
 # Get the actual __init__ source code
 print("\n2️⃣ __init__ source code:")
 print("-"*70)
-try:
-    source = inspect.getsource(PolicyAnalyzer.__init__)
-    # Print first 50 lines
-    lines = source.split('\n')[:50]
-    for i, line in enumerate(lines, 1):
-        print(f"{i:3d} | {line}")
-except Exception as e:
-    print(f"Could not get source: {e}")
+# Print first 50 lines
+start = init.decorator_list[0].lineno if init.decorator_list else init.lineno
+for i, line in enumerate(lines[start - 1:init.end_lineno][:50], 1):
+    print(f"{i:3d} | {line}")
 
 # List all methods
 print("\n3️⃣ Available methods:")
 print("-"*70)
-for name, method in inspect.getmembers(PolicyAnalyzer, predicate=inspect.ismethod):
-    if not name.startswith('_'):
-        sig = inspect.signature(method)
-        print(f"   {name}{sig}")
+for name, node in methods.items():
+    # Properties (and their setters) are attributes, not methods
+    decorators = [ast.unparse(d) for d in node.decorator_list]
+    is_property = any(d == 'property' or d.endswith('.setter') for d in decorators)
+    if not name.startswith('_') and not is_property:
+        print(f"   {name}({ast.unparse(node.args)})")
 
-print("\n" + "="*70)
\ No newline at end of file
+print("\n" + "="*70)
@@ -4,28 +4,73 @@ Main entry point with advanced CLI interface
 """
 
 import os
+import re
 import sys
+import time
+import orjson
+import hashlib
 import argparse
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from dotenv import load_dotenv
 from colorama import init, Fore, Style
-from tqdm import tqdm
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.modules.scraper import PolicyScraper
-from src.modules.analyzer import PolicyAnalyzer
-from src.modules.scorer import RiskScorer
-from src.modules.reporter import ReportGenerator
-from src.utils.logger import setup_logger, get_logger
-from src.utils.file_handler import FileHandler
+# The src modules (and their scraping/LLM SDK dependencies) are imported
+# in PrivacyPolicyAnalyzer.__init__, so --help and argument errors exit
+# without loading them
 
-# Initialize colorama for colored terminal output
-init(autoreset=True)
+# OpenAI keys start with "sk-", Anthropic keys with "sk-ant-"
+_KEY_RE = re.compile(r'sk-(ant-)?')
 
-# Load environment variables
-load_dotenv()
+# Terminal colors for risk levels and red flag severities
+_RISK_COLOR = {
+    'LOW': Fore.GREEN,
+    'MEDIUM': Fore.YELLOW,
+    'HIGH': Fore.MAGENTA,
+    'CRITICAL': Fore.RED
+}
+_SEV_COLOR = {'high': Fore.RED, 'medium': Fore.YELLOW}
+
+# Category score colors: <= 50 red, <= 70 yellow, above 70 green
+_SCORE_THRESHOLDS = (50, 70)
+_SCORE_COLORS = (Fore.RED, Fore.YELLOW, Fore.GREEN)
+
+# Section separators
+_BAR = '=' * 70
+_SUB_BAR = '-' * 50
+
+# Characters that are not safe in file names on every platform
+_FILENAME_SAFE = str.maketrans({c: '_' for c in '\\/:*?"<>| '})
+
+
+def _bootstrap():
+    """Load environment variables and set up terminal output and plotting"""
+    import matplotlib
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    init(autoreset=True)
+
+    # Charts are only saved to files, and --analyze-all draws them from
+    # worker threads, so the CLI never needs a GUI backend
+    matplotlib.use('Agg')
+
+
+def _write_block(lines):
+    """
+    Write a block of output lines to stdout in a single call
+
+    autoreset only resets colors at the end of each write, so every line
+    gets its own Style.RESET_ALL to keep one line's color from bleeding
+    into the next, just as with one print() per line.
+
+    Args:
+        lines: Lines to write, without trailing newlines
+    """
+    sys.stdout.write(''.join(f"{line}{Style.RESET_ALL}\n" for line in lines))
 
 
 def validate_api_keys():
@@ -33,13 +78,14 @@ def validate_api_keys():
     openai_key = os.getenv('OPENAI_API_KEY')
     anthropic_key = os.getenv('ANTHROPIC_API_KEY')
 
-    has_openai = openai_key and openai_key.startswith('sk-')
-    has_anthropic = anthropic_key and anthropic_key.startswith('sk-ant-')
+    has_openai = bool(openai_key and _KEY_RE.match(openai_key))
+    anthropic_match = _KEY_RE.match(anthropic_key) if anthropic_key else None
+    has_anthropic = bool(anthropic_match and anthropic_match.group(1))
 
     if not has_openai and not has_anthropic:
-        print(f"\n{Fore.RED}{'=' * 70}")
+        print(f"\n{Fore.RED}{_BAR}")
         print(f"{Fore.RED}ERROR: No valid API keys found!")
-        print(f"{Fore.RED}{'=' * 70}\n")
+        print(f"{Fore.RED}{_BAR}\n")
         print(f"{Fore.YELLOW}You need to configure at least one LLM provider:")
         print(f"\n{Fore.CYAN}Option 1: OpenAI")
         print(f"  1. Get API key from: https://platform.openai.com/api-keys")
@@ -76,9 +122,25 @@ class PrivacyPolicyAnalyzer:
             analysis_depth: Analysis depth (quick/standard/deep)
             use_cache: Whether to use response caching
         """
+        from src.modules.scraper import PolicyScraper
+        from src.modules.analyzer import PolicyAnalyzer
+        from src.modules.scorer import RiskScorer
+        from src.modules.reporter import ReportGenerator
+        from src.utils.logger import setup_logger
+        from src.utils.file_handler import FileHandler
+
         self.file_handler = FileHandler()
         self.config = self.file_handler.load_yaml(config_path)
 
+        # Per-policy output settings, resolved once
+        self._output_cfg = self.config.get('output', {})
+        self._paths_cfg = self.config.get('paths', {})
+        self._report_formats = tuple(self._output_cfg.get('report_format', ['html', 'json']))
+        self._save_raw = self._output_cfg.get('save_raw_data', True)
+        self._include_vis = self._output_cfg.get('include_visualizations', True)
+        self._cost_enabled = self.config.get('cost_estimation', {}).get('enabled', True)
+        self._raw_dir = Path(self._paths_cfg.get('raw_data', 'data/raw'))
+
         # Setup logging
         log_config = self.config.get('logging', {})
         self.logger = setup_logger(
@@ -108,21 +170,46 @@ class PrivacyPolicyAnalyzer:
     def show_cost_estimate(self, policy_text: str):
         """Display cost estimate before analysis"""
         print(f"\n{Fore.CYAN}Cost Estimation:")
-        print(f"{Fore.CYAN}{'-' * 50}")
+        print(f"{Fore.CYAN}{_SUB_BAR}")
 
         cost_info = self.analyzer.estimate_cost(policy_text)
 
         if 'error' not in cost_info:
             print(f"  Model: {cost_info['model']}")
-            print(f"  Input tokens: {cost_info['input_tokens']:,}")
+            approx = '' if cost_info['precise'] else '~'
+            print(f"  Input tokens: {approx}{cost_info['input_tokens']:,}")
             print(f"  Estimated output tokens: {cost_info['estimated_output_tokens']:,}")
-            print(f"  Total tokens: {cost_info['total_tokens']:,}")
+            print(f"  Total tokens: {approx}{cost_info['total_tokens']:,}")
             print(f"  {Fore.YELLOW}Estimated cost: ${cost_info['estimated_cost_usd']:.4f} USD")
         else:
             print(f"  {Fore.YELLOW}Cost estimation unavailable")
 
         print()
 
+    def _report_cache_path(self, app_name: str, url: str) -> Path:
+        """Path of the cached result for app_name and url at the current depth and model"""
+        key_src = f"{app_name}|{url}|{self.analyzer.analysis_depth}|{self.analyzer.primary_model}"
+        key = hashlib.blake2b(key_src.encode(), digest_size=16).hexdigest()
+        return self.analyzer.report_cache_dir / f"{key}.json"
+
+    def _load_cached_report(self, report_cache_path: Path):
+        """Load a cached result, or None if it is missing or older than the cache TTL"""
+        try:
+            age = time.time() - report_cache_path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+        ttl = self.analyzer.cache_ttl_seconds
+        if ttl and age > ttl:
+            self.logger.info(f"Cached result expired: {report_cache_path}")
+            return None
+
+        try:
+            return orjson.loads(report_cache_path.read_bytes())
+        except Exception as e:
+            self.logger.warning(f"Report cache load failed: {str(e)}")
+            return None
+
     def analyze_single_policy(self, app_name: str, url: str,
                              use_selenium: bool = False,
                              show_cost: bool = True,
@@ -140,9 +227,19 @@ class PrivacyPolicyAnalyzer:
         Returns:
             Complete analysis results
         """
-        print(f"\n{Fore.CYAN}{'=' * 70}")
-        print(f"{Fore.CYAN}Analyzing Privacy Policy for: {Fore.YELLOW}{app_name}")
-        print(f"{Fore.CYAN}{'=' * 70}\n")
+        _write_block([
+            f"\n{Fore.CYAN}{_BAR}",
+            f"{Fore.CYAN}Analyzing Privacy Policy for: {Fore.YELLOW}{app_name}",
+            f"{Fore.CYAN}{_BAR}\n"
+        ])
+
+        # A fresh result for this app, URL, depth and model skips scraping too
+        report_cache_path = self._report_cache_path(app_name, url)
+        if self.analyzer.use_cache and not force_reanalyze:
+            cached_result = self._load_cached_report(report_cache_path)
+            if cached_result is not None:
+                print(f"{Fore.GREEN}✓ Using cached result: {Fore.CYAN}{report_cache_path}")
+                return cached_result
 
         # Step 1: Scrape policy
         print(f"{Fore.GREEN}[1/4] Scraping privacy policy...")
@@ -155,17 +252,18 @@ class PrivacyPolicyAnalyzer:
         print(f"{Fore.GREEN}✓ Successfully scraped {scraped_data['length']:,} characters")
 
         # Save raw data
-        if self.config.get('output', {}).get('save_raw_data', True):
-            raw_dir = self.config.get('paths', {}).get('raw_data', 'data/raw')
-            self.file_handler.ensure_dir(raw_dir)
-            raw_filename = self.file_handler.generate_filename(f"{app_name}_raw", "txt")
-            raw_path = f"{raw_dir}/{raw_filename}"
+        if self._save_raw:
+            app_slug = app_name.translate(_FILENAME_SAFE)
+            raw_path = self._raw_dir / self.file_handler.generate_filename(f"{app_slug}_raw", "txt")
             self.file_handler.save_text(scraped_data['text'], raw_path)
             self.logger.info(f"Saved raw data to {raw_path}")
 
-        # Show cost estimate
-        if show_cost and self.config.get('cost_estimation', {}).get('enabled', True):
-            self.show_cost_estimate(scraped_data['text'])
+        # Show cost estimate (nothing is spent when the analysis is cached)
+        if show_cost and self._cost_enabled:
+            if not force_reanalyze and self.analyzer.is_cached(scraped_data['text']):
+                print(f"{Fore.CYAN}Cached analysis found, no API cost")
+            else:
+                self.show_cost_estimate(scraped_data['text'])
 
         # Step 2: Analyze with LLM
         print(f"{Fore.GREEN}[2/4] Analyzing policy with LLM...")
@@ -177,25 +275,27 @@ class PrivacyPolicyAnalyzer:
         if force_reanalyze:
             print(f"{Fore.YELLOW}   Force re-analyze: bypassing cache")
 
-        with tqdm(total=100, desc="   Analysis progress", bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt}') as pbar:
-            analysis = self.analyzer.analyze_policy(scraped_data['text'], force_reanalyze=force_reanalyze)
-            pbar.update(100)
+        analysis = self.analyzer.analyze_policy(scraped_data['text'], force_reanalyze=force_reanalyze)
 
         if 'error' in analysis:
             print(f"{Fore.RED}✗ Analysis failed: {analysis['error']}")
             return None
 
         # Show analysis metadata
-        metadata = analysis.get('metadata', {})
-        if 'analysis_time_seconds' in metadata:
-            print(f"{Fore.GREEN}✓ Analysis complete ({metadata['analysis_time_seconds']}s)")
+        metadata = analysis.get('metadata') or {}
+        time_s = metadata.get('analysis_time_seconds')
+        model_used = metadata.get('model_used')
+        tokens_used = metadata.get('tokens_used')
+
+        if time_s is not None:
+            print(f"{Fore.GREEN}✓ Analysis complete ({time_s}s)")
         else:
             print(f"{Fore.GREEN}✓ Analysis complete")
 
-        if 'model_used' in metadata:
-            print(f"{Fore.CYAN}   Model used: {metadata['model_used']}")
-        if 'tokens_used' in metadata and metadata['tokens_used']:
-            print(f"{Fore.CYAN}   Tokens used: {metadata['tokens_used']:,}")
+        if model_used is not None:
+            print(f"{Fore.CYAN}   Model used: {model_used}")
+        if tokens_used:
+            print(f"{Fore.CYAN}   Tokens used: {tokens_used:,}")
 
         # Step 3: Calculate risk score
         print(f"\n{Fore.GREEN}[3/4] Calculating risk scores...")
@@ -204,12 +304,7 @@ class PrivacyPolicyAnalyzer:
         # Display scores
         overall_score = scoring.get('overall_score', 0)
         risk_level = scoring.get('risk_level', 'UNKNOWN')
-        risk_color = {
-            'LOW': Fore.GREEN,
-            'MEDIUM': Fore.YELLOW,
-            'HIGH': Fore.MAGENTA,
-            'CRITICAL': Fore.RED
-        }.get(risk_level, Fore.WHITE)
+        risk_color = _RISK_COLOR.get(risk_level, Fore.WHITE)
 
         print(f"{Fore.GREEN}✓ Overall Risk Score: {risk_color}{overall_score}/100 ({risk_level})")
 
@@ -222,7 +317,8 @@ class PrivacyPolicyAnalyzer:
             conf_score = analysis['confidence_score']
             print(f"{Fore.GREEN}✓ Confidence Score: {Fore.CYAN}{conf_score}/100")
 
-        red_flags_count = len(scoring.get('red_flags', []))
+        red_flags = scoring.get('red_flags') or []
+        red_flags_count = len(red_flags)
         print(f"{Fore.GREEN}✓ Red Flags Detected: {Fore.RED}{red_flags_count}")
 
         # Step 4: Generate reports
@@ -230,7 +326,7 @@ class PrivacyPolicyAnalyzer:
 
         # Create visualizations
         visualizations = []
-        if self.config.get('output', {}).get('include_visualizations', True):
+        if self._include_vis:
             try:
                 visualizations = self.reporter.create_visualizations(app_name, scoring)
                 print(f"{Fore.GREEN}✓ Created {len(visualizations)} visualizations")
@@ -239,7 +335,7 @@ class PrivacyPolicyAnalyzer:
                 print(f"{Fore.YELLOW}⚠ Visualization creation failed: {str(e)}")
 
         # Generate reports
-        report_formats = self.config.get('output', {}).get('report_format', ['html', 'json'])
+        report_formats = self._report_formats
         generated_reports = []
 
         if 'html' in report_formats:
@@ -253,61 +349,67 @@ class PrivacyPolicyAnalyzer:
             print(f"{Fore.GREEN}✓ JSON report: {Fore.CYAN}{json_path}")
 
         # Print enhanced summary
-        print(f"\n{Fore.CYAN}{'=' * 70}")
-        print(f"{Fore.CYAN}ANALYSIS SUMMARY")
-        print(f"{Fore.CYAN}{'=' * 70}")
-        print(f"\n{analysis.get('summary', 'No summary available')}\n")
+        buf = [
+            f"\n{Fore.CYAN}{_BAR}",
+            f"{Fore.CYAN}ANALYSIS SUMMARY",
+            f"{Fore.CYAN}{_BAR}",
+            f"\n{analysis.get('summary', 'No summary available')}\n"
+        ]
 
         # Show category scores
-        print(f"{Fore.CYAN}Category Scores:")
+        buf.append(f"{Fore.CYAN}Category Scores:")
         for category, score in scoring.get('category_scores', {}).items():
             score_val = score if isinstance(score, (int, float)) else 50
-            score_color = Fore.GREEN if score_val > 70 else Fore.YELLOW if score_val > 50 else Fore.RED
-            print(f"  {category:.<30} {score_color}{score_val}/100")
+            score_color = _SCORE_COLORS[bisect_left(_SCORE_THRESHOLDS, score_val)]
+            buf.append(f"  {category:.<30} {score_color}{score_val}/100")
 
         # Show red flags
-        if scoring.get('red_flags'):
-            print(f"\n{Fore.RED}🚩 Red Flags Detected:")
-            for i, flag in enumerate(scoring['red_flags'][:5], 1):  # Show first 5
+        if red_flags_count:
+            buf.append(f"\n{Fore.RED}🚩 Red Flags Detected:")
+            for i, flag in enumerate(red_flags[:5], 1):  # Show first 5
                 if isinstance(flag, dict):
                     severity = flag.get('severity', 'unknown')
                     desc = flag.get('description', str(flag))
-                    sev_color = Fore.RED if severity == 'high' else Fore.YELLOW if severity == 'medium' else Fore.WHITE
-                    print(f"  {i}. [{sev_color}{severity.upper()}{Fore.RESET}] {desc}")
+                    sev_color = _SEV_COLOR.get(severity, Fore.WHITE)
+                    buf.append(f"  {i}. [{sev_color}{severity.upper()}{Fore.RESET}] {desc}")
                 else:
-                    print(f"  {i}. {flag}")
+                    buf.append(f"  {i}. {flag}")
 
-            if len(scoring['red_flags']) > 5:
-                print(f"  ... and {len(scoring['red_flags']) - 5} more (see full report)")
+            if red_flags_count > 5:
+                buf.append(f"  ... and {red_flags_count - 5} more (see full report)")
 
         # Show positive practices
-        positive_practices = analysis.get('positive_practices', [])
+        positive_practices = analysis.get('positive_practices') or []
         if positive_practices:
-            print(f"\n{Fore.GREEN}✓ Positive Practices:")
+            buf.append(f"\n{Fore.GREEN}✓ Positive Practices:")
             for i, practice in enumerate(positive_practices[:3], 1):
                 if isinstance(practice, dict):
                     desc = practice.get('description', str(practice))
-                    print(f"  {i}. {desc}")
+                    buf.append(f"  {i}. {desc}")
                 else:
-                    print(f"  {i}. {practice}")
+                    buf.append(f"  {i}. {practice}")
 
         # Show quotable findings for research
-        quotable = analysis.get('quotable_findings', [])
+        quotable = analysis.get('quotable_findings') or []
         if quotable:
-            print(f"\n{Fore.MAGENTA}📝 Quotable Research Findings:")
+            buf.append(f"\n{Fore.MAGENTA}📝 Quotable Research Findings:")
             for i, finding in enumerate(quotable[:2], 1):
                 if isinstance(finding, dict):
-                    print(f"  {i}. {finding.get('finding', '')}")
+                    buf.append(f"  {i}. {finding.get('finding', '')}")
                     if 'quote' in finding:
-                        print(f"     \"{finding['quote'][:100]}...\"")
+                        buf.append(f"     \"{finding['quote'][:100]}...\"")
+
+        _write_block(buf)
 
         # Show cache statistics
         cache_stats = self.analyzer.get_cache_stats()
         if cache_stats['total_requests'] > 0:
-            print(f"\n{Fore.CYAN}Cache Statistics:")
-            print(f"  Hit rate: {cache_stats['hit_rate_percent']}% ({cache_stats['cache_hits']}/{cache_stats['total_requests']})")
+            _write_block([
+                f"\n{Fore.CYAN}Cache Statistics:",
+                f"  Hit rate: {cache_stats['hit_rate_percent']}% ({cache_stats['cache_hits']}/{cache_stats['total_requests']})"
+            ])
 
-        return {
+        result = {
             'app_name': app_name,
             'url': url,
             'scraped_data': scraped_data,
@@ -317,6 +419,19 @@ class PrivacyPolicyAnalyzer:
             'visualizations': visualizations
         }
 
+        if self.analyzer.use_cache:
+            try:
+                # Compact orjson output: this file is only read back by the
+                # cache check above
+                report_cache_path.parent.mkdir(parents=True, exist_ok=True)
+                report_cache_path.write_bytes(orjson.dumps(
+                    result, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                ))
+            except Exception as e:
+                self.logger.warning(f"Report cache save failed: {str(e)}")
+
+        return result
+
     def analyze_multiple_policies(self, use_selenium: bool = False,
                                   show_cost: bool = True,
                                   force_reanalyze: bool = False):
@@ -334,24 +449,43 @@ class PrivacyPolicyAnalyzer:
             print(f"{Fore.RED}No targets configured in config.yaml")
             return
 
-        print(f"\n{Fore.CYAN}Analyzing {len(targets)} privacy policies...")
+        max_workers = self.config.get('analysis', {}).get('max_parallel_targets', 4)
+        print(f"\n{Fore.CYAN}Analyzing {len(targets)} privacy policies ({max_workers} in parallel)...")
 
-        results = []
-        for i, target in enumerate(targets, 1):
-            app_name = target.get('name', f'App_{i}')
-            url = target.get('url')
+        # Scraping and LLM calls are network-bound, so targets run in a thread
+        # pool. Results are kept in config order for the comparison report
+        results_by_index = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for i, target in enumerate(targets, 1):
+                app_name = target.get('name', f'App_{i}')
+                url = target.get('url')
 
-            if not url:
-                print(f"{Fore.RED}Skipping {app_name}: No URL provided")
-                continue
+                if not url:
+                    print(f"{Fore.RED}Skipping {app_name}: No URL provided")
+                    continue
 
-            result = self.analyze_single_policy(
-                app_name, url, use_selenium, show_cost, force_reanalyze
-            )
-            if result:
-                results.append(result)
+                future = executor.submit(
+                    self.analyze_single_policy,
+                    app_name, url, use_selenium, show_cost, force_reanalyze
+                )
+                futures[future] = (i, app_name)
+
+            for future in as_completed(futures):
+                i, app_name = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    self.logger.error(f"Analysis failed for {app_name}: {e}")
+                    print(f"{Fore.RED}✗ {app_name} failed: {e}")
+                    result = None
+
+                if result:
+                    results_by_index[i] = result
 
-            print("\n")
+                print("\n")
+
+        results = [results_by_index[i] for i in sorted(results_by_index)]
 
         # Generate comparison report
         if len(results) > 1:
@@ -359,9 +493,9 @@ class PrivacyPolicyAnalyzer:
             comparison_path = self.reporter.generate_comparison_report(results)
             print(f"{Fore.GREEN}✓ Comparison report: {Fore.CYAN}{comparison_path}")
 
-        print(f"\n{Fore.GREEN}{'=' * 70}")
+        print(f"\n{Fore.GREEN}{_BAR}")
         print(f"{Fore.GREEN}Analysis complete! Processed {len(results)}/{len(targets)} policies")
-        print(f"{Fore.GREEN}{'=' * 70}\n")
+        print(f"{Fore.GREEN}{_BAR}\n")
 
         # Show cache statistics
         cache_stats = self.analyzer.get_cache_stats()
@@ -487,12 +621,7 @@ Examples:
     )
 
     args = parser.parse_args()
-
-    # Print banner
-    print(f"\n{Fore.CYAN}{'=' * 70}")
-    print(f"{Fore.CYAN}  Privacy Policy Analyzer for Healthcare Apps")
-    print(f"{Fore.CYAN}  Enhanced Version 2.0 with Advanced LLM Analysis")
-    print(f"{Fore.CYAN}{'=' * 70}\n")
+    _bootstrap()
 
     # Validate arguments
     if not args.analyze_all and not args.url:
@@ -509,6 +638,12 @@ Examples:
     if not validate_api_keys():
         sys.exit(1)
 
+    # Print banner
+    print(f"\n{Fore.CYAN}{_BAR}")
+    print(f"{Fore.CYAN}  Privacy Policy Analyzer for Healthcare Apps")
+    print(f"{Fore.CYAN}  Enhanced Version 2.0 with Advanced LLM Analysis")
+    print(f"{Fore.CYAN}{_BAR}\n")
+
     try:
         # Initialize analyzer with options
         use_cache = not args.no_cache
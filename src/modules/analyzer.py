@@ -1,337 +1,47 @@
 """Enhanced LLM-based analysis module for privacy policies with advanced features"""
 
 import os
-import json
+import re
 import time
+import orjson
+import asyncio
+import sqlite3
 import hashlib
+import functools
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime
 import tiktoken
-from openai import OpenAI
-from anthropic import Anthropic
+from pydantic import BaseModel, ConfigDict, Field, StrictFloat, StrictInt, ValidationError, create_model
+import openai
+import anthropic
+from openai import AsyncOpenAI
+from anthropic import AsyncAnthropic
+from tenacity import retry, retry_if_exception, stop_after_attempt, stop_after_delay, wait_random_exponential
 from src.utils.logger import get_logger
 from src.utils.file_handler import FileHandler
 
-logger = get_logger()
-
-
-class PolicyPreprocessor:
-    """Preprocess privacy policies for better analysis"""
-
-    @staticmethod
-    def extract_structure(policy_text: str) -> Dict:
-        """
-        Extract structural information from policy
-
-        Args:
-            policy_text: Raw policy text
-
-        Returns:
-            Dictionary with structure information
-        """
-        lines = policy_text.split('\n')
-        headers = []
-
-        # Simple header detection (lines that are short, capitalized, or numbered)
-        for i, line in enumerate(lines):
-            line_clean = line.strip()
-            if line_clean and len(line_clean) < 100:
-                # Check if it looks like a header
-                if (line_clean.isupper() or
-                    line_clean[0].isdigit() or
-                    line_clean.endswith(':') or
-                    any(keyword in line_clean.lower() for keyword in
-                        ['introduction', 'collection', 'usage', 'sharing', 'retention',
-                         'rights', 'security', 'contact', 'changes', 'compliance'])):
-                    headers.append({
-                        'line': i,
-                        'text': line_clean,
-                        'level': PolicyPreprocessor._estimate_header_level(line_clean)
-                    })
-
-        return {
-            'total_lines': len(lines),
-            'headers': headers,
-            'estimated_sections': len(headers)
-        }
-
-    @staticmethod
-    def _estimate_header_level(text: str) -> int:
-        """Estimate header level (1-3)"""
-        if text.isupper():
-            return 1
-        elif text[0].isdigit():
-            return 2
-        else:
-            return 3
-
-    @staticmethod
-    def chunk_policy(policy_text: str, max_tokens: int = 6000) -> List[Dict]:
-        """
-        Intelligently chunk long policies
-
-        Args:
-            policy_text: Full policy text
-            max_tokens: Maximum tokens per chunk
-
-        Returns:
-            List of chunks with metadata
-        """
-        try:
-            encoding = tiktoken.encoding_for_model("gpt-4")
-            tokens = encoding.encode(policy_text)
-
-            if len(tokens) <= max_tokens:
-                return [{'text': policy_text, 'chunk_id': 0, 'total_chunks': 1}]
-
-            # Split into chunks at section boundaries when possible
-            structure = PolicyPreprocessor.extract_structure(policy_text)
-            lines = policy_text.split('\n')
-
-            chunks = []
-            current_chunk = []
-            current_tokens = 0
-            chunk_id = 0
-
-            for i, line in enumerate(lines):
-                line_tokens = len(encoding.encode(line))
-
-                # Check if adding this line would exceed limit
-                if current_tokens + line_tokens > max_tokens and current_chunk:
-                    # Save current chunk
-                    chunks.append({
-                        'text': '\n'.join(current_chunk),
-                        'chunk_id': chunk_id,
-                        'total_chunks': -1  # Will update later
-                    })
-                    chunk_id += 1
-                    current_chunk = []
-                    current_tokens = 0
-
-                current_chunk.append(line)
-                current_tokens += line_tokens
-
-            # Add final chunk
-            if current_chunk:
-                chunks.append({
-                    'text': '\n'.join(current_chunk),
-                    'chunk_id': chunk_id,
-                    'total_chunks': -1
-                })
-
-            # Update total_chunks
-            total = len(chunks)
-            for chunk in chunks:
-                chunk['total_chunks'] = total
-
-            return chunks
-
-        except Exception as e:
-            logger.warning(f"Chunking failed, returning full text: {str(e)}")
-            return [{'text': policy_text, 'chunk_id': 0, 'total_chunks': 1}]
-
-
-class PolicyAnalyzer:
-    """Enhanced analyzer for privacy policies with multi-model support and advanced features"""
-
-    def __init__(self, config: Dict, model_override: Optional[str] = None,
-                 analysis_depth: str = 'standard', use_cache: bool = True):
-        """
-        Initialize enhanced analyzer
-
-        Args:
-            config: LLM and analysis configuration
-            model_override: Override model from config ('claude', 'gpt4', 'auto')
-            analysis_depth: Analysis depth ('quick', 'standard', 'deep')
-            use_cache: Whether to use response caching
-        """
-        self.config = config
-        self.llm_config = config.get('llm', {})
-        self.analysis_config = config.get('analysis', {})
-        self.analysis_depth = analysis_depth
-        self.use_cache = use_cache
-
-        # Model configuration with fallback support
-        self.primary_provider, self.primary_model = self._setup_models(model_override)
-        self.fallback_provider, self.fallback_model = self._setup_fallback()
-
-        self.temperature = self.llm_config.get('temperature', 0.3)
-        self.max_tokens = self._get_max_tokens_for_depth()
-
-        # Initialize clients
-        self.openai_client = None
-        self.anthropic_client = None
-        self._initialize_clients()
-
-        # Setup caching
-        self.cache_dir = Path(config.get('paths', {}).get('cache', 'data/cache'))
-        if self.use_cache:
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
-
-        # Statistics
-        self.cache_hits = 0
-        self.cache_misses = 0
-
-        logger.info(f"Analyzer initialized: {self.primary_provider}/{self.primary_model} "
-                   f"(fallback: {self.fallback_provider}/{self.fallback_model})")
-
-    def _setup_models(self, override: Optional[str]) -> Tuple[str, str]:
-        """Setup primary model based on override or config"""
-        if override == 'claude':
-            return 'anthropic', 'claude-sonnet-4-20250514'
-        elif override == 'gpt4':
-            return 'openai', 'gpt-4-turbo-preview'
-        elif override == 'auto':
-            # Auto-select based on available API keys
-            if os.getenv('ANTHROPIC_API_KEY'):
-                return 'anthropic', 'claude-sonnet-4-20250514'
-            elif os.getenv('OPENAI_API_KEY'):
-                return 'openai', 'gpt-4-turbo-preview'
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
 
-        # Use config
-        provider = self.llm_config.get('provider', 'anthropic')
-        model = self.llm_config.get('model', 'claude-sonnet-4-20250514')
-        return provider, model
-
-    def _setup_fallback(self) -> Tuple[str, str]:
-        """Setup fallback model"""
-        if self.primary_provider == 'anthropic':
-            return 'openai', 'gpt-4-turbo-preview'
-        else:
-            return 'anthropic', 'claude-sonnet-4-20250514'
-
-    def _initialize_clients(self):
-        """Initialize API clients for available providers"""
-        try:
-            openai_key = os.getenv('OPENAI_API_KEY')
-            if openai_key and openai_key.startswith('sk-'):
-                self.openai_client = OpenAI(api_key=openai_key)
-                logger.info("OpenAI client initialized")
-        except Exception as e:
-            logger.warning(f"OpenAI client initialization failed: {e}")
-
-        try:
-            anthropic_key = os.getenv('ANTHROPIC_API_KEY')
-            if anthropic_key and anthropic_key.startswith('sk-ant-'):
-                self.anthropic_client = Anthropic(api_key=anthropic_key)
-                logger.info("Anthropic client initialized")
-        except Exception as e:
-            logger.warning(f"Anthropic client initialization failed: {e}")
-
-    def _get_max_tokens_for_depth(self) -> int:
-        """Get max tokens based on analysis depth and model limits"""
-        # Model-specific max completion token limits
-        model_limits = {
-            'gpt-4-turbo-preview': 4096,
-            'gpt-4': 4096,
-            'gpt-4-32k': 4096,
-            'gpt-3.5-turbo': 4096,
-            'claude-sonnet-4-20250514': 8192,
-            'claude-3-5-sonnet-20241022': 8192,
-            'claude-3-opus-20240229': 4096
-        }
-
-        # Desired tokens by depth
-        depths = {
-            'quick': 3000,
-            'standard': 6000,
-            'deep': 12000
-        }
-
-        desired_tokens = depths.get(self.analysis_depth, 6000)
-        model_limit = model_limits.get(self.primary_model, 4096)
-
-        # Return the minimum of desired and model limit
-        actual_tokens = min(desired_tokens, model_limit)
-
-        # Log if tokens are being capped
-        if actual_tokens < desired_tokens:
-            logger.info(
-                f"max_tokens capped at {actual_tokens} (model limit) "
-                f"instead of {desired_tokens} (depth: {self.analysis_depth})"
-            )
-
-        return actual_tokens
-
-    def _get_cache_key(self, policy_text: str, depth: str) -> str:
-        """Generate cache key for policy"""
-        content = f"{policy_text}_{depth}_{self.primary_model}"
-        return hashlib.sha256(content.encode()).hexdigest()
-
-    def _load_from_cache(self, cache_key: str) -> Optional[Dict]:
-        """Load analysis from cache"""
-        if not self.use_cache:
-            return None
-
-        cache_file = self.cache_dir / f"{cache_key}.json"
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.cache_hits += 1
-                    logger.info(f"Cache hit: {cache_key[:16]}...")
-                    return data
-            except Exception as e:
-                logger.warning(f"Cache load failed: {e}")
-
-        self.cache_misses += 1
-        return None
-
-    def _save_to_cache(self, cache_key: str, analysis: Dict):
-        """Save analysis to cache"""
-        if not self.use_cache:
-            return
-
-        cache_file = self.cache_dir / f"{cache_key}.json"
-        try:
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(analysis, f, indent=2)
-            logger.info(f"Saved to cache: {cache_key[:16]}...")
-        except Exception as e:
-            logger.warning(f"Cache save failed: {e}")
-
-    def _create_enhanced_prompt(self, policy_text: str, structure: Dict) -> str:
-        """
-        Create sophisticated analysis prompt with chain-of-thought reasoning
-
-        Args:
-            policy_text: Privacy policy text
-            structure: Structural information about the policy
-
-        Returns:
-            Enhanced prompt
-        """
-        prompt_templates = {
-            'quick': self._get_quick_prompt(),
-            'standard': self._get_standard_prompt(),
-            'deep': self._get_deep_prompt()
-        }
-
-        template = prompt_templates.get(self.analysis_depth, self._get_standard_prompt())
-
-        # Add structure information if available
-        structure_info = ""
-        if structure.get('headers'):
-            structure_info = "\n\nDOCUMENT STRUCTURE:\n"
-            structure_info += f"Total sections identified: {len(structure['headers'])}\n"
-            structure_info += "Main sections:\n"
-            for header in structure['headers'][:10]:  # First 10 headers
-                structure_info += f"  - {header['text']}\n"
-
-        return template.format(
-            policy_text=policy_text,
-            structure_info=structure_info
-        )
+logger = get_logger()
 
-    def _get_deep_prompt(self) -> str:
-        """Get prompt for deep analysis"""
-        return """You are a privacy and security expert specializing in healthcare applications and HIPAA compliance.
-Analyze the following privacy policy using chain-of-thought reasoning.
+# Words that mark a line as a likely section header
+_HEADER_KEYWORDS_RE = re.compile(
+    r'introduction|collection|usage|sharing|retention|rights|security|contact|changes|compliance'
+)
 
-PRIVACY POLICY TEXT:
-{policy_text}
-{structure_info}
+# Analysis instructions by analysis depth. They come before the policy text
+# so every request at a depth shares the same static prefix, which the
+# providers' prompt caches can reuse; the policy (and, for standard and deep,
+# the document structure block) follows under _POLICY_HEADER.
+_DEEP_INSTRUCTIONS = """You are a privacy and security expert specializing in healthcare applications and HIPAA compliance.
+Analyze the privacy policy given after these instructions using chain-of-thought reasoning.
 
 ANALYSIS INSTRUCTIONS:
 
@@ -397,25 +107,25 @@ STEP 8: SYNTHESIS
 Synthesize findings into scores and structured output.
 
 REQUIRED OUTPUT FORMAT (strict JSON):
-{{
+{
   "summary": "2-3 sentence executive summary highlighting most critical findings",
-  "data_collection": {{
+  "data_collection": {
     "types_collected": ["specific data types listed"],
     "collection_methods": ["automatic", "user-provided", "third-party sources"],
     "sensitive_data_handling": "detailed analysis of PHI/PII handling practices",
     "concerns": ["specific concerning practices with details"],
     "positive_aspects": ["good practices identified"],
     "score": 0-100
-  }},
-  "data_usage": {{
+  },
+  "data_usage": {
     "stated_purposes": ["list all purposes mentioned"],
     "concerning_uses": ["uses that may concern users"],
     "user_control": "what control users have over usage",
     "concerns": ["specific issues"],
     "positive_aspects": ["good practices"],
     "score": 0-100
-  }},
-  "third_party_sharing": {{
+  },
+  "third_party_sharing": {
     "partners_mentioned": ["list all third parties by name or category"],
     "purposes": ["why data is shared with each"],
     "user_control": "opt-out mechanisms, if any",
@@ -423,8 +133,8 @@ REQUIRED OUTPUT FORMAT (strict JSON):
     "concerns": ["specific concerning practices"],
     "positive_aspects": ["good practices"],
     "score": 0-100
-  }},
-  "data_retention": {{
+  },
+  "data_retention": {
     "duration_specified": true or false,
     "retention_period": "specific timeframe or 'unspecified' or 'indefinite'",
     "deletion_process": "how users can request deletion",
@@ -432,8 +142,8 @@ REQUIRED OUTPUT FORMAT (strict JSON):
     "concerns": ["issues with retention"],
     "positive_aspects": ["good practices"],
     "score": 0-100
-  }},
-  "user_rights": {{
+  },
+  "user_rights": {
     "access_rights": "detailed description of data access rights",
     "deletion_rights": "right to delete data",
     "portability": "can users export their data",
@@ -442,8 +152,8 @@ REQUIRED OUTPUT FORMAT (strict JSON):
     "concerns": ["rights that are missing or limited"],
     "positive_aspects": ["strong user rights"],
     "score": 0-100
-  }},
-  "security_measures": {{
+  },
+  "security_measures": {
     "technical_safeguards": ["encryption at rest", "encryption in transit", "access controls", etc.],
     "organizational_safeguards": ["staff training", "audits", "policies"],
     "breach_notification": "how and when users are notified of breaches",
@@ -451,8 +161,8 @@ REQUIRED OUTPUT FORMAT (strict JSON):
     "concerns": ["security weaknesses or vague claims"],
     "positive_aspects": ["strong security practices"],
     "score": 0-100
-  }},
-  "compliance": {{
+  },
+  "compliance": {
     "hipaa_mentioned": true or false,
     "hipaa_compliance_details": "what they claim about HIPAA compliance",
     "gdpr_mentioned": true or false,
@@ -461,8 +171,8 @@ REQUIRED OUTPUT FORMAT (strict JSON):
     "concerns": ["compliance gaps or questionable claims"],
     "positive_aspects": ["strong compliance posture"],
     "score": 0-100
-  }},
-  "older_adult_considerations": {{
+  },
+  "older_adult_considerations": {
     "readability_score": "estimated grade level (e.g., '12th grade', 'college level')",
     "readability_assessment": "analysis of language complexity",
     "accessibility_features": "large print, audio versions, simplified versions mentioned",
@@ -470,57 +180,57 @@ REQUIRED OUTPUT FORMAT (strict JSON):
     "concerns": ["accessibility barriers"],
     "positive_aspects": ["good accessibility features"],
     "score": 0-100
-  }},
+  },
   "red_flags": [
-    {{
+    {
       "category": "category name",
       "severity": "high" or "medium" or "low",
       "description": "specific concerning practice in detail",
       "quote": "exact text from policy that demonstrates this",
       "location": "section name or paragraph indicator",
       "impact": "why this matters for users"
-    }}
+    }
   ],
   "positive_practices": [
-    {{
+    {
       "category": "category name",
       "description": "what they do well",
       "quote": "supporting text from policy",
       "impact": "why this benefits users"
-    }}
+    }
   ],
   "missing_information": [
     "specific critical information not included"
   ],
   "contradictions": [
-    {{
+    {
       "description": "description of contradiction",
       "locations": ["section 1", "section 2"]
-    }}
+    }
   ],
   "vague_language_examples": [
-    {{
+    {
       "quote": "exact vague phrase",
       "concern": "why this is problematic",
       "location": "where found"
-    }}
+    }
   ],
   "quotable_findings": [
-    {{
+    {
       "category": "category",
       "finding": "research-worthy finding",
       "quote": "exact quote suitable for research paper",
       "significance": "why this is notable"
-    }}
+    }
   ],
   "overall_transparency_score": 0-100,
   "confidence_score": 0-100,
-  "metadata": {{
+  "metadata": {
     "analysis_date": "ISO timestamp",
     "policy_length": 0,
     "sections_analyzed": 0
-  }}
-}}
+  }
+}
 
 SCORING GUIDANCE:
 - 90-100: Excellent practices, very protective of user privacy
@@ -532,38 +242,32 @@ SCORING GUIDANCE:
 Be thorough, specific, and cite exact quotes. Identify at least 3-5 red flags if present, and 2-3 positive practices.
 Ensure ALL JSON fields are present and properly formatted."""
 
-    def _get_standard_prompt(self) -> str:
-        """Get prompt for standard analysis"""
-        return """You are a privacy and security expert specializing in healthcare applications.
-Analyze the following privacy policy comprehensively.
-
-PRIVACY POLICY TEXT:
-{policy_text}
-{structure_info}
+_STANDARD_INSTRUCTIONS = """You are a privacy and security expert specializing in healthcare applications.
+Analyze the privacy policy given after these instructions comprehensively.
 
 Analyze this policy systematically across all categories. Identify stakeholders, data flows, consent mechanisms,
 vague language, missing information, and HIPAA compliance. Assess readability for older adults.
 
 Provide analysis in this EXACT JSON format:
-{{
+{
   "summary": "2-3 sentence overview",
-  "data_collection": {{
+  "data_collection": {
     "types_collected": [],
     "collection_methods": [],
     "sensitive_data_handling": "",
     "concerns": [],
     "positive_aspects": [],
     "score": 0-100
-  }},
-  "data_usage": {{
+  },
+  "data_usage": {
     "stated_purposes": [],
     "concerning_uses": [],
     "user_control": "",
     "concerns": [],
     "positive_aspects": [],
     "score": 0-100
-  }},
-  "third_party_sharing": {{
+  },
+  "third_party_sharing": {
     "partners_mentioned": [],
     "purposes": [],
     "user_control": "",
@@ -571,8 +275,8 @@ Provide analysis in this EXACT JSON format:
     "concerns": [],
     "positive_aspects": [],
     "score": 0-100
-  }},
-  "data_retention": {{
+  },
+  "data_retention": {
     "duration_specified": true/false,
     "retention_period": "",
     "deletion_process": "",
@@ -580,8 +284,8 @@ Provide analysis in this EXACT JSON format:
     "concerns": [],
     "positive_aspects": [],
     "score": 0-100
-  }},
-  "user_rights": {{
+  },
+  "user_rights": {
     "access_rights": "",
     "deletion_rights": "",
     "portability": "",
@@ -590,8 +294,8 @@ Provide analysis in this EXACT JSON format:
     "concerns": [],
     "positive_aspects": [],
     "score": 0-100
-  }},
-  "security_measures": {{
+  },
+  "security_measures": {
     "technical_safeguards": [],
     "organizational_safeguards": [],
     "breach_notification": "",
@@ -599,8 +303,8 @@ Provide analysis in this EXACT JSON format:
     "concerns": [],
     "positive_aspects": [],
     "score": 0-100
-  }},
-  "compliance": {{
+  },
+  "compliance": {
     "hipaa_mentioned": true/false,
     "hipaa_compliance_details": "",
     "gdpr_mentioned": true/false,
@@ -609,8 +313,8 @@ Provide analysis in this EXACT JSON format:
     "concerns": [],
     "positive_aspects": [],
     "score": 0-100
-  }},
-  "older_adult_considerations": {{
+  },
+  "older_adult_considerations": {
     "readability_score": "",
     "readability_assessment": "",
     "accessibility_features": "",
@@ -618,159 +322,1064 @@ Provide analysis in this EXACT JSON format:
     "concerns": [],
     "positive_aspects": [],
     "score": 0-100
-  }},
+  },
   "red_flags": [
-    {{
+    {
       "category": "",
       "severity": "high/medium/low",
       "description": "",
       "quote": "",
       "location": "",
       "impact": ""
-    }}
+    }
   ],
   "positive_practices": [
-    {{
+    {
       "category": "",
       "description": "",
       "quote": "",
       "impact": ""
-    }}
+    }
   ],
   "missing_information": [],
   "contradictions": [],
   "vague_language_examples": [
-    {{
+    {
       "quote": "",
       "concern": "",
       "location": ""
-    }}
+    }
   ],
   "quotable_findings": [
-    {{
+    {
       "category": "",
       "finding": "",
       "quote": "",
       "significance": ""
-    }}
+    }
   ],
   "overall_transparency_score": 0-100,
   "confidence_score": 0-100,
-  "metadata": {{
+  "metadata": {
     "analysis_date": "ISO timestamp",
     "policy_length": 0,
     "sections_analyzed": 0
-  }}
-}}
+  }
+}
 
 Be specific and cite exact quotes. Score each category 0-100."""
 
-    def _get_quick_prompt(self) -> str:
-        """Get prompt for quick analysis"""
-        return """You are a privacy expert. Quickly analyze this healthcare privacy policy.
-
-PRIVACY POLICY TEXT:
-{policy_text}
+_QUICK_INSTRUCTIONS = """You are a privacy expert. Quickly analyze the healthcare privacy policy given after these instructions.
 
 Provide a focused analysis in JSON format with key findings, red flags, and scores for each category.
 Use the same JSON structure as standard analysis but focus on most critical issues."""
 
-    def analyze_with_anthropic(self, policy_text: str, structure: Dict) -> Dict:
-        """
-        Analyze policy using Anthropic Claude with enhanced prompting
+_POLICY_HEADER = "\n\nPRIVACY POLICY TEXT:\n"
 
-        Args:
-            policy_text: Privacy policy text
-            structure: Structural information
+# Appended to the depth's instructions when several chunks share a request.
+# It does not mention the chunk count, so the prefix stays cacheable.
+_BATCH_INSTRUCTIONS = """
 
-        Returns:
-            Analysis results
-        """
-        if not self.anthropic_client:
-            raise ValueError("Anthropic client not initialized. Check API key.")
+The policy text is split into sections marked <<CHUNK n>>. Analyze each section on its own,
+using the JSON structure above for each one. Respond with a single JSON object of the form
+{"analyses": [...]} holding one analysis per section, in section order."""
 
-        try:
-            start_time = time.time()
-            prompt = self._create_enhanced_prompt(policy_text, structure)
+_OPENAI_SYSTEM_PROMPT = "You are a privacy and security expert specializing in healthcare applications and HIPAA compliance. Provide comprehensive analysis in valid JSON format."
 
-            logger.info(f"Calling Anthropic Claude ({self.primary_model})...")
+# depth -> (instructions, include_structure)
+_PROMPT_BY_DEPTH = {
+    'quick': (_QUICK_INSTRUCTIONS, False),
+    'standard': (_STANDARD_INSTRUCTIONS, True),
+    'deep': (_DEEP_INSTRUCTIONS, True)
+}
 
-            response = self.anthropic_client.messages.create(
-                model=self.primary_model,
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
-            )
 
-            analysis_time = time.time() - start_time
+# Max completion tokens each model accepts
+MODEL_TOKEN_LIMITS = {
+    'gpt-4-turbo-preview': 4096,
+    'gpt-4': 4096,
+    'gpt-4-32k': 4096,
+    'gpt-3.5-turbo': 4096,
+    'claude-sonnet-4-20250514': 8192,
+    'claude-3-5-sonnet-20241022': 8192,
+    'claude-3-opus-20240229': 4096
+}
 
-            # Extract JSON from response
-            content = response.content[0].text
+# Desired completion tokens by analysis depth
+DEPTH_TOKENS = {
+    'quick': 3000,
+    'standard': 6000,
+    'deep': 12000
+}
 
-            # Find JSON in response
-            start = content.find('{')
-            end = content.rfind('}') + 1
+# Expected output tokens by analysis depth, used for cost estimates
+OUTPUT_TOKEN_ESTIMATES = {
+    'quick': 2000,
+    'standard': 4000,
+    'deep': 8000
+}
 
-            if start == -1 or end == 0:
-                raise ValueError("No JSON found in response")
+# (input, output) pricing per 1K tokens (approximate, as of 2024)
+MODEL_PRICING = {
+    'gpt-4-turbo-preview': (0.01, 0.03),
+    'claude-sonnet-4-20250514': (0.003, 0.015)
+}
+DEFAULT_PRICING = (0.01, 0.03)
 
-            json_str = content[start:end]
-            result = json.loads(json_str)
+# Cached analyses are zstd-compressed when zstandard is installed; blobs
+# are told apart from plain JSON by the zstd frame magic number
+ZSTD_LEVEL = 3
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
 
-            # Add metadata
-            if 'metadata' not in result:
-                result['metadata'] = {}
+# Connection pool for each provider's HTTP/2 client
+HTTP_POOL_LIMITS = {'max_connections': 100, 'max_keepalive_connections': 20}
 
-            result['metadata'].update({
-                'analysis_date': datetime.now().isoformat(),
-                'model_used': self.primary_model,
-                'provider': 'anthropic',
-                'analysis_time_seconds': round(analysis_time, 2),
-                'policy_length': len(policy_text),
-                'analysis_depth': self.analysis_depth
-            })
+REQUIRED_CATEGORIES = (
+    'data_collection', 'data_usage', 'third_party_sharing',
+    'data_retention', 'user_rights', 'security_measures',
+    'compliance', 'older_adult_considerations'
+)
 
-            # Validate response
-            self._validate_analysis(result)
 
-            logger.info(f"Anthropic analysis completed in {analysis_time:.2f}s")
-            return result
+class CategoryModel(BaseModel):
+    """Schema for one analysis category; fields other than score are free-form"""
 
-        except Exception as e:
-            logger.error(f"Anthropic analysis failed: {str(e)}")
-            raise
+    model_config = ConfigDict(extra='allow')
+
+    # The default only applies when score is absent, which is allowed
+    score: Union[StrictInt, StrictFloat] = Field(default=50, ge=0, le=100)
+
+
+# Schema for a whole analysis result: a summary plus every required category
+AnalysisModel = create_model(
+    'AnalysisModel',
+    __config__=ConfigDict(extra='allow'),
+    summary=(str, ...),
+    **{category: (CategoryModel, ...) for category in REQUIRED_CATEGORIES}
+)
+
+
+
+# Token encoding used by the gpt-4 family, for chunking and cost estimates
+ENCODING_NAME = 'cl100k_base'
+
+
+@functools.lru_cache(maxsize=None)
+def _get_encoding() -> tiktoken.Encoding:
+    """Get the tiktoken encoding shared by every analyzer in the process"""
+    return tiktoken.get_encoding(ENCODING_NAME)
+
+
+# Callers usually hash and tokenize the same policy text several times in a
+# row (is_cached, estimate_cost, analyze_policy), so the last few results are
+# memoized. Lookups hash the string once; CPython caches str hashes.
+TEXT_MEMO_SIZE = 32
+
+
+@functools.lru_cache(maxsize=TEXT_MEMO_SIZE)
+def _count_tokens(text: str) -> int:
+    """Count tokens in text with the shared encoding"""
+    return len(_get_encoding().encode(text))
+
+
+@functools.lru_cache(maxsize=TEXT_MEMO_SIZE)
+def _normalized_text_digest(text: str) -> str:
+    """
+    Hash policy text after lowercasing and collapsing whitespace
+
+    Returns:
+        128-bit blake2b hex digest
+    """
+    return hashlib.blake2b(' '.join(text.lower().split()).encode(), digest_size=16).hexdigest()
+
+
+# Retries of a request to the same model on transient errors, before
+# _analyze_single falls back to the other provider
+LLM_RETRY_ATTEMPTS = 3
+LLM_RETRY_DEADLINE_SECONDS = 300
+
+
+def _is_transient_llm_error(error: BaseException) -> bool:
+    """Whether an API error is worth retrying: rate limits, connection problems and 5xx"""
+    if isinstance(error, (openai.RateLimitError, openai.APIConnectionError,
+                          anthropic.RateLimitError, anthropic.APIConnectionError)):
+        return True
+    return isinstance(error, (openai.APIStatusError, anthropic.APIStatusError)) and error.status_code >= 500
+
+
+def _log_llm_retry(retry_state) -> None:
+    """Log a transient LLM error before backing off"""
+    logger.warning(f"LLM request failed (attempt {retry_state.attempt_number}), "
+                   f"retrying: {retry_state.outcome.exception()}")
+
+
+# Backoff sleeps happen outside the request semaphore, so a waiting retry
+# does not hold a concurrency slot
+_llm_retry = retry(
+    retry=retry_if_exception(_is_transient_llm_error),
+    wait=wait_random_exponential(multiplier=1, max=20),
+    stop=stop_after_attempt(LLM_RETRY_ATTEMPTS) | stop_after_delay(LLM_RETRY_DEADLINE_SECONDS),
+    before_sleep=_log_llm_retry,
+    reraise=True
+)
+
+
+def _extract_json_object(content: str) -> Dict:
+    """
+    Parse the outermost JSON object in an LLM response
+
+    Args:
+        content: Response text, possibly with prose around the JSON
+
+    Returns:
+        Parsed object
+    """
+    start = content.find('{')
+    end = content.rfind('}') + 1
+
+    if start == -1 or end == 0:
+        raise ValueError("No JSON found in response")
+
+    return orjson.loads(content[start:end])
+
+
+def _has_min_text(text: str, min_chars: int = 100) -> bool:
+    """
+    Whether text is at least min_chars long once surrounding whitespace is
+    stripped, without building the stripped copy
+
+    Args:
+        text: Text to check
+        min_chars: Minimum stripped length
+
+    Returns:
+        True if len(text.strip()) >= min_chars
+    """
+    if not text or len(text) < min_chars:
+        return False
+
+    # Only the leading and trailing whitespace is scanned
+    start, end = 0, len(text)
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return end - start >= min_chars
+
+
+# Sentinel for dict lookups where None is a valid value
+_MISSING = object()
+
+
+def _collect_unique(seen: Dict, items, limit: int) -> None:
+    """
+    Add items to an insertion-ordered dict used as a set, up to limit keys
+
+    Args:
+        seen: Dict whose keys are the unique items collected so far
+        items: Items to add
+        limit: Maximum number of unique items to keep
+    """
+    for item in items:
+        if len(seen) >= limit:
+            return
+        seen.setdefault(item, None)
+
+
+class PolicyPreprocessor:
+    """Preprocess privacy policies for better analysis"""
+
+    @staticmethod
+    def extract_structure(policy_text: str) -> Dict:
+        """
+        Extract structural information from policy
+
+        Args:
+            policy_text: Raw policy text
+
+        Returns:
+            Dictionary with structure information
+        """
+        lines = policy_text.split('\n')
+        headers = []
+
+        # Simple header detection (lines that are short, capitalized, or numbered)
+        for i, line in enumerate(lines):
+            line_clean = line.strip()
+            if not line_clean or len(line_clean) >= 100:
+                continue
+
+            # Check if it looks like a header
+            if (line_clean.isupper() or
+                line_clean[0].isdigit() or
+                line_clean.endswith(':') or
+                _HEADER_KEYWORDS_RE.search(line_clean.lower())):
+                headers.append({
+                    'line': i,
+                    'text': line_clean,
+                    'level': PolicyPreprocessor._estimate_header_level(line_clean)
+                })
+
+        return {
+            'total_lines': len(lines),
+            'headers': headers,
+            'estimated_sections': len(headers)
+        }
+
+    @staticmethod
+    def _estimate_header_level(text: str) -> int:
+        """Estimate header level (1-3)"""
+        if text.isupper():
+            return 1
+        elif text[0].isdigit():
+            return 2
+        else:
+            return 3
+
+    @staticmethod
+    def chunk_policy(policy_text: str, max_tokens: int = 6000,
+                     encoding: Optional[tiktoken.Encoding] = None,
+                     token_count: Optional[int] = None) -> List[Dict]:
+        """
+        Intelligently chunk long policies
+
+        Args:
+            policy_text: Full policy text
+            max_tokens: Maximum tokens per chunk
+            encoding: Token encoding to count with (default: shared cl100k_base)
+            token_count: Tokens in policy_text, if already counted
+
+        Returns:
+            List of chunks with metadata
+        """
+        # English text averages ~4 characters per token, so anything this
+        # short fits without tokenizing it
+        if len(policy_text) <= max_tokens * 3:
+            return [{'text': policy_text, 'chunk_id': 0, 'total_chunks': 1}]
+
+        try:
+            # With the shared encoding the count is memoized, so a precise
+            # estimate_cost of the same text does not tokenize it again
+            if token_count is None:
+                token_count = len(encoding.encode(policy_text)) if encoding else _count_tokens(policy_text)
+            encoding = encoding or _get_encoding()
+
+            if token_count <= max_tokens:
+                return [{'text': policy_text, 'chunk_id': 0, 'total_chunks': 1}]
+
+            # Fill each chunk from a cheap ~4 chars/token estimate, then
+            # tokenize only the finished chunk to confirm it fits. That is one
+            # encode per chunk instead of one per line.
+            lines = policy_text.split('\n')
+            fill_target = max_tokens * 0.9
+
+            chunks = []
+            start = 0
+            num_lines = len(lines)
+
+            while start < num_lines:
+                end = start
+                estimate = 0
+                while end < num_lines:
+                    line_estimate = (len(lines[end]) + 3) // 4
+                    if end > start and estimate + line_estimate > fill_target:
+                        break
+                    estimate += line_estimate
+                    end += 1
+
+                # Shrink in proportion to the overshoot until the chunk fits;
+                # a single oversized line still becomes its own chunk
+                while True:
+                    text = '\n'.join(lines[start:end])
+                    if end - start == 1:
+                        break
+                    chunk_tokens = len(encoding.encode(text))
+                    if chunk_tokens <= max_tokens:
+                        break
+                    end = start + max(1, (end - start) * max_tokens // chunk_tokens)
+
+                chunks.append({
+                    'text': text,
+                    'chunk_id': len(chunks),
+                    'total_chunks': -1  # Will update later
+                })
+                start = end
+
+            # Update total_chunks
+            total = len(chunks)
+            for chunk in chunks:
+                chunk['total_chunks'] = total
+
+            return chunks
+
+        except Exception as e:
+            logger.warning(f"Chunking failed, returning full text: {str(e)}")
+            return [{'text': policy_text, 'chunk_id': 0, 'total_chunks': 1}]
+
+
+class ChunkSynthesizer:
+    """
+    Combine chunk analyses into one, folding them in as they arrive
+
+    Only running totals and the capped concern/positive sets are kept per
+    category, so each chunk analysis can be dropped once it is folded in.
+    Fold chunks in chunk order; the summary, first-chunk fields and list
+    order follow it.
+    """
+
+    # List fields concatenated across chunks
+    FLAT_LISTS = ('red_flags', 'positive_practices', 'missing_information', 'quotable_findings')
+
+    def __init__(self):
+        self.chunks = 0
+        self._summaries = []
+        self._metadata = None
+        self._flat_lists = {field: [] for field in self.FLAT_LISTS}
+
+        # 'extra' holds the remaining category fields: list fields
+        # (types_collected, partners_mentioned, ...) are unioned, others come
+        # from the first chunk
+        self._accum = {
+            category: {'score_sum': 0, 'weight': 0, 'concerns': {}, 'positives': {}, 'extra': {}}
+            for category in REQUIRED_CATEGORIES
+        }
+
+    def fold(self, analysis: Dict):
+        """
+        Add one chunk analysis
+
+        Args:
+            analysis: Validated analysis of the next chunk
+        """
+        if self._metadata is None:
+            self._metadata = analysis.get('metadata', {})
+        self.chunks += 1
+
+        summary = analysis.get('summary', '')
+        if summary:
+            self._summaries.append(summary)
+
+        # Weight each chunk by the length of text it covered, so a short
+        # trailing chunk does not count as much as a full one
+        weight = analysis.get('metadata', {}).get('policy_length') or 1
+
+        for category, acc in self._accum.items():
+            data = analysis.get(category)
+            if data is None:
+                continue
+
+            acc['score_sum'] += data.get('score', 50) * weight
+            acc['weight'] += weight
+            # Dedupe in first-seen order and stop collecting at 10 items
+            _collect_unique(acc['concerns'], data.get('concerns', ()), 10)
+            _collect_unique(acc['positives'], data.get('positive_aspects', ()), 10)
+
+            extra = acc['extra']
+            for key, value in data.items():
+                if key in ('concerns', 'positive_aspects', 'score'):
+                    continue
+                merged = extra.get(key, _MISSING)
+                if merged is _MISSING:
+                    extra[key] = list(value) if isinstance(value, list) else value
+                elif isinstance(value, list) and isinstance(merged, list):
+                    merged.extend(item for item in value if item not in merged)
+
+        # Combine red flags and positive practices
+        for field, merged in self._flat_lists.items():
+            merged.extend(analysis.get(field, ()))
+
+    def finalize(self) -> Dict:
+        """
+        Build the combined analysis from the chunks folded so far
+
+        Returns:
+            Synthesized analysis
+        """
+        synthesized = {
+            'summary': ' '.join(self._summaries),
+            **self._flat_lists,
+            'metadata': self._metadata if self._metadata is not None else {}
+        }
+
+        all_scores = []
+        for category, acc in self._accum.items():
+            score = round(acc['score_sum'] / acc['weight'] if acc['weight'] else 50, 0)
+            all_scores.append(score)
+            synthesized[category] = {
+                'concerns': list(acc['concerns']),
+                'positive_aspects': list(acc['positives']),
+                'score': score,
+                **acc['extra']
+            }
+
+        # Calculate overall transparency score
+        synthesized['overall_transparency_score'] = round(sum(all_scores) / len(all_scores))
+        synthesized['confidence_score'] = 75  # Lower for chunked analysis
+
+        synthesized['metadata']['chunked_analysis'] = True
+        synthesized['metadata']['chunks_analyzed'] = self.chunks
+
+        return synthesized
+
+
+class PolicyAnalyzer:
+    """Enhanced analyzer for privacy policies with multi-model support and advanced features"""
+
+    def __init__(self, config: Dict, model_override: Optional[str] = None,
+                 analysis_depth: str = 'standard', use_cache: bool = True):
+        """
+        Initialize enhanced analyzer
+
+        Args:
+            config: LLM and analysis configuration
+            model_override: Override model from config ('claude', 'gpt4', 'auto')
+            analysis_depth: Analysis depth ('quick', 'standard', 'deep')
+            use_cache: Whether to use response caching
+        """
+        self.config = config
+        self.llm_config = config.get('llm', {})
+        self.analysis_config = config.get('analysis', {})
+        self.use_cache = use_cache
+
+        # Model configuration with fallback support
+        self.primary_provider, self.primary_model = self._setup_models(model_override)
+        self.fallback_provider, self.fallback_model = self._setup_fallback()
+
+        # Also resolves max_tokens and the prompt template for the depth
+        self.analysis_depth = analysis_depth
+
+        self.temperature = self.llm_config.get('temperature', 0.3)
+
+        # Concurrent LLM requests allowed across all chunks and policies
+        self.max_concurrency = self.llm_config.get('max_concurrency', 8)
+
+        # Chunks sent together in one request (1 sends each chunk separately).
+        # The chunks share that request's max_tokens of output.
+        self.chunk_batch_size = max(1, self.llm_config.get('chunk_batch_size', 1))
+
+        # The async clients run on one background event loop, started on
+        # first use, so sync callers on any thread share its connections
+        self._loop = None
+        self._loop_lock = threading.Lock()
+        self._semaphore = None
+
+        # Initialize clients
+        self.openai_client = None
+        self.anthropic_client = None
+        self._initialize_clients()
+
+        # Setup caching
+        self.cache_dir = Path(config.get('paths', {}).get('cache', 'data/cache'))
+        # Whole results cached by the CLI per URL; they follow the same TTL
+        # and are cleared along with the analyses
+        self.report_cache_dir = self.cache_dir / 'reports'
+        self._cache_conn = None
+        self._cache_lock = threading.Lock()
+
+        # In-memory tier in front of the database: cache key -> entry with
+        # the parsed analysis, hit_count and last_accessed, in LRU order.
+        # 0 disables it, so every lookup goes to the database
+        self._mem_cache = OrderedDict()
+        self._mem_cache_max = self.analysis_config.get('memory_cache_entries', 128)
+
+        # Cached analyses expire after cache_duration_days, and the database
+        # keeps at most cache_max_entries, evicting the least recently used.
+        # A missing or non-positive value disables the limit
+        ttl_days = self.analysis_config.get('cache_duration_days', 30)
+        self.cache_ttl_seconds = ttl_days * 86400 if ttl_days else None
+        max_entries = self.analysis_config.get('cache_max_entries', 1000)
+        self.cache_max_entries = max_entries if max_entries and max_entries > 0 else None
+        if self.use_cache:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._open_cache_db()
+
+        # Statistics. The analyzer is shared across worker threads, so they
+        # are updated under _cache_lock, which a hit already holds
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        logger.info(f"Analyzer initialized: {self.primary_provider}/{self.primary_model} "
+                   f"(fallback: {self.fallback_provider}/{self.fallback_model})")
+
+    @property
+    def analysis_depth(self) -> str:
+        """Analysis depth ('quick', 'standard', 'deep')"""
+        return self._analysis_depth
+
+    @analysis_depth.setter
+    def analysis_depth(self, depth: str):
+        # Cache keys include the depth, so analyses cached at the previous
+        # depth stay valid and need no invalidation
+        self._analysis_depth = depth
+        self.max_tokens = self._get_max_tokens_for_depth()
+        self._prompt_template = _PROMPT_BY_DEPTH.get(depth, _PROMPT_BY_DEPTH['standard'])
+
+    def _setup_models(self, override: Optional[str]) -> Tuple[str, str]:
+        """Setup primary model based on override or config"""
+        if override == 'claude':
+            return 'anthropic', 'claude-sonnet-4-20250514'
+        elif override == 'gpt4':
+            return 'openai', 'gpt-4-turbo-preview'
+        elif override == 'auto':
+            # Auto-select based on available API keys
+            if os.getenv('ANTHROPIC_API_KEY'):
+                return 'anthropic', 'claude-sonnet-4-20250514'
+            elif os.getenv('OPENAI_API_KEY'):
+                return 'openai', 'gpt-4-turbo-preview'
+
+        # Use config
+        provider = self.llm_config.get('provider', 'anthropic')
+        model = self.llm_config.get('model', 'claude-sonnet-4-20250514')
+        return provider, model
+
+    def _setup_fallback(self) -> Tuple[str, str]:
+        """Setup fallback model"""
+        if self.primary_provider == 'anthropic':
+            return 'openai', 'gpt-4-turbo-preview'
+        else:
+            return 'anthropic', 'claude-sonnet-4-20250514'
+
+    def _create_http_client(self):
+        """
+        Create a pooled HTTP/2 client for an SDK client to send requests over
+
+        Concurrent requests to a provider are multiplexed over kept-alive
+        connections instead of each negotiating its own TLS session.
+
+        Returns:
+            httpx.AsyncClient, or None to use the SDK's default transport
+            when httpx or its h2 extra is not installed
+        """
+        try:
+            import httpx
+            return httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(**HTTP_POOL_LIMITS),
+                timeout=httpx.Timeout(self.llm_config.get('timeout', 120))
+            )
+        except ImportError as e:
+            logger.info(f"HTTP/2 transport unavailable, using SDK default: {e}")
+            return None
+
+    def _initialize_clients(self):
+        """Initialize API clients for available providers"""
+        try:
+            openai_key = os.getenv('OPENAI_API_KEY')
+            if openai_key and openai_key.startswith('sk-'):
+                self.openai_client = AsyncOpenAI(
+                    api_key=openai_key, http_client=self._create_http_client(),
+                    max_retries=0  # _llm_retry handles retries
+                )
+                logger.info("OpenAI client initialized")
+        except Exception as e:
+            logger.warning(f"OpenAI client initialization failed: {e}")
+
+        try:
+            anthropic_key = os.getenv('ANTHROPIC_API_KEY')
+            if anthropic_key and anthropic_key.startswith('sk-ant-'):
+                self.anthropic_client = AsyncAnthropic(
+                    api_key=anthropic_key, http_client=self._create_http_client(),
+                    max_retries=0  # _llm_retry handles retries
+                )
+                logger.info("Anthropic client initialized")
+        except Exception as e:
+            logger.warning(f"Anthropic client initialization failed: {e}")
+
+    def _run_async(self, coro):
+        """
+        Run a coroutine on the analyzer's event loop and wait for the result
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            The coroutine's result
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever,
+                    name='PolicyAnalyzer-loop',
+                    daemon=True
+                ).start()
+
+        # Blocking on the loop from its own thread would never return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            coro.close()
+            raise RuntimeError("Synchronous analysis called from the analyzer's event loop; "
+                               "use analyze_policy_async instead")
+
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the semaphore bounding concurrent LLM requests"""
+        # Only touched from the event loop thread, so no lock is needed
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    def _max_tokens_for(self, model: str) -> int:
+        """Completion tokens to request from a model, within its limit"""
+        return min(self.max_tokens, MODEL_TOKEN_LIMITS.get(model, self.max_tokens))
+
+    def _get_max_tokens_for_depth(self) -> int:
+        """Get max tokens based on analysis depth and model limits"""
+        desired_tokens = DEPTH_TOKENS.get(self.analysis_depth, 6000)
+        model_limit = MODEL_TOKEN_LIMITS.get(self.primary_model, 4096)
+
+        # Return the minimum of desired and model limit
+        actual_tokens = min(desired_tokens, model_limit)
+
+        # Log if tokens are being capped
+        if actual_tokens < desired_tokens:
+            logger.info(
+                f"max_tokens capped at {actual_tokens} (model limit) "
+                f"instead of {desired_tokens} (depth: {self.analysis_depth})"
+            )
+
+        return actual_tokens
+
+    def _get_cache_key(self, policy_text: str, depth: str) -> str:
+        """Generate cache key for policy"""
+        # Only the key is normalized, so re-scrapes of a policy share a key;
+        # the LLM still sees the original text
+        return f"{_normalized_text_digest(policy_text)}:{depth}:{self.primary_model}"
+
+    def _open_cache_db(self):
+        """Open the SQLite response cache"""
+        try:
+            conn = sqlite3.connect(self.cache_dir / 'cache.sqlite', check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS cache '
+                '(key TEXT PRIMARY KEY, value BLOB, created_at INTEGER, last_accessed INTEGER)'
+            )
+            # Databases created before LRU eviction lack last_accessed
+            columns = {row[1] for row in conn.execute('PRAGMA table_info(cache)')}
+            if 'last_accessed' not in columns:
+                conn.execute('ALTER TABLE cache ADD COLUMN last_accessed INTEGER')
+                conn.execute('UPDATE cache SET last_accessed = created_at')
+            conn.execute('CREATE INDEX IF NOT EXISTS cache_last_accessed ON cache (last_accessed)')
+            if self.cache_ttl_seconds:
+                conn.execute('DELETE FROM cache WHERE created_at < ?', (self._cache_cutoff(),))
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Cache database unavailable, caching disabled: {e}")
+            self.use_cache = False
+            return
+
+        self._cache_conn = conn
+
+    def _cache_cutoff(self) -> int:
+        """Creation time before which cached analyses have expired"""
+        return int(time.time() - self.cache_ttl_seconds) if self.cache_ttl_seconds else 0
 
-    def analyze_with_openai(self, policy_text: str, structure: Dict) -> Dict:
+    def _remember(self, cache_key: str, analysis: Dict, created_at: int):
+        """Add an analysis to the in-memory tier, evicting the least recently used"""
+        if self._mem_cache_max <= 0:
+            return
+        self._mem_cache[cache_key] = {
+            'analysis': analysis,
+            'created_at': created_at,
+            'hit_count': 0,
+            'last_accessed': time.time()
+        }
+        self._mem_cache.move_to_end(cache_key)
+        if len(self._mem_cache) > self._mem_cache_max:
+            self._mem_cache.popitem(last=False)
+
+    def _load_from_cache(self, cache_key: str) -> Optional[Dict]:
         """
-        Analyze policy using OpenAI with enhanced prompting
+        Load analysis from cache
+
+        Analyses already loaded in this process are returned from memory
+        without touching the database; treat the result as read-only.
+        """
+        if not self.use_cache:
+            return None
+
+        try:
+            cutoff = self._cache_cutoff()
+            with self._cache_lock:
+                entry = self._mem_cache.get(cache_key)
+                if entry is not None and entry['created_at'] < cutoff:
+                    del self._mem_cache[cache_key]
+                    entry = None
+
+                row = None
+                if entry is not None:
+                    self._mem_cache.move_to_end(cache_key)
+                    entry['hit_count'] += 1
+                    entry['last_accessed'] = time.time()
+                    self.cache_hits += 1
+                else:
+                    row = self._cache_conn.execute(
+                        'SELECT value, created_at FROM cache WHERE key = ?', (cache_key,)
+                    ).fetchone()
+                    if row is not None:
+                        with self._cache_conn:
+                            if row[1] < cutoff:
+                                self._cache_conn.execute('DELETE FROM cache WHERE key = ?', (cache_key,))
+                                row = None
+                            else:
+                                self._cache_conn.execute(
+                                    'UPDATE cache SET last_accessed = ? WHERE key = ?',
+                                    (int(time.time()), cache_key)
+                                )
+
+            if entry is not None:
+                logger.info(f"Cache hit (memory): {cache_key[:16]}...")
+                return entry['analysis']
+
+            if row is not None:
+                value, created_at = row
+                if value[:4] == _ZSTD_MAGIC:
+                    if not HAS_ZSTD:
+                        raise ValueError("entry is zstd-compressed but zstandard is not installed")
+                    value = zstandard.decompress(value)
+                data = orjson.loads(value)
+                with self._cache_lock:
+                    self._remember(cache_key, data, created_at)
+                    self.cache_hits += 1
+                logger.info(f"Cache hit: {cache_key[:16]}...")
+                return data
+        except Exception as e:
+            logger.warning(f"Cache load failed: {e}")
+
+        with self._cache_lock:
+            self.cache_misses += 1
+        return None
+
+    def is_cached(self, policy_text: str) -> bool:
+        """
+        Check whether an analysis of this policy is cached, without loading it
+
+        Lets callers skip work that only matters on a miss, such as token
+        counting for a cost estimate.
 
         Args:
             policy_text: Privacy policy text
-            structure: Structural information
 
         Returns:
-            Analysis results
+            True if analyze_policy would be answered from the cache
         """
-        if not self.openai_client:
-            raise ValueError("OpenAI client not initialized. Check API key.")
+        if not self.use_cache:
+            return False
 
+        cache_key = self._get_cache_key(policy_text, self.analysis_depth)
         try:
-            start_time = time.time()
-            prompt = self._create_enhanced_prompt(policy_text, structure)
+            cutoff = self._cache_cutoff()
+            with self._cache_lock:
+                entry = self._mem_cache.get(cache_key)
+                if entry is not None and entry['created_at'] >= cutoff:
+                    return True
+                row = self._cache_conn.execute(
+                    'SELECT 1 FROM cache WHERE key = ? AND created_at >= ?', (cache_key, cutoff)
+                ).fetchone()
+            return row is not None
+        except Exception as e:
+            logger.warning(f"Cache lookup failed: {e}")
+            return False
+
+    def invalidate(self, policy_text: Optional[str] = None, cache_key: Optional[str] = None) -> bool:
+        """
+        Drop one cached analysis, e.g. after a policy was revised
+
+        Args:
+            policy_text: Policy whose analysis at the current depth and model to drop
+            cache_key: Cache key to drop, instead of policy_text
+
+        Returns:
+            True if an entry was removed
+        """
+        if cache_key is None:
+            if policy_text is None:
+                raise ValueError("Pass policy_text or cache_key")
+            cache_key = self._get_cache_key(policy_text, self.analysis_depth)
+
+        if not self.use_cache:
+            return False
+
+        try:
+            with self._cache_lock:
+                in_memory = self._mem_cache.pop(cache_key, None) is not None
+                with self._cache_conn:
+                    deleted = self._cache_conn.execute(
+                        'DELETE FROM cache WHERE key = ?', (cache_key,)
+                    ).rowcount
+            logger.info(f"Invalidated cache entry: {cache_key[:16]}...")
+            return in_memory or deleted > 0
+        except Exception as e:
+            logger.warning(f"Cache invalidation failed: {e}")
+            return False
+
+    def invalidate_all(self) -> int:
+        """
+        Drop every cached analysis, and the cached results built on them
+
+        Returns:
+            Number of entries removed from the database
+        """
+        removed_reports = 0
+        for report_file in self.report_cache_dir.glob('*.json'):
+            try:
+                report_file.unlink()
+                removed_reports += 1
+            except OSError as e:
+                logger.warning(f"Could not remove cached result {report_file.name}: {e}")
+        if removed_reports:
+            logger.info(f"Removed {removed_reports} cached results")
+
+        if not self.use_cache:
+            return 0
+
+        try:
+            with self._cache_lock:
+                self._mem_cache.clear()
+                with self._cache_conn:
+                    deleted = self._cache_conn.execute('DELETE FROM cache').rowcount
+            logger.info(f"Invalidated {deleted} cached analyses")
+            return deleted
+        except Exception as e:
+            logger.warning(f"Cache invalidation failed: {e}")
+            return 0
+
+    def _save_to_cache(self, cache_key: str, analysis: Dict):
+        """Save analysis to cache"""
+        if not self.use_cache:
+            return
+
+        try:
+            value = orjson.dumps(analysis)
+            if HAS_ZSTD:
+                value = zstandard.compress(value, ZSTD_LEVEL)
+            now = int(time.time())
+            with self._cache_lock:
+                with self._cache_conn:
+                    self._cache_conn.execute(
+                        'INSERT OR REPLACE INTO cache (key, value, created_at, last_accessed) '
+                        'VALUES (?, ?, ?, ?)',
+                        (cache_key, value, now, now)
+                    )
+                    # Keep the most recently used cache_max_entries
+                    if self.cache_max_entries:
+                        self._cache_conn.execute(
+                            'DELETE FROM cache WHERE key IN ('
+                            'SELECT key FROM cache ORDER BY last_accessed DESC LIMIT -1 OFFSET ?)',
+                            (self.cache_max_entries,)
+                        )
+                self._remember(cache_key, analysis, now)
+            logger.info(f"Saved to cache: {cache_key[:16]}...")
+        except Exception as e:
+            logger.warning(f"Cache save failed: {e}")
+
+    def _create_prompt_parts(self, policy_text: str, structure: Dict) -> Tuple[str, str]:
+        """
+        Create the static and per-policy parts of the analysis prompt
 
-            logger.info(f"Calling OpenAI ({self.primary_model})...")
+        Args:
+            policy_text: Privacy policy text
+            structure: Structural information about the policy
+
+        Returns:
+            (instructions shared by every request at this depth,
+             policy text with its structure information)
+        """
+        instructions, include_structure = self._prompt_template
+        if not include_structure:
+            return instructions, ''.join((_POLICY_HEADER, policy_text))
+
+        # Add structure information if available
+        structure_info = ""
+        headers = structure.get('headers')
+        if headers:
+            parts = [
+                "\n\nDOCUMENT STRUCTURE:\n",
+                f"Total sections identified: {len(headers)}\n",
+                "Main sections:\n"
+            ]
+            parts.extend(f"  - {header['text']}\n" for header in headers[:10])  # First 10 headers
+            structure_info = ''.join(parts)
+
+        return instructions, ''.join((_POLICY_HEADER, policy_text, '\n', structure_info))
+
+    def _create_enhanced_prompt(self, policy_text: str, structure: Dict) -> str:
+        """
+        Create sophisticated analysis prompt with chain-of-thought reasoning
+
+        Args:
+            policy_text: Privacy policy text
+            structure: Structural information about the policy
+
+        Returns:
+            Enhanced prompt
+        """
+        return ''.join(self._create_prompt_parts(policy_text, structure))
+
+    @_llm_retry
+    async def _request_anthropic(self, instructions: str, policy_part: str,
+                                 model: str) -> Tuple[str, Optional[int]]:
+        """
+        Send one prompt to Anthropic Claude
+
+        Args:
+            instructions: Static instructions, cached by the API across requests
+            policy_part: Per-request policy text
+            model: Model to call
+
+        Returns:
+            (response text, tokens used if reported)
+        """
+        async with self._get_semaphore():
+            response = await self.anthropic_client.messages.create(
+                model=model,
+                max_tokens=self._max_tokens_for(model),
+                temperature=self.temperature,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": [
+                            {
+                                "type": "text",
+                                "text": instructions,
+                                "cache_control": {"type": "ephemeral"}
+                            },
+                            {
+                                "type": "text",
+                                "text": policy_part
+                            }
+                        ]
+                    }
+                ]
+            )
+
+        return response.content[0].text, None
+
+    @_llm_retry
+    async def _request_openai(self, prompt: str, model: str) -> Tuple[str, Optional[int]]:
+        """
+        Send one prompt to OpenAI in JSON mode
+
+        Args:
+            prompt: Full user prompt
+            model: Model to call
 
-            response = self.openai_client.chat.completions.create(
-                model=self.primary_model,
+        Returns:
+            (response text, tokens used if reported)
+        """
+        async with self._get_semaphore():
+            response = await self.openai_client.chat.completions.create(
+                model=model,
                 messages=[
                     {
                         "role": "system",
-                        "content": "You are a privacy and security expert specializing in healthcare applications and HIPAA compliance. Provide comprehensive analysis in valid JSON format."
+                        "content": _OPENAI_SYSTEM_PROMPT
                     },
                     {
                         "role": "user",
@@ -778,13 +1387,92 @@ Use the same JSON structure as standard analysis but focus on most critical issu
                     }
                 ],
                 temperature=self.temperature,
-                max_tokens=self.max_tokens,
+                max_tokens=self._max_tokens_for(model),
                 response_format={"type": "json_object"}
             )
 
+        tokens_used = response.usage.total_tokens if hasattr(response, 'usage') else None
+        return response.choices[0].message.content, tokens_used
+
+    async def analyze_with_anthropic(self, policy_text: str, structure: Dict,
+                                 model: Optional[str] = None) -> Dict:
+        """
+        Analyze policy using Anthropic Claude with enhanced prompting
+
+        Args:
+            policy_text: Privacy policy text
+            structure: Structural information
+            model: Model to use instead of the primary model
+
+        Returns:
+            Analysis results
+        """
+        if not self.anthropic_client:
+            raise ValueError("Anthropic client not initialized. Check API key.")
+
+        model = model or self.primary_model
+        try:
+            start_time = time.time()
+            instructions, policy_part = self._create_prompt_parts(policy_text, structure)
+
+            logger.info(f"Calling Anthropic Claude ({model})...")
+
+            content, _ = await self._request_anthropic(instructions, policy_part, model)
+            analysis_time = time.time() - start_time
+
+            # Extract JSON from response
+            result = _extract_json_object(content)
+
+            # Add metadata
+            if 'metadata' not in result:
+                result['metadata'] = {}
+
+            result['metadata'].update({
+                'analysis_date': datetime.now().isoformat(),
+                'model_used': model,
+                'provider': 'anthropic',
+                'analysis_time_seconds': round(analysis_time, 2),
+                'policy_length': len(policy_text),
+                'analysis_depth': self.analysis_depth
+            })
+
+            # Validate response
+            self._validate_analysis(result)
+
+            logger.info(f"Anthropic analysis completed in {analysis_time:.2f}s")
+            return result
+
+        except Exception as e:
+            logger.error(f"Anthropic analysis failed: {str(e)}")
+            raise
+
+    async def analyze_with_openai(self, policy_text: str, structure: Dict,
+                              model: Optional[str] = None) -> Dict:
+        """
+        Analyze policy using OpenAI with enhanced prompting
+
+        Args:
+            policy_text: Privacy policy text
+            structure: Structural information
+            model: Model to use instead of the primary model
+
+        Returns:
+            Analysis results
+        """
+        if not self.openai_client:
+            raise ValueError("OpenAI client not initialized. Check API key.")
+
+        model = model or self.primary_model
+        try:
+            start_time = time.time()
+            prompt = self._create_enhanced_prompt(policy_text, structure)
+
+            logger.info(f"Calling OpenAI ({model})...")
+
+            content, tokens_used = await self._request_openai(prompt, model)
             analysis_time = time.time() - start_time
 
-            result = json.loads(response.choices[0].message.content)
+            result = orjson.loads(content)
 
             # Add metadata
             if 'metadata' not in result:
@@ -792,12 +1480,12 @@ Use the same JSON structure as standard analysis but focus on most critical issu
 
             result['metadata'].update({
                 'analysis_date': datetime.now().isoformat(),
-                'model_used': self.primary_model,
+                'model_used': model,
                 'provider': 'openai',
                 'analysis_time_seconds': round(analysis_time, 2),
                 'policy_length': len(policy_text),
                 'analysis_depth': self.analysis_depth,
-                'tokens_used': response.usage.total_tokens if hasattr(response, 'usage') else None
+                'tokens_used': tokens_used
             })
 
             # Validate response
@@ -825,42 +1513,38 @@ Use the same JSON structure as standard analysis but focus on most critical issu
         Raises:
             ValueError if validation fails
         """
-        required_categories = [
-            'data_collection', 'data_usage', 'third_party_sharing',
-            'data_retention', 'user_rights', 'security_measures',
-            'compliance', 'older_adult_considerations'
-        ]
-
-        # Check required top-level fields
-        if 'summary' not in analysis:
-            logger.warning("Missing 'summary' field")
-
-        # Check categories
-        for category in required_categories:
-            if category not in analysis:
-                logger.warning(f"Missing category: {category}")
-                # Add empty category
-                analysis[category] = {
+        # One schema pass; only the fields it rejects are patched below
+        try:
+            AnalysisModel.model_validate(analysis)
+            errors = []
+        except ValidationError as e:
+            errors = e.errors()
+
+        for error in errors:
+            loc = error['loc']
+            field = loc[0]
+
+            if field == 'summary':
+                if error['type'] == 'missing':
+                    logger.warning("Missing 'summary' field")
+            elif len(loc) == 1:
+                # Missing category, or not an object at all
+                logger.warning(f"Missing category: {field}")
+                analysis[field] = {
                     'concerns': [],
                     'positive_aspects': [],
                     'score': 50
                 }
-
-            # Validate score
-            if 'score' in analysis[category]:
-                score = analysis[category]['score']
-                if not isinstance(score, (int, float)) or score < 0 or score > 100:
-                    logger.warning(f"Invalid score for {category}: {score}")
-                    analysis[category]['score'] = 50
+            elif loc[1] == 'score':
+                logger.warning(f"Invalid score for {field}: {analysis[field]['score']}")
+                analysis[field]['score'] = 50
 
         # Ensure red_flags and positive_practices exist
-        if 'red_flags' not in analysis:
-            analysis['red_flags'] = []
-        if 'positive_practices' not in analysis:
-            analysis['positive_practices'] = []
+        red_flags = analysis.setdefault('red_flags', [])
+        positive_practices = analysis.setdefault('positive_practices', [])
 
         # Check minimum content
-        total_items = len(analysis.get('red_flags', [])) + len(analysis.get('positive_practices', []))
+        total_items = len(red_flags) + len(positive_practices)
         if total_items < 3:
             logger.warning(f"Analysis seems sparse: only {total_items} red flags + positive practices")
 
@@ -877,7 +1561,7 @@ Use the same JSON structure as standard analysis but focus on most critical issu
         Returns:
             Comprehensive analysis results
         """
-        if not policy_text or len(policy_text.strip()) < 100:
+        if not _has_min_text(policy_text):
             logger.warning("Policy text too short or empty")
             return {
                 'error': 'Policy text too short or empty',
@@ -905,9 +1589,9 @@ Use the same JSON structure as standard analysis but focus on most critical issu
 
         if len(chunks) > 1:
             logger.info(f"Policy requires {len(chunks)} chunks for analysis")
-            analysis = self._analyze_chunks(chunks, structure)
+            analysis = self._run_async(self._analyze_chunks(chunks, structure))
         else:
-            analysis = self._analyze_single(policy_text, structure)
+            analysis = self._run_async(self._analyze_single(policy_text, structure))
 
         # Save to cache
         if not force_reanalyze and analysis and 'error' not in analysis:
@@ -915,14 +1599,31 @@ Use the same JSON structure as standard analysis but focus on most critical issu
 
         return analysis
 
-    def _analyze_single(self, policy_text: str, structure: Dict) -> Dict:
+    async def analyze_policy_async(self, policy_text: str, force_reanalyze: bool = False) -> Dict:
+        """
+        Awaitable analyze_policy for callers that already run an event loop
+
+        The cache lookup, chunking and LLM calls run without blocking the
+        caller's loop, so several policies can be analyzed with
+        asyncio.gather; their requests share this analyzer's concurrency limit.
+
+        Args:
+            policy_text: Privacy policy text to analyze
+            force_reanalyze: Bypass cache and force new analysis
+
+        Returns:
+            Comprehensive analysis results
+        """
+        return await asyncio.to_thread(self.analyze_policy, policy_text, force_reanalyze)
+
+    async def _analyze_single(self, policy_text: str, structure: Dict) -> Dict:
         """Analyze single policy (not chunked)"""
         try:
             # Try primary model
             if self.primary_provider == 'anthropic':
-                return self.analyze_with_anthropic(policy_text, structure)
+                return await self.analyze_with_anthropic(policy_text, structure)
             else:
-                return self.analyze_with_openai(policy_text, structure)
+                return await self.analyze_with_openai(policy_text, structure)
 
         except Exception as e:
             logger.error(f"Primary model failed: {str(e)}")
@@ -931,18 +1632,9 @@ Use the same JSON structure as standard analysis but focus on most critical issu
             logger.info(f"Attempting fallback to {self.fallback_provider}...")
             try:
                 if self.fallback_provider == 'anthropic':
-                    # Temporarily switch to fallback
-                    old_model = self.primary_model
-                    self.primary_model = self.fallback_model
-                    result = self.analyze_with_anthropic(policy_text, structure)
-                    self.primary_model = old_model
-                    return result
+                    return await self.analyze_with_anthropic(policy_text, structure, model=self.fallback_model)
                 else:
-                    old_model = self.primary_model
-                    self.primary_model = self.fallback_model
-                    result = self.analyze_with_openai(policy_text, structure)
-                    self.primary_model = old_model
-                    return result
+                    return await self.analyze_with_openai(policy_text, structure, model=self.fallback_model)
 
             except Exception as fallback_error:
                 logger.error(f"Fallback model also failed: {str(fallback_error)}")
@@ -955,123 +1647,175 @@ Use the same JSON structure as standard analysis but focus on most critical issu
                     }
                 }
 
-    def _analyze_chunks(self, chunks: List[Dict], structure: Dict) -> Dict:
-        """Analyze policy in chunks and synthesize results"""
-        logger.info(f"Analyzing {len(chunks)} chunks...")
+    async def analyze_chunks_async(self, chunks: List[Dict], structure: Dict) -> List[Dict]:
+        """
+        Analyze policy chunks concurrently
+
+        Requests are issued together and bounded by max_concurrency. With
+        chunk_batch_size above 1, that many chunks share each request.
+
+        Args:
+            chunks: Chunks from PolicyPreprocessor.chunk_policy
+            structure: Structural information
+
+        Returns:
+            Analyses of the chunks that succeeded, in chunk order
+        """
+        return [analysis async for analysis in self._iter_chunk_analyses(chunks, structure)]
+
+    async def _iter_chunk_analyses(self, chunks: List[Dict], structure: Dict):
+        """
+        Start every chunk request, then yield the analyses in chunk order
+
+        Results that finish early wait in their tasks until their turn, so
+        only out-of-order results are held rather than the whole list.
+        """
+        size = self.chunk_batch_size
+        if size > 1:
+            tasks = [
+                asyncio.ensure_future(self._analyze_chunk_batch(chunks[i:i + size], structure))
+                for i in range(0, len(chunks), size)
+            ]
+        else:
+            tasks = [
+                asyncio.ensure_future(self._analyze_chunks_separately([chunk], structure))
+                for chunk in chunks
+            ]
+
+        try:
+            for task in tasks:
+                for analysis in await task:
+                    yield analysis
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _analyze_chunks_separately(self, chunks: List[Dict], structure: Dict) -> List[Dict]:
+        """Analyze each chunk with its own request"""
+        results = await asyncio.gather(
+            *(self._analyze_single(chunk['text'], structure) for chunk in chunks),
+            return_exceptions=True
+        )
 
         chunk_analyses = []
-        for chunk in chunks:
-            try:
-                chunk_analysis = self._analyze_single(chunk['text'], structure)
-                chunk_analyses.append(chunk_analysis)
-            except Exception as e:
-                logger.error(f"Chunk {chunk['chunk_id']} failed: {e}")
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, Exception):
+                logger.error(f"Chunk {chunk['chunk_id']} failed: {result}")
                 continue
+            chunk_analyses.append(result)
 
-        if not chunk_analyses:
-            return {
-                'error': 'All chunks failed to analyze',
-                'summary': 'Analysis failed',
-                'metadata': {
-                    'analysis_date': datetime.now().isoformat()
-                }
-            }
+        return chunk_analyses
 
-        # Synthesize results
-        return self._synthesize_chunk_analyses(chunk_analyses)
+    async def _analyze_chunk_batch(self, batch: List[Dict], structure: Dict) -> List[Dict]:
+        """
+        Analyze several chunks with a single request to the primary model
 
-    def _synthesize_chunk_analyses(self, analyses: List[Dict]) -> Dict:
-        """Combine multiple chunk analyses into one"""
-        logger.info(f"Synthesizing {len(analyses)} chunk analyses...")
+        If the request fails or the response does not hold one analysis per
+        chunk, the chunks are analyzed separately instead.
 
-        # Combine scores (average)
-        categories = ['data_collection', 'data_usage', 'third_party_sharing',
-                     'data_retention', 'user_rights', 'security_measures',
-                     'compliance', 'older_adult_considerations']
+        Args:
+            batch: Consecutive chunks to send together
+            structure: Structural information
 
-        synthesized = {
-            'summary': ' '.join([a.get('summary', '') for a in analyses]),
-            'red_flags': [],
-            'positive_practices': [],
-            'missing_information': [],
-            'quotable_findings': [],
-            'metadata': analyses[0].get('metadata', {})
-        }
+        Returns:
+            Analyses of the chunks that succeeded, in chunk order
+        """
+        if len(batch) == 1:
+            return await self._analyze_chunks_separately(batch, structure)
 
-        # Combine category data
-        for category in categories:
-            scores = [a.get(category, {}).get('score', 50) for a in analyses if category in a]
-            avg_score = sum(scores) / len(scores) if scores else 50
+        try:
+            start_time = time.time()
+            combined = ''.join(f"\n\n<<CHUNK {i}>>\n{chunk['text']}" for i, chunk in enumerate(batch, 1))
+            instructions, policy_part = self._create_prompt_parts(combined, structure)
+            instructions += _BATCH_INSTRUCTIONS
 
-            all_concerns = []
-            all_positives = []
+            logger.info(f"Calling {self.primary_provider} ({self.primary_model}) for {len(batch)} chunks...")
 
-            for a in analyses:
-                if category in a:
-                    all_concerns.extend(a[category].get('concerns', []))
-                    all_positives.extend(a[category].get('positive_aspects', []))
+            if self.primary_provider == 'anthropic':
+                content, tokens_used = await self._request_anthropic(instructions, policy_part, self.primary_model)
+            else:
+                content, tokens_used = await self._request_openai(instructions + policy_part, self.primary_model)
+            analysis_time = time.time() - start_time
 
-            synthesized[category] = {
-                'concerns': list(set(all_concerns))[:10],  # Dedupe and limit
-                'positive_aspects': list(set(all_positives))[:10],
-                'score': round(avg_score, 0)
-            }
+            analyses = _extract_json_object(content).get('analyses')
+            if not isinstance(analyses, list) or len(analyses) != len(batch):
+                raise ValueError(f"Expected {len(batch)} analyses in batched response")
 
-            # Copy other fields from first chunk
-            if category in analyses[0]:
-                for key, value in analyses[0][category].items():
-                    if key not in ['concerns', 'positive_aspects', 'score']:
-                        synthesized[category][key] = value
+            for chunk, analysis in zip(batch, analyses):
+                if not isinstance(analysis, dict):
+                    raise ValueError("Batched response holds a non-object analysis")
 
-        # Combine red flags and positive practices
-        for a in analyses:
-            synthesized['red_flags'].extend(a.get('red_flags', []))
-            synthesized['positive_practices'].extend(a.get('positive_practices', []))
-            synthesized['missing_information'].extend(a.get('missing_information', []))
-            synthesized['quotable_findings'].extend(a.get('quotable_findings', []))
+                analysis.setdefault('metadata', {}).update({
+                    'analysis_date': datetime.now().isoformat(),
+                    'model_used': self.primary_model,
+                    'provider': self.primary_provider,
+                    'analysis_time_seconds': round(analysis_time, 2),
+                    'policy_length': len(chunk['text']),
+                    'analysis_depth': self.analysis_depth,
+                    'tokens_used': tokens_used,
+                    'chunks_in_request': len(batch)
+                })
+                self._validate_analysis(analysis)
 
-        # Calculate overall transparency score
-        all_scores = [synthesized[cat]['score'] for cat in categories if cat in synthesized]
-        synthesized['overall_transparency_score'] = round(sum(all_scores) / len(all_scores)) if all_scores else 50
-        synthesized['confidence_score'] = 75  # Lower for chunked analysis
+            return analyses
 
-        synthesized['metadata']['chunked_analysis'] = True
-        synthesized['metadata']['chunks_analyzed'] = len(analyses)
+        except Exception as e:
+            logger.warning(f"Batched analysis of {len(batch)} chunks failed, analyzing them separately: {e}")
+            return await self._analyze_chunks_separately(batch, structure)
 
-        return synthesized
+    async def _analyze_chunks(self, chunks: List[Dict], structure: Dict) -> Dict:
+        """Analyze policy in chunks and synthesize results"""
+        logger.info(f"Analyzing {len(chunks)} chunks...")
+
+        # Fold each analysis into the synthesis as soon as it is next in
+        # order, instead of collecting them all first
+        synthesizer = ChunkSynthesizer()
+        async for analysis in self._iter_chunk_analyses(chunks, structure):
+            synthesizer.fold(analysis)
+
+        if not synthesizer.chunks:
+            return {
+                'error': 'All chunks failed to analyze',
+                'summary': 'Analysis failed',
+                'metadata': {
+                    'analysis_date': datetime.now().isoformat()
+                }
+            }
+
+        logger.info(f"Synthesized {synthesizer.chunks} chunk analyses")
+        return synthesizer.finalize()
+
+    def _synthesize_chunk_analyses(self, analyses: List[Dict]) -> Dict:
+        """Combine multiple chunk analyses into one"""
+        logger.info(f"Synthesizing {len(analyses)} chunk analyses...")
 
-    def estimate_cost(self, policy_text: str) -> Dict:
+        synthesizer = ChunkSynthesizer()
+        for analysis in analyses:
+            synthesizer.fold(analysis)
+        return synthesizer.finalize()
+
+    def estimate_cost(self, policy_text: str, precise: bool = False) -> Dict:
         """
         Estimate analysis cost
 
         Args:
             policy_text: Policy text
+            precise: Count input tokens with the tokenizer instead of
+                approximating them from the text length (about 4 characters
+                per token, usually within 10% for English prose)
 
         Returns:
             Cost estimate dictionary
         """
         try:
-            encoding = tiktoken.encoding_for_model("gpt-4")
-            input_tokens = len(encoding.encode(policy_text))
+            input_tokens = _count_tokens(policy_text) if precise else max(1, len(policy_text) // 4)
 
             # Estimate output tokens based on depth
-            output_estimates = {
-                'quick': 2000,
-                'standard': 4000,
-                'deep': 8000
-            }
-            output_tokens = output_estimates.get(self.analysis_depth, 4000)
-
-            # Pricing (approximate, as of 2024)
-            pricing = {
-                'gpt-4-turbo-preview': {'input': 0.01, 'output': 0.03},  # per 1K tokens
-                'claude-sonnet-4-20250514': {'input': 0.003, 'output': 0.015}
-            }
+            output_tokens = OUTPUT_TOKEN_ESTIMATES.get(self.analysis_depth, 4000)
+            input_price, output_price = MODEL_PRICING.get(self.primary_model, DEFAULT_PRICING)
 
-            model_pricing = pricing.get(self.primary_model, {'input': 0.01, 'output': 0.03})
-
-            input_cost = (input_tokens / 1000) * model_pricing['input']
-            output_cost = (output_tokens / 1000) * model_pricing['output']
+            input_cost = (input_tokens / 1000) * input_price
+            output_cost = (output_tokens / 1000) * output_price
             total_cost = input_cost + output_cost
 
             return {
@@ -1080,7 +1824,8 @@ Use the same JSON structure as standard analysis but focus on most critical issu
                 'total_tokens': input_tokens + output_tokens,
                 'estimated_cost_usd': round(total_cost, 4),
                 'model': self.primary_model,
-                'analysis_depth': self.analysis_depth
+                'analysis_depth': self.analysis_depth,
+                'precise': precise
             }
 
         except Exception as e:
@@ -1092,13 +1837,18 @@ Use the same JSON structure as standard analysis but focus on most critical issu
 
     def get_cache_stats(self) -> Dict:
         """Get cache statistics"""
-        total = self.cache_hits + self.cache_misses
-        hit_rate = (self.cache_hits / total * 100) if total > 0 else 0
+        with self._cache_lock:
+            hits, misses = self.cache_hits, self.cache_misses
+            memory_entries = len(self._mem_cache)
+
+        total = hits + misses
+        hit_rate = (hits / total * 100) if total > 0 else 0
 
         return {
-            'cache_hits': self.cache_hits,
-            'cache_misses': self.cache_misses,
+            'cache_hits': hits,
+            'cache_misses': misses,
             'total_requests': total,
             'hit_rate_percent': round(hit_rate, 1),
+            'memory_entries': memory_entries,
             'cache_enabled': self.use_cache
         }
@@ -3,14 +3,15 @@ Comparative Analysis Module for Multi-App Privacy Policy Comparison
 Enables cross-app statistical analysis, benchmarking, and pattern detection
 """
 
-import json
+import orjson
 import numpy as np
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from collections import defaultdict, Counter
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import scipy.stats as stats
-from sklearn.cluster import KMeans
+from sklearn.cluster import MiniBatchKMeans
 from sklearn.preprocessing import StandardScaler
 from src.utils.logger import get_logger
 
@@ -20,6 +21,39 @@ logger = get_logger()
 class ComparativeAnalyzer:
     """Analyze multiple privacy policies for comparative insights"""
 
+    # Scored analysis categories (column order of the score matrix)
+    CATEGORIES = [
+        'data_collection', 'data_usage', 'third_party_sharing',
+        'data_retention', 'user_rights', 'security_measures',
+        'compliance', 'older_adult_considerations'
+    ]
+
+    # Per-app numeric metrics held as NumPy arrays after extraction
+    SCALAR_METRICS = {
+        'overall_scores': np.float64,
+        'transparency_scores': np.float64,
+        'confidence_scores': np.float64,
+        'red_flag_counts': np.int64
+    }
+
+    # Percentiles reported for each metric
+    PERCENTILES = (25, 50, 75, 90)
+
+    # Quantiles computed per metric in one np.percentile call: the reported
+    # percentiles plus 0 and 100, which give the min and max (rows of
+    # _cat_pctiles)
+    QUANTILES = (0,) + PERCENTILES + (100,)
+
+    # user_rights fields counted by the gap analysis
+    USER_RIGHTS_FEATURES = ('deletion_rights', 'portability', 'opt_out_mechanisms')
+
+    # Metric pairs reported by _calculate_correlations, as columns of the
+    # correlation input matrix built there
+    CORRELATION_PAIRS = {
+        'hipaa_vs_security': (0, 1),
+        'transparency_vs_risk': (2, 3)
+    }
+
     def __init__(self, analyses: List[Dict]):
         """
         Initialize comparative analyzer
@@ -35,6 +69,27 @@ class ComparativeAnalyzer:
         # Extract metrics for analysis
         self.metrics = self._extract_metrics()
 
+        # Apps x categories score matrix, built once so per-category
+        # statistics are column-wise NumPy reductions
+        self._score_matrix = np.array(
+            [self.metrics['category_scores'].get(c, []) for c in self.CATEGORIES],
+            dtype=np.float64
+        ).T.reshape(self.num_apps, len(self.CATEGORIES))
+
+        # Per-category scores become column views of the matrix
+        self.metrics['category_scores'] = {
+            category: self._score_matrix[:, j] for j, category in enumerate(self.CATEGORIES)
+        }
+
+        # QUANTILES x categories, shared by the category statistics and
+        # the best/worst practice thresholds
+        self._cat_pctiles = (
+            np.percentile(self._score_matrix, self.QUANTILES, axis=0) if self.num_apps else None
+        )
+
+        # Memoized result of calculate_statistics()
+        self._stats = None
+
     def _extract_metrics(self) -> Dict:
         """Extract key metrics from all analyses"""
         metrics = {
@@ -46,6 +101,9 @@ class ComparativeAnalyzer:
             'category_scores': defaultdict(list),
             'red_flags': [],
             'red_flag_counts': [],
+            'flag_descriptions': [],
+            'flag_categories': [],
+            'flag_severities': [],
             'positive_practices': [],
             'missing_info': [],
             'vague_language': [],
@@ -55,6 +113,7 @@ class ComparativeAnalyzer:
                 'business_associate_agreement': []
             },
             'retention_specified': [],
+            'user_rights_present': {key: [] for key in self.USER_RIGHTS_FEATURES},
             'readability_scores': [],
             'timestamps': []
         }
@@ -74,9 +133,7 @@ class ComparativeAnalyzer:
             metrics['confidence_scores'].append(analysis_data.get('confidence_score', 0))
 
             # Category scores
-            for category in ['data_collection', 'data_usage', 'third_party_sharing',
-                           'data_retention', 'user_rights', 'security_measures',
-                           'compliance', 'older_adult_considerations']:
+            for category in self.CATEGORIES:
                 score = analysis_data.get(category, {}).get('score', 0)
                 metrics['category_scores'][category].append(score)
 
@@ -84,14 +141,21 @@ class ComparativeAnalyzer:
             red_flags = scoring_data.get('red_flags', [])
             metrics['red_flags'].append(red_flags)
             metrics['red_flag_counts'].append(len(red_flags))
+            for flag in red_flags:
+                if isinstance(flag, dict):
+                    metrics['flag_descriptions'].append(flag.get('description', str(flag)))
+                    metrics['flag_categories'].append(flag.get('category', 'Unknown'))
+                    metrics['flag_severities'].append(flag.get('severity', 'unknown'))
+                else:
+                    metrics['flag_descriptions'].append(str(flag))
 
             # Positive practices
             metrics['positive_practices'].append(
                 analysis_data.get('positive_practices', [])
             )
 
-            # Missing information
-            metrics['missing_info'].append(
+            # Missing information, flattened across apps for gap counting
+            metrics['missing_info'].extend(
                 analysis_data.get('missing_information', [])
             )
 
@@ -118,10 +182,16 @@ class ComparativeAnalyzer:
                 retention.get('duration_specified', False)
             )
 
+            # User rights features that are meaningfully described
+            user_rights = analysis_data.get('user_rights', {})
+            for key, present in metrics['user_rights_present'].items():
+                feature_value = user_rights.get(key, '')
+                present.append(bool(feature_value) and len(str(feature_value).strip()) > 5)
+
             # Readability
             older_adult = analysis_data.get('older_adult_considerations', {})
             readability = older_adult.get('readability_score', 'Unknown')
-            metrics['readability_scores'].append(readability)
+            metrics['readability_scores'].append(str(readability))
 
             # Timestamp
             metadata = analysis_data.get('metadata', {})
@@ -129,10 +199,34 @@ class ComparativeAnalyzer:
                 metadata.get('analysis_date', datetime.now().isoformat())
             )
 
+        for key, dtype in self.SCALAR_METRICS.items():
+            metrics[key] = np.asarray(metrics[key], dtype=dtype)
+        metrics['compliance_flags'] = {
+            key: np.asarray(flags, dtype=bool)
+            for key, flags in metrics['compliance_flags'].items()
+        }
+        metrics['retention_specified'] = np.asarray(metrics['retention_specified'], dtype=bool)
+        metrics['readability_scores'] = np.asarray(metrics['readability_scores'], dtype=str)
+        metrics['user_rights_present'] = {
+            key: np.asarray(present, dtype=bool)
+            for key, present in metrics['user_rights_present'].items()
+        }
+
         return metrics
 
     def calculate_statistics(self) -> Dict:
-        """Calculate comprehensive statistics across all apps"""
+        """
+        Calculate comprehensive statistics across all apps
+
+        The analyses are fixed at construction, so the result is computed
+        once and returned on later calls.
+        """
+        if self._stats is None:
+            self._stats = self._compute_statistics()
+        return self._stats
+
+    def _compute_statistics(self) -> Dict:
+        """Run every statistics pass over the loaded analyses"""
         logger.info("Calculating comparative statistics")
 
         stats_results = {
@@ -143,7 +237,7 @@ class ComparativeAnalyzer:
             'overall_risk': self._calculate_metric_stats(self.metrics['overall_scores']),
             'transparency': self._calculate_metric_stats(self.metrics['transparency_scores']),
             'confidence': self._calculate_metric_stats(self.metrics['confidence_scores']),
-            'category_stats': {},
+            'category_stats': self._calculate_category_stats(),
             'red_flag_stats': self._analyze_red_flags(),
             'compliance_stats': self._analyze_compliance(),
             'gap_analysis': self._perform_gap_analysis(),
@@ -152,31 +246,52 @@ class ComparativeAnalyzer:
             'clusters': self._perform_clustering()
         }
 
-        # Category-specific statistics
-        for category, scores in self.metrics['category_scores'].items():
-            stats_results['category_stats'][category] = self._calculate_metric_stats(scores)
-
         return stats_results
 
-    def _calculate_metric_stats(self, values: List[float]) -> Dict:
+    def _calculate_metric_stats(self, values: np.ndarray) -> Dict:
         """Calculate statistics for a metric"""
-        if not values:
+        if values.size == 0:
             return {}
 
-        values_array = np.array(values)
+        return self._stats_from_quantiles(
+            values.mean(), values.std(), np.percentile(values, self.QUANTILES)
+        )
+
+    def _stats_from_quantiles(self, mean: float, std: float, quantiles: np.ndarray) -> Dict:
+        """
+        Build a metric's statistics dict
+
+        Args:
+            mean: Metric mean
+            std: Metric standard deviation
+            quantiles: Values at QUANTILES; the median, min and max are read from them
+
+        Returns:
+            Statistics dictionary
+        """
+        q = dict(zip(self.QUANTILES, quantiles.tolist()))
 
         return {
-            'mean': float(np.mean(values_array)),
-            'median': float(np.median(values_array)),
-            'std': float(np.std(values_array)),
-            'min': float(np.min(values_array)),
-            'max': float(np.max(values_array)),
-            'percentiles': {
-                '25': float(np.percentile(values_array, 25)),
-                '50': float(np.percentile(values_array, 50)),
-                '75': float(np.percentile(values_array, 75)),
-                '90': float(np.percentile(values_array, 90))
-            }
+            'mean': float(mean),
+            'median': q[50],
+            'std': float(std),
+            'min': q[0],
+            'max': q[100],
+            'percentiles': {str(p): q[p] for p in self.PERCENTILES}
+        }
+
+    def _calculate_category_stats(self) -> Dict:
+        """Calculate statistics for every category in one pass over the score matrix"""
+        if self.num_apps == 0:
+            return {}
+
+        matrix = self._score_matrix
+        means = matrix.mean(axis=0)
+        stds = matrix.std(axis=0)
+
+        return {
+            category: self._stats_from_quantiles(means[j], stds[j], self._cat_pctiles[:, j])
+            for j, category in enumerate(self.CATEGORIES)
         }
 
     def _get_date_range(self) -> Dict:
@@ -192,46 +307,32 @@ class ComparativeAnalyzer:
 
     def _analyze_red_flags(self) -> Dict:
         """Analyze red flag patterns across apps"""
-        all_flags = []
-        flag_by_category = defaultdict(list)
-        flag_by_severity = defaultdict(int)
-
-        for app_flags in self.metrics['red_flags']:
-            for flag in app_flags:
-                if isinstance(flag, dict):
-                    desc = flag.get('description', str(flag))
-                    category = flag.get('category', 'Unknown')
-                    severity = flag.get('severity', 'unknown')
-
-                    all_flags.append(desc)
-                    flag_by_category[category].append(desc)
-                    flag_by_severity[severity] += 1
-                else:
-                    all_flags.append(str(flag))
+        all_flags = self.metrics['flag_descriptions']
 
         # Count frequencies
         flag_counter = Counter(all_flags)
+        flag_by_category = Counter(self.metrics['flag_categories'])
+        flag_by_severity = Counter(self.metrics['flag_severities'])
 
         return {
             'total_flags': len(all_flags),
-            'unique_flags': len(set(all_flags)),
+            'unique_flags': len(flag_counter),
             'avg_per_app': len(all_flags) / self.num_apps if self.num_apps > 0 else 0,
             'most_common': [
                 {'flag': flag, 'count': count, 'percentage': (count / self.num_apps) * 100}
                 for flag, count in flag_counter.most_common(10)
             ],
             'by_severity': dict(flag_by_severity),
-            'by_category': {
-                cat: len(flags) for cat, flags in flag_by_category.items()
-            }
+            'by_category': dict(flag_by_category)
         }
 
     def _analyze_compliance(self) -> Dict:
         """Analyze compliance patterns"""
-        hipaa_count = sum(self.metrics['compliance_flags']['hipaa_mentioned'])
-        gdpr_count = sum(self.metrics['compliance_flags']['gdpr_mentioned'])
-        baa_count = sum(self.metrics['compliance_flags']['business_associate_agreement'])
-        retention_count = sum(self.metrics['retention_specified'])
+        compliance_flags = self.metrics['compliance_flags']
+        hipaa_count = int(compliance_flags['hipaa_mentioned'].sum())
+        gdpr_count = int(compliance_flags['gdpr_mentioned'].sum())
+        baa_count = int(compliance_flags['business_associate_agreement'].sum())
+        retention_count = int(self.metrics['retention_specified'].sum())
 
         return {
             'hipaa_mentioned': {
@@ -254,12 +355,7 @@ class ComparativeAnalyzer:
 
     def _perform_gap_analysis(self) -> Dict:
         """Identify common gaps across all apps"""
-        # Collect all missing information
-        all_missing = []
-        for missing_list in self.metrics['missing_info']:
-            all_missing.extend(missing_list)
-
-        missing_counter = Counter(all_missing)
+        missing_counter = Counter(self.metrics['missing_info'])
 
         return {
             'common_gaps': [
@@ -277,15 +373,7 @@ class ComparativeAnalyzer:
 
     def _count_feature(self, feature_key: str) -> Dict:
         """Count how many apps have a specific feature"""
-        count = 0
-        for analysis in self.analyses:
-            analysis_data = analysis.get('analysis', {})
-            user_rights = analysis_data.get('user_rights', {})
-            feature_value = user_rights.get(feature_key, '')
-
-            # Check if feature is meaningfully present
-            if feature_value and len(str(feature_value).strip()) > 5:
-                count += 1
+        count = int(self.metrics['user_rights_present'][feature_key].sum())
 
         return {
             'count': count,
@@ -296,29 +384,31 @@ class ComparativeAnalyzer:
         """Calculate correlations between metrics"""
         correlations = {}
 
-        # Correlation between HIPAA mention and security score
-        if len(self.metrics['compliance_flags']['hipaa_mentioned']) > 2:
-            hipaa_binary = [1 if x else 0 for x in self.metrics['compliance_flags']['hipaa_mentioned']]
-            security_scores = self.metrics['category_scores'].get('security_measures', [])
-
-            if len(security_scores) == len(hipaa_binary):
-                corr, pval = stats.pointbiserialr(hipaa_binary, security_scores)
-                correlations['hipaa_vs_security'] = {
-                    'correlation': float(corr),
-                    'p_value': float(pval),
-                    'significant': pval < 0.05
-                }
-
-        # Correlation between transparency and overall risk
-        if len(self.metrics['transparency_scores']) > 2:
-            corr, pval = stats.pearsonr(
-                self.metrics['transparency_scores'],
-                self.metrics['overall_scores']
-            )
-            correlations['transparency_vs_risk'] = {
-                'correlation': float(corr),
-                'p_value': float(pval),
-                'significant': pval < 0.05
+        n = self.num_apps
+        if n <= 2:
+            return correlations
+
+        # HIPAA mention (0/1), security score, transparency, overall risk.
+        # Point-biserial correlation is Pearson's r with a binary variable,
+        # so one corrcoef call covers both pairs
+        metrics = np.column_stack([
+            self.metrics['compliance_flags']['hipaa_mentioned'].astype(np.float64),
+            self.metrics['category_scores']['security_measures'],
+            self.metrics['transparency_scores'],
+            self.metrics['overall_scores']
+        ])
+
+        # Constant columns give NaN, as pearsonr does
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = np.corrcoef(metrics, rowvar=False)
+            t = corr * np.sqrt((n - 2) / (1 - corr ** 2))
+        p_values = 2 * stats.t.sf(np.abs(t), n - 2)
+
+        for name, (i, j) in self.CORRELATION_PAIRS.items():
+            correlations[name] = {
+                'correlation': float(corr[i, j]),
+                'p_value': float(p_values[i, j]),
+                'significant': bool(p_values[i, j] < 0.05)
             }
 
         return correlations
@@ -346,146 +436,143 @@ class ComparativeAnalyzer:
 
         return rankings
 
-    def _rank_by_metric(self, values: List[float], higher_is_better: bool = True) -> List[Dict]:
+    def _rank_by_metric(self, values: np.ndarray, higher_is_better: bool = True) -> List[Dict]:
         """Rank apps by a specific metric"""
-        if not values:
+        if values.size == 0:
             return []
 
-        # Create list of (app_name, value) tuples
-        app_values = list(zip(self.metrics['app_names'], values))
+        # Stable sort, so tied apps keep their input order
+        order = np.argsort(-values if higher_is_better else values, kind='stable')
 
-        # Sort
-        app_values.sort(key=lambda x: x[1], reverse=higher_is_better)
+        # Average ranks give percentileofscore(values, value) (kind='rank')
+        # for every app at once: with left/right the counts below and at or
+        # below a value, its average rank is (left + right + 1) / 2
+        percentiles = stats.rankdata(values, method='average') * 2 * (50.0 / values.size)
 
-        # Add ranks
-        ranked = []
-        for rank, (app_name, value) in enumerate(app_values, 1):
-            # Calculate percentile
-            percentile = stats.percentileofscore(values, value)
-
-            ranked.append({
+        app_names = self.metrics['app_names']
+        return [
+            {
                 'rank': rank,
-                'app_name': app_name,
-                'value': float(value),
-                'percentile': float(percentile)
-            })
-
-        return ranked
+                'app_name': app_names[i],
+                'value': float(values[i]),
+                'percentile': float(percentiles[i])
+            }
+            for rank, i in enumerate(order.tolist(), 1)
+        ]
 
     def _perform_clustering(self) -> Dict:
         """Perform clustering analysis to group similar apps"""
         if self.num_apps < 3:
             return {'clusters': [], 'note': 'Insufficient data for clustering'}
 
-        # Prepare feature matrix
-        features = []
-        for i in range(self.num_apps):
-            app_features = [
-                self.metrics['overall_scores'][i],
-                self.metrics['transparency_scores'][i],
-                self.metrics['red_flag_counts'][i],
-            ]
-
-            # Add category scores
-            for category in ['data_collection', 'data_usage', 'third_party_sharing',
-                           'data_retention', 'user_rights', 'security_measures']:
-                app_features.append(self.metrics['category_scores'][category][i])
+        # Prepare feature matrix: overall, transparency, red flag count and
+        # the first six category columns of the score matrix. column_stack
+        # promotes the integer counts while copying, so no separate cast
+        features = np.column_stack([
+            self.metrics['overall_scores'],
+            self.metrics['transparency_scores'],
+            self.metrics['red_flag_counts'],
+            self._score_matrix[:, :6]
+        ])
 
-            features.append(app_features)
-
-        # Standardize features
-        scaler = StandardScaler()
-        features_scaled = scaler.fit_transform(features)
+        # Standardize features in place: the stacked matrix is already a
+        # private copy
+        features_scaled = StandardScaler(copy=False).fit_transform(features)
 
         # Determine optimal number of clusters (2-4 for small datasets)
         n_clusters = min(3, max(2, self.num_apps // 2))
 
-        # Perform K-means clustering
-        kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10)
-        cluster_labels = kmeans.fit_predict(features_scaled)
+        # Perform K-means clustering; mini-batches keep each iteration's cost
+        # independent of the corpus size once it exceeds the batch size
+        kmeans = MiniBatchKMeans(
+            n_clusters=n_clusters, random_state=42, n_init=3,
+            batch_size=min(256, self.num_apps)
+        ).fit(features_scaled)
+        cluster_labels = kmeans.labels_
+
+        # Group app indices by label: a stable sort puts each cluster's
+        # members together, and the label counts give the split points
+        order = np.argsort(cluster_labels, kind='stable')
+        sizes = np.bincount(cluster_labels, minlength=n_clusters)
+        members = np.split(order, np.cumsum(sizes)[:-1])
 
-        # Organize results
-        clusters = defaultdict(list)
-        for i, label in enumerate(cluster_labels):
-            clusters[int(label)].append({
-                'app_name': self.metrics['app_names'][i],
-                'overall_score': self.metrics['overall_scores'][i]
-            })
+        overall_scores = self.metrics['overall_scores']
 
         return {
             'n_clusters': n_clusters,
             'clusters': [
                 {
                     'cluster_id': cluster_id,
-                    'size': len(apps),
-                    'apps': apps,
-                    'avg_score': np.mean([app['overall_score'] for app in apps])
+                    'size': int(sizes[cluster_id]),
+                    'apps': [
+                        {
+                            'app_name': self.metrics['app_names'][i],
+                            'overall_score': float(overall_scores[i])
+                        }
+                        for i in indices
+                    ],
+                    'avg_score': float(overall_scores[indices].mean())
                 }
-                for cluster_id, apps in clusters.items()
+                for cluster_id, indices in enumerate(members)
+                if sizes[cluster_id]
             ]
         }
 
-    def identify_best_practices(self) -> Dict:
-        """Identify best-in-class practices for each category"""
-        logger.info("Identifying best practices")
-
-        best_practices = {}
-
-        # For each category, find top performers
-        for category, scores in self.metrics['category_scores'].items():
-            if not scores:
-                continue
+    def identify_practices(self) -> Dict:
+        """
+        Identify best and worst practices for each category in one pass
 
-            # Find apps with scores in top 25%
-            threshold = np.percentile(scores, 75)
-            top_performers = []
+        Apps scoring at or above a category's 75th percentile are best
+        practices; apps at or below its 25th percentile are worst practices.
 
-            for i, score in enumerate(scores):
-                if score >= threshold:
-                    app_name = self.metrics['app_names'][i]
-                    analysis = self.analyses[i].get('analysis', {})
-                    category_data = analysis.get(category, {})
+        Returns:
+            Dictionary with 'best' and 'worst' per-category app lists
+        """
+        logger.info("Identifying best and worst practices")
 
-                    top_performers.append({
-                        'app_name': app_name,
-                        'score': float(score),
-                        'positive_aspects': category_data.get('positive_aspects', [])
-                    })
+        practices = {'best': {}, 'worst': {}}
 
-            best_practices[category] = top_performers
+        if self.num_apps == 0:
+            return practices
 
-        return best_practices
+        # Compare the whole score matrix against each category's quartile
+        # thresholds at once
+        top_mask = self._score_matrix >= self._cat_pctiles[self.QUANTILES.index(75)]
+        bottom_mask = self._score_matrix <= self._cat_pctiles[self.QUANTILES.index(25)]
 
-    def identify_worst_practices(self) -> Dict:
-        """Identify concerning practices that need attention"""
-        logger.info("Identifying worst practices")
+        for j, category in enumerate(self.CATEGORIES):
+            scores = self._score_matrix[:, j]
+            best, worst = [], []
 
-        worst_practices = {}
+            for i in np.flatnonzero(top_mask[:, j] | bottom_mask[:, j]):
+                category_data = self.analyses[i].get('analysis', {}).get(category, {})
+                app_name = self.metrics['app_names'][i]
 
-        # For each category, find bottom performers
-        for category, scores in self.metrics['category_scores'].items():
-            if not scores:
-                continue
-
-            # Find apps with scores in bottom 25%
-            threshold = np.percentile(scores, 25)
-            poor_performers = []
-
-            for i, score in enumerate(scores):
-                if score <= threshold:
-                    app_name = self.metrics['app_names'][i]
-                    analysis = self.analyses[i].get('analysis', {})
-                    category_data = analysis.get(category, {})
-
-                    poor_performers.append({
+                if top_mask[i, j]:
+                    best.append({
                         'app_name': app_name,
-                        'score': float(score),
+                        'score': float(scores[i]),
+                        'positive_aspects': category_data.get('positive_aspects', [])
+                    })
+                if bottom_mask[i, j]:
+                    worst.append({
+                        'app_name': app_name,
+                        'score': float(scores[i]),
                         'concerns': category_data.get('concerns', [])
                     })
 
-            worst_practices[category] = poor_performers
+            practices['best'][category] = best
+            practices['worst'][category] = worst
 
-        return worst_practices
+        return practices
+
+    def identify_best_practices(self) -> Dict:
+        """Identify best-in-class practices for each category"""
+        return self.identify_practices()['best']
+
+    def identify_worst_practices(self) -> Dict:
+        """Identify concerning practices that need attention"""
+        return self.identify_practices()['worst']
 
     def extract_research_quotes(self) -> Dict:
         """Extract all quotable findings organized by theme"""
@@ -514,6 +601,8 @@ class ComparativeAnalyzer:
         """Generate comprehensive comparative analysis report"""
         logger.info("Generating comprehensive comparative report")
 
+        practices = self.identify_practices()
+
         report = {
             'metadata': {
                 'generated_at': datetime.now().isoformat(),
@@ -521,8 +610,8 @@ class ComparativeAnalyzer:
                 'app_names': self.metrics['app_names']
             },
             'statistics': self.calculate_statistics(),
-            'best_practices': self.identify_best_practices(),
-            'worst_practices': self.identify_worst_practices(),
+            'best_practices': practices['best'],
+            'worst_practices': practices['worst'],
             'research_quotes': self.extract_research_quotes(),
             'recommendations': self._generate_recommendations()
         }
@@ -534,7 +623,7 @@ class ComparativeAnalyzer:
         recommendations = []
 
         # Check HIPAA compliance
-        hipaa_pct = (sum(self.metrics['compliance_flags']['hipaa_mentioned']) / self.num_apps) * 100
+        hipaa_pct = (int(self.metrics['compliance_flags']['hipaa_mentioned'].sum()) / self.num_apps) * 100
         if hipaa_pct < 50:
             recommendations.append(
                 f"Only {hipaa_pct:.1f}% of apps explicitly mention HIPAA compliance. "
@@ -542,7 +631,7 @@ class ComparativeAnalyzer:
             )
 
         # Check retention policies
-        retention_pct = (sum(self.metrics['retention_specified']) / self.num_apps) * 100
+        retention_pct = (int(self.metrics['retention_specified'].sum()) / self.num_apps) * 100
         if retention_pct < 70:
             recommendations.append(
                 f"Only {retention_pct:.1f}% of apps specify data retention periods. "
@@ -550,7 +639,8 @@ class ComparativeAnalyzer:
             )
 
         # Check readability
-        complex_count = sum(1 for r in self.metrics['readability_scores'] if 'college' in str(r).lower())
+        readability = np.char.lower(self.metrics['readability_scores'])
+        complex_count = int((np.char.find(readability, 'college') >= 0).sum())
         if complex_count > self.num_apps * 0.5:
             recommendations.append(
                 f"{complex_count} apps use college-level language. "
@@ -558,7 +648,8 @@ class ComparativeAnalyzer:
             )
 
         # Check average transparency
-        avg_transparency = np.mean(self.metrics['transparency_scores']) if self.metrics['transparency_scores'] else 0
+        transparency = self.metrics['transparency_scores']
+        avg_transparency = transparency.mean() if transparency.size else 0
         if avg_transparency < 60:
             recommendations.append(
                 f"Average transparency score is {avg_transparency:.1f}/100. "
@@ -568,12 +659,31 @@ class ComparativeAnalyzer:
         return recommendations
 
 
-def load_analyses_from_directory(directory: str) -> List[Dict]:
+# Top-level report fields read by comparative analysis and the dataset
+# exports; the rest (scraped policy text, generated file paths) is dropped
+REPORT_FIELDS = ('app_name', 'url', 'category', 'notes', 'analysis', 'scoring', 'timestamp')
+
+
+def _load_report(json_file: Path) -> Optional[Dict]:
+    """Parse one JSON report down to REPORT_FIELDS, returning None if it cannot be loaded"""
+    try:
+        data = orjson.loads(json_file.read_bytes())
+        if not isinstance(data, dict):
+            raise ValueError("report is not a JSON object")
+        logger.debug(f"Loaded: {json_file.name}")
+        return {key: data[key] for key in REPORT_FIELDS if key in data}
+    except Exception as e:
+        logger.error(f"Failed to load {json_file}: {e}")
+        return None
+
+
+def load_analyses_from_directory(directory: str, max_workers: int = 16) -> List[Dict]:
     """
     Load all JSON analysis files from a directory
 
     Args:
         directory: Path to directory containing JSON files
+        max_workers: Number of threads reading files concurrently
 
     Returns:
         List of analysis dictionaries
@@ -588,14 +698,108 @@ def load_analyses_from_directory(directory: str) -> List[Dict]:
     json_files = list(dir_path.glob("*_report_*.json"))
     logger.info(f"Found {len(json_files)} JSON reports in {directory}")
 
-    for json_file in json_files:
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                analyses.append(data)
-                logger.debug(f"Loaded: {json_file.name}")
-        except Exception as e:
-            logger.error(f"Failed to load {json_file}: {e}")
+    # File reads release the GIL, so a thread pool overlaps the disk I/O
+    if json_files:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(json_files))) as executor:
+            loaded = list(executor.map(_load_report, json_files))
+        analyses = [data for data in loaded if data is not None]
 
     logger.info(f"Successfully loaded {len(analyses)} analyses")
     return analyses
+
+
+# Flat one-row-per-app table kept next to the JSON reports
+SUMMARY_FILENAME = 'summary.parquet'
+
+
+def summary_row(analysis: Dict) -> Dict:
+    """
+    Flatten one report into typed summary columns
+
+    Args:
+        analysis: Complete analysis result (from a JSON report)
+
+    Returns:
+        Row of app info (name, URL, category), scores, red flag count and
+        compliance flags
+    """
+    analysis_data = analysis.get('analysis', {})
+    scoring_data = analysis.get('scoring', {})
+    compliance = analysis_data.get('compliance', {})
+
+    row = {
+        'app_name': analysis.get('app_name', ''),
+        'url': analysis.get('url', ''),
+        'category': analysis.get('category', ''),
+        'overall_score': float(scoring_data.get('overall_score', 0)),
+        'transparency_score': float(analysis_data.get('overall_transparency_score', 0)),
+        'confidence_score': float(analysis_data.get('confidence_score', 0)),
+        'red_flag_count': len(scoring_data.get('red_flags', []))
+    }
+    for category in ComparativeAnalyzer.CATEGORIES:
+        row[category] = float(analysis_data.get(category, {}).get('score', 0))
+
+    row['hipaa_mentioned'] = bool(compliance.get('hipaa_mentioned', False))
+    row['gdpr_mentioned'] = bool(compliance.get('gdpr_mentioned', False))
+    row['retention_specified'] = bool(
+        analysis_data.get('data_retention', {}).get('duration_specified', False)
+    )
+
+    return row
+
+
+def write_summary_table(analyses: List[Dict], directory: str) -> Optional[str]:
+    """
+    Write the Parquet summary table for a reports directory
+
+    Args:
+        analyses: Complete analysis results to summarize
+        directory: Reports directory the table is written to
+
+    Returns:
+        Path to the written table, or None if pandas/pyarrow are unavailable
+    """
+    try:
+        import pandas as pd
+
+        summary_path = Path(directory) / SUMMARY_FILENAME
+        pd.DataFrame([summary_row(a) for a in analyses]).to_parquet(
+            summary_path, engine='pyarrow', index=False
+        )
+    except ImportError:
+        logger.warning("pandas/pyarrow not available, skipping Parquet summary")
+        return None
+
+    logger.info(f"Summary table written: {summary_path}")
+    return str(summary_path)
+
+
+def load_summary_table(directory: str):
+    """
+    Load the one-row-per-app summary table for a reports directory
+
+    Reads summary.parquet when it is newer than every JSON report;
+    otherwise rebuilds it from the reports first.
+
+    Args:
+        directory: Path to directory containing JSON reports
+
+    Returns:
+        pandas DataFrame with one row per app
+    """
+    import pandas as pd
+
+    dir_path = Path(directory)
+    summary_path = dir_path / SUMMARY_FILENAME
+    report_mtimes = [p.stat().st_mtime_ns for p in dir_path.glob("*_report_*.json")]
+
+    if summary_path.exists() and summary_path.stat().st_mtime_ns >= max(report_mtimes, default=0):
+        logger.info(f"Loading summary table: {summary_path}")
+        return pd.read_parquet(summary_path, engine='pyarrow')
+
+    analyses = load_analyses_from_directory(directory)
+    if analyses and write_summary_table(analyses, directory):
+        # Read back so both paths return the same dtypes
+        return pd.read_parquet(summary_path, engine='pyarrow')
+
+    return pd.DataFrame([summary_row(a) for a in analyses])
@@ -1,6 +1,7 @@
 """Report generation module with multiple output formats"""
 
 import json
+import threading
 from typing import Dict, List
 from pathlib import Path
 from datetime import datetime
@@ -12,6 +13,10 @@ from src.utils.file_handler import FileHandler
 
 logger = get_logger()
 
+# pyplot's figure registry and seaborn's style are process-global, so
+# concurrent analyses draw their charts one at a time
+_PYPLOT_LOCK = threading.Lock()
+
 
 class ReportGenerator:
     """Generate comprehensive reports in multiple formats"""
@@ -98,6 +103,11 @@ class ReportGenerator:
             List of created file paths
         """
         logger.info("Creating visualizations")
+        with _PYPLOT_LOCK:
+            return self._draw_charts(app_name, scoring)
+
+    def _draw_charts(self, app_name: str, scoring: Dict) -> List[str]:
+        """Draw and save the category and gauge charts (caller holds _PYPLOT_LOCK)"""
         viz_dir = self.paths.get('visualizations', 'outputs/visualizations')
         created_files = []
 
@@ -165,10 +175,10 @@ class ReportGenerator:
         for i, v in enumerate(scores):
             ax.text(v + 0.02, i, f'{v:.2f}', va='center', fontsize=10)
 
-        plt.tight_layout()
+        fig.tight_layout()
         bar_chart_path = f"{viz_dir}/{app_name}_category_scores_{timestamp}.png"
-        plt.savefig(bar_chart_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(bar_chart_path, dpi=300, bbox_inches='tight')
+        plt.close(fig)
         created_files.append(bar_chart_path)
         logger.info(f"Created bar chart: {bar_chart_path}")
 
@@ -195,10 +205,10 @@ class ReportGenerator:
         ax.legend(loc='upper right')
         ax.set_yticks([])
 
-        plt.tight_layout()
+        fig.tight_layout()
         gauge_path = f"{viz_dir}/{app_name}_risk_gauge_{timestamp}.png"
-        plt.savefig(gauge_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(gauge_path, dpi=300, bbox_inches='tight')
+        plt.close(fig)
         created_files.append(gauge_path)
         logger.info(f"Created gauge chart: {gauge_path}")
 
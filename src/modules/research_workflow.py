@@ -16,7 +16,10 @@ from src.modules.scraper import PolicyScraper
 from src.modules.analyzer import PolicyAnalyzer
 from src.modules.scorer import RiskScorer
 from src.modules.reporter import ReportGenerator
-from src.modules.comparative_analyzer import ComparativeAnalyzer, load_analyses_from_directory
+from src.modules.comparative_analyzer import (
+    ComparativeAnalyzer, load_analyses_from_directory, load_summary_table,
+    summary_row, write_summary_table
+)
 from src.utils.logger import get_logger
 from src.utils.file_handler import FileHandler
 from src.utils.validator import AnalysisValidator
@@ -298,6 +301,14 @@ class ResearchWorkflow:
         self.file_handler.save_json(summary, str(self.output_dir / 'batch_summary.json'))
 
         self.analyses = results
+
+        # Refresh the Parquet summary so statistics exports skip JSON parsing.
+        # A resumed batch only returns this run's results, so rebuild from
+        # every report on disk in that case
+        write_summary_table(
+            load_analyses_from_directory(str(self.reports_dir)) if completed_names else results,
+            str(self.reports_dir)
+        )
         logger.info(f"Batch analysis complete: {len(results)}/{len(apps_to_process)} successful")
 
         return results
@@ -478,63 +489,37 @@ This study analyzed {metadata['num_apps_analyzed']} healthcare application priva
         Returns:
             Dictionary mapping format to file path
         """
+        import pandas as pd
+
         logger.info(f"Exporting statistics in formats: {formats}")
 
         exports = {}
 
-        # Load analyses if not in memory
-        if not self.analyses:
-            self.analyses = load_analyses_from_directory(str(self.reports_dir))
+        # One row per app: built from the analyses in memory, otherwise read
+        # from the reports directory's summary.parquet instead of the JSON
+        if self.analyses:
+            summary = pd.DataFrame([summary_row(a) for a in self.analyses])
+        else:
+            summary = load_summary_table(str(self.reports_dir))
 
-        if not self.analyses:
+        if summary.empty:
             raise ValueError("No analyses available for export")
 
+        categories = ComparativeAnalyzer.CATEGORIES
+
         # CSV Export (wide format)
         if 'csv' in formats:
             csv_path = self.stats_dir / f"dataset_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
 
-            with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-                # Determine all columns
-                fieldnames = ['app_name', 'url', 'category', 'overall_score', 'transparency_score',
-                            'confidence_score', 'red_flag_count']
-
-                # Add category columns
-                categories = ['data_collection', 'data_usage', 'third_party_sharing',
-                            'data_retention', 'user_rights', 'security_measures',
-                            'compliance', 'older_adult_considerations']
-                fieldnames.extend(categories)
-
-                # Add compliance flags
-                fieldnames.extend(['hipaa_mentioned', 'gdpr_mentioned', 'retention_specified'])
-
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-
-                for analysis in self.analyses:
-                    row = {
-                        'app_name': analysis.get('app_name', ''),
-                        'url': analysis.get('url', ''),
-                        'category': analysis.get('category', ''),
-                        'overall_score': analysis.get('scoring', {}).get('overall_score', 0),
-                        'transparency_score': analysis.get('analysis', {}).get('overall_transparency_score', 0),
-                        'confidence_score': analysis.get('analysis', {}).get('confidence_score', 0),
-                        'red_flag_count': len(analysis.get('scoring', {}).get('red_flags', []))
-                    }
-
-                    # Add category scores
-                    analysis_data = analysis.get('analysis', {})
-                    for cat in categories:
-                        row[cat] = analysis_data.get(cat, {}).get('score', 0)
-
-                    # Add compliance flags
-                    compliance = analysis_data.get('compliance', {})
-                    row['hipaa_mentioned'] = 1 if compliance.get('hipaa_mentioned') else 0
-                    row['gdpr_mentioned'] = 1 if compliance.get('gdpr_mentioned') else 0
+            fieldnames = ['app_name', 'url', 'category', 'overall_score', 'transparency_score',
+                        'confidence_score', 'red_flag_count']
+            fieldnames.extend(categories)
+            fieldnames.extend(['hipaa_mentioned', 'gdpr_mentioned', 'retention_specified'])
 
-                    retention = analysis_data.get('data_retention', {})
-                    row['retention_specified'] = 1 if retention.get('duration_specified') else 0
-
-                    writer.writerow(row)
+            # Compliance flags are written as 0/1
+            summary[fieldnames].astype({
+                'hipaa_mentioned': int, 'gdpr_mentioned': int, 'retention_specified': int
+            }).to_csv(csv_path, index=False, encoding='utf-8')
 
             exports['csv'] = str(csv_path)
             logger.info(f"CSV exported: {csv_path}")
@@ -542,37 +527,27 @@ This study analyzed {metadata['num_apps_analyzed']} healthcare application priva
         # Excel Export
         if 'excel' in formats:
             try:
-                import pandas as pd
-
                 excel_path = self.stats_dir / f"analysis_workbook_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
 
                 with pd.ExcelWriter(excel_path, engine='xlsxwriter') as writer:
                     # Sheet 1: Summary data (same as CSV)
-                    df_data = []
-                    for analysis in self.analyses:
-                        row = {
-                            'App Name': analysis.get('app_name', ''),
-                            'URL': analysis.get('url', ''),
-                            'Category': analysis.get('category', ''),
-                            'Overall Score': analysis.get('scoring', {}).get('overall_score', 0),
-                            'Transparency': analysis.get('analysis', {}).get('overall_transparency_score', 0),
-                            'Red Flags': len(analysis.get('scoring', {}).get('red_flags', []))
-                        }
-
-                        # Add category scores
-                        analysis_data = analysis.get('analysis', {})
-                        for cat in categories:
-                            col_name = cat.replace('_', ' ').title()
-                            row[col_name] = analysis_data.get(cat, {}).get('score', 0)
-
-                        df_data.append(row)
-
-                    df_summary = pd.DataFrame(df_data)
+                    columns = {
+                        'app_name': 'App Name',
+                        'url': 'URL',
+                        'category': 'Category',
+                        'overall_score': 'Overall Score',
+                        'transparency_score': 'Transparency',
+                        'red_flag_count': 'Red Flags'
+                    }
+                    columns.update({cat: cat.replace('_', ' ').title() for cat in categories})
+                    df_summary = summary[list(columns)].rename(columns=columns)
                     df_summary.to_excel(writer, sheet_name='Summary', index=False)
 
-                    # Sheet 2: Red Flags
+                    # Sheet 2: Red Flags. The individual flags are not in the
+                    # summary table, so this sheet reads the full reports
+                    analyses = self.analyses or load_analyses_from_directory(str(self.reports_dir))
                     red_flag_data = []
-                    for analysis in self.analyses:
+                    for analysis in analyses:
                         app_name = analysis.get('app_name', '')
                         for flag in analysis.get('scoring', {}).get('red_flags', []):
                             if isinstance(flag, dict):
@@ -591,7 +566,7 @@ This study analyzed {metadata['num_apps_analyzed']} healthcare application priva
                 logger.info(f"Excel exported: {excel_path}")
 
             except ImportError:
-                logger.warning("pandas not available, skipping Excel export")
+                logger.warning("xlsxwriter not available, skipping Excel export")
 
         return exports
 
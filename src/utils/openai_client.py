@@ -0,0 +1,49 @@
+"""Shared OpenAI clients for the analysis scripts"""
+
+import os
+import httpx
+from openai import OpenAI, AsyncOpenAI
+
+# Connection pool limits shared by the sync and async transports
+HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+
+_client = None
+_async_client = None
+
+
+def get_client() -> OpenAI:
+    """
+    Return the process-wide OpenAI client
+
+    The client keeps one HTTP/2 connection pool, so repeated calls reuse
+    TCP and TLS connections instead of opening a new pool per client.
+
+    Returns:
+        Shared OpenAI client
+    """
+    global _client
+    if _client is None:
+        _client = OpenAI(
+            api_key=os.getenv('OPENAI_API_KEY'),
+            http_client=httpx.Client(http2=True, limits=HTTP_LIMITS)
+        )
+    return _client
+
+
+def get_async_client() -> AsyncOpenAI:
+    """
+    Return the process-wide AsyncOpenAI client
+
+    Its connection pool belongs to the event loop that first uses it, so
+    call this from within a single asyncio.run().
+
+    Returns:
+        Shared AsyncOpenAI client
+    """
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncOpenAI(
+            api_key=os.getenv('OPENAI_API_KEY'),
+            http_client=httpx.AsyncClient(http2=True, limits=HTTP_LIMITS)
+        )
+    return _async_client
@@ -0,0 +1,94 @@
+"""
+Z-score outlier detection over score matrices
+
+Used by AnalysisValidator for batch anomaly detection. The column scan is
+compiled with numba when it is installed; otherwise a vectorized NumPy
+version is used.
+"""
+
+from typing import List, Optional, Tuple
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def to_score_matrix(columns: List[List[Optional[float]]]) -> np.ndarray:
+    """Stack per-metric value lists into an apps x metrics matrix, NaN for None"""
+    return np.array(
+        [[np.nan if v is None else v for v in column] for column in columns],
+        dtype=np.float64
+    ).T.reshape(len(columns[0]) if columns else 0, len(columns))
+
+
+def zscore_outliers_numpy(matrix: np.ndarray, threshold: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized NumPy implementation of zscore_outliers"""
+    counts = np.sum(~np.isnan(matrix), axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        z = (matrix - np.nanmean(matrix, axis=0)) / np.nanstd(matrix, axis=0)
+    mask = (np.abs(z) > threshold) & (counts >= 3)
+    cols, rows = np.nonzero(mask.T)
+    return rows, cols, z[rows, cols]
+
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _zscore_kernel(matrix, threshold):
+        """Compiled equivalent of zscore_outliers_numpy"""
+        n_rows, n_cols = matrix.shape
+        rows = np.empty(n_rows * n_cols, dtype=np.int64)
+        cols = np.empty(n_rows * n_cols, dtype=np.int64)
+        zs = np.empty(n_rows * n_cols, dtype=np.float64)
+        found = 0
+
+        for j in range(n_cols):
+            count = 0
+            total = 0.0
+            for i in range(n_rows):
+                if not np.isnan(matrix[i, j]):
+                    count += 1
+                    total += matrix[i, j]
+            if count < 3:
+                continue
+
+            mean = total / count
+            var = 0.0
+            for i in range(n_rows):
+                if not np.isnan(matrix[i, j]):
+                    var += (matrix[i, j] - mean) ** 2
+            sd = np.sqrt(var / count)
+            if sd == 0.0:
+                continue
+
+            for i in range(n_rows):
+                if not np.isnan(matrix[i, j]):
+                    z = (matrix[i, j] - mean) / sd
+                    if abs(z) > threshold:
+                        rows[found] = i
+                        cols[found] = j
+                        zs[found] = z
+                        found += 1
+
+        return rows[:found], cols[:found], zs[:found]
+else:
+    _zscore_kernel = zscore_outliers_numpy
+
+
+def zscore_outliers(matrix: np.ndarray, threshold: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Column-wise z-score outliers of a score matrix (NaN marks a missing value)
+
+    Columns with fewer than 3 values or zero spread have no outliers.
+
+    Args:
+        matrix: Apps x metrics float matrix
+        threshold: Absolute z-score above which a value is an outlier
+
+    Returns:
+        (row indices, column indices, signed z-scores) of every outlier,
+        ordered by column and then row
+    """
+    return _zscore_kernel(np.ascontiguousarray(matrix, dtype=np.float64), threshold)
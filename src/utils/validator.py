@@ -16,14 +16,15 @@ Author: Privacy Policy Analyzer Team
 Version: 2.0
 """
 
-import json
+import orjson
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
-import numpy as np
-from scipy import stats
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+
+# NumPy (and numba, if installed) are imported by src.utils.outliers only
+# when anomaly detection runs
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -356,7 +357,7 @@ class AnalysisValidator:
             warnings.append("No valid category scores found for consistency check")
             return warnings
 
-        avg_category_score = np.mean(category_scores)
+        avg_category_score = sum(category_scores) / len(category_scores)
 
         # Check against overall_risk_score
         if 'overall_risk_score' in analysis:
@@ -540,29 +541,14 @@ class AnalysisValidator:
             else:
                 rf_counts.append(0)
 
-        # Detect outliers for each metric
-        anomalies['overall_risk_score'] = self._find_outliers(
-            risk_scores, app_names, 'overall_risk_score'
-        )
-
-        anomalies['overall_transparency_score'] = self._find_outliers(
-            transp_scores, app_names, 'overall_transparency_score'
-        )
-
-        anomalies['confidence_score'] = self._find_outliers(
-            conf_scores, app_names, 'confidence_score'
-        )
-
-        anomalies['red_flag_count'] = self._find_outliers(
-            rf_counts, app_names, 'red_flag_count'
-        )
-
         # Detect anomalies in category scores
         category_names = set()
         for analysis in analyses:
             if 'categories' in analysis:
                 category_names.update(analysis['categories'].keys())
+        category_names = list(category_names)
 
+        columns = [risk_scores, transp_scores, conf_scores, rf_counts]
         for cat_name in category_names:
             cat_scores = []
             for analysis in analyses:
@@ -571,46 +557,59 @@ class AnalysisValidator:
                     cat_scores.append(score)
                 else:
                     cat_scores.append(None)
+            columns.append(cat_scores)
+
+        # Score every metric in one pass over an apps x metrics matrix
+        metric_names = ['overall_risk_score', 'overall_transparency_score',
+                        'confidence_score', 'red_flag_count'] + category_names
+        outliers = self._matrix_outliers(columns, app_names, metric_names)
 
-            outliers = self._find_outliers(cat_scores, app_names, cat_name)
-            if outliers:
-                anomalies['category_scores'][cat_name] = outliers
+        for metric_name in metric_names[:4]:
+            anomalies[metric_name] = outliers[metric_name]
+
+        for cat_name in category_names:
+            if outliers[cat_name]:
+                anomalies['category_scores'][cat_name] = outliers[cat_name]
 
         return anomalies
 
-    def _find_outliers(self, values: List[Optional[float]],
-                      labels: List[str],
-                      metric_name: str) -> List[Dict]:
+    def _matrix_outliers(self, columns: List[List[Optional[float]]],
+                         labels: List[str],
+                         metric_names: List[str]) -> Dict[str, List[Dict]]:
         """
-        Find outliers using z-score method
+        Find z-score outliers in every metric column
 
-        Returns list of outlier dictionaries with app name, value, z-score
+        Returns mapping of metric name to outlier dictionaries, in app order
         """
-        # Filter out None values
-        valid_pairs = [(v, l) for v, l in zip(values, labels) if v is not None]
+        from src.utils.outliers import to_score_matrix, zscore_outliers
 
-        if len(valid_pairs) < 3:
-            return []  # Need at least 3 values for meaningful statistics
+        results = {name: [] for name in metric_names}
+        matrix = to_score_matrix(columns)
+        if matrix.size == 0:
+            return results
 
-        valid_values = [v for v, _ in valid_pairs]
-        valid_labels = [l for _, l in valid_pairs]
+        rows, cols, z_scores = zscore_outliers(matrix, self.OUTLIER_THRESHOLD)
 
-        # Calculate z-scores
-        z_scores = np.abs(stats.zscore(valid_values))
+        for i, j, z_score in zip(rows, cols, z_scores):
+            results[metric_names[j]].append({
+                'app_name': labels[i],
+                'metric': metric_names[j],
+                'value': float(matrix[i, j]),
+                'z_score': float(abs(z_score)),
+                'deviation': 'high' if z_score > 0 else 'low'
+            })
 
-        # Find outliers
-        outliers = []
-        for value, label, z_score in zip(valid_values, valid_labels, z_scores):
-            if z_score > self.OUTLIER_THRESHOLD:
-                outliers.append({
-                    'app_name': label,
-                    'metric': metric_name,
-                    'value': float(value),
-                    'z_score': float(z_score),
-                    'deviation': 'high' if value > np.mean(valid_values) else 'low'
-                })
+        return results
 
-        return outliers
+    def _find_outliers(self, values: List[Optional[float]],
+                      labels: List[str],
+                      metric_name: str) -> List[Dict]:
+        """
+        Find outliers using z-score method
+
+        Returns list of outlier dictionaries with app name, value, z-score
+        """
+        return self._matrix_outliers([values], labels, [metric_name])[metric_name]
 
     def generate_validation_report(self, batch_results: Dict,
                                   output_path: Optional[str] = None) -> str:
@@ -724,9 +723,10 @@ class AnalysisValidator:
         return report
 
 
-def load_and_validate_directory(directory: str,
+def load_and_validate_directory(directory: Optional[str] = None,
                                strict_mode: bool = False,
-                               output_report: Optional[str] = None) -> Dict:
+                               output_report: Optional[str] = None,
+                               analyses: Optional[List[Dict]] = None) -> Dict:
     """
     Convenience function to load and validate all analyses in a directory
 
@@ -734,26 +734,31 @@ def load_and_validate_directory(directory: str,
         directory: Path to directory containing JSON analysis files
         strict_mode: If True, treat warnings as errors
         output_report: Optional path to save validation report
+        analyses: Already-loaded analyses; when given, directory is not read
 
     Returns:
         Batch validation results
     """
-    logger.info(f"Loading analyses from: {directory}")
+    if analyses is None:
+        if directory is None:
+            raise ValueError("Either directory or analyses must be provided")
+
+        logger.info(f"Loading analyses from: {directory}")
 
-    # Load all JSON files
-    analyses = []
-    json_files = list(Path(directory).glob("*.json"))
+        # Load all JSON files, overlapping the reads in a thread pool
+        def load(json_file: Path) -> Optional[Dict]:
+            try:
+                return orjson.loads(json_file.read_bytes())
+            except Exception as e:
+                logger.error(f"Error loading {json_file}: {e}")
+                return None
 
-    for json_file in json_files:
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                analysis = json.load(f)
-                analyses.append(analysis)
-        except Exception as e:
-            logger.error(f"Error loading {json_file}: {e}")
+        json_files = list(Path(directory).glob("*.json"))
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            analyses = [a for a in executor.map(load, json_files) if a is not None]
 
     if not analyses:
-        logger.warning(f"No valid JSON files found in {directory}")
+        logger.warning(f"No valid analyses to validate (directory: {directory})")
         return {
             'individual_results': [],
             'summary': {
@@ -0,0 +1,67 @@
+"""Unit tests for the analyzer's SQLite response cache"""
+
+from types import SimpleNamespace
+
+import pytest
+from src.modules import analyzer as analyzer_module
+from src.modules.analyzer import PolicyAnalyzer
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for the analyzer module's time.time()"""
+    now = [1_000_000.0]
+    monkeypatch.setattr(analyzer_module, 'time', SimpleNamespace(time=lambda: now[0]))
+    return now
+
+
+def make_analyzer(tmp_path, **analysis_config):
+    """Analyzer caching in tmp_path, with the in-memory tier disabled"""
+    analysis_config.setdefault('memory_cache_entries', 0)
+    return PolicyAnalyzer({'paths': {'cache': str(tmp_path)}, 'analysis': analysis_config})
+
+
+def test_cache_round_trip(tmp_path, clock):
+    """Test a saved analysis is loaded back from the database"""
+    analyzer = make_analyzer(tmp_path)
+    analyzer._save_to_cache('a', {'score': 1})
+
+    assert analyzer._load_from_cache('a') == {'score': 1}
+    assert analyzer._load_from_cache('missing') is None
+    assert (analyzer.cache_hits, analyzer.cache_misses) == (1, 1)
+
+
+def test_cache_evicts_least_recently_accessed(tmp_path, clock):
+    """Test saving past cache_max_entries drops the least recently accessed rows"""
+    analyzer = make_analyzer(tmp_path, cache_max_entries=2)
+    analyzer._save_to_cache('a', {'key': 'a'})
+    clock[0] += 1
+    analyzer._save_to_cache('b', {'key': 'b'})
+    clock[0] += 1
+    assert analyzer._load_from_cache('a') is not None
+    clock[0] += 1
+    analyzer._save_to_cache('c', {'key': 'c'})
+
+    keys = {row[0] for row in analyzer._cache_conn.execute('SELECT key FROM cache')}
+    assert keys == {'a', 'c'}
+
+
+@pytest.mark.parametrize('max_entries', [0, None])
+def test_cache_without_size_limit(tmp_path, clock, max_entries):
+    """Test a zero or null cache_max_entries keeps every entry"""
+    analyzer = make_analyzer(tmp_path, cache_max_entries=max_entries)
+    for key in 'abc':
+        analyzer._save_to_cache(key, {'key': key})
+
+    assert analyzer.cache_max_entries is None
+    assert all(analyzer._load_from_cache(key) == {'key': key} for key in 'abc')
+
+
+def test_cache_entries_expire_after_ttl(tmp_path, clock):
+    """Test entries older than cache_duration_days are treated as misses"""
+    analyzer = make_analyzer(tmp_path, cache_duration_days=1)
+    analyzer._save_to_cache('a', {'key': 'a'})
+
+    clock[0] += 86400 + 1
+    assert analyzer._load_from_cache('a') is None
+    assert analyzer._cache_conn.execute('SELECT COUNT(*) FROM cache').fetchone()[0] == 0
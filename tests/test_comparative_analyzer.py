@@ -0,0 +1,161 @@
+"""Unit tests for comparative analyzer module"""
+
+import pytest
+import numpy as np
+from src.modules.comparative_analyzer import ComparativeAnalyzer
+
+
+def make_analysis(app_name, overall, transparency, category_score, hipaa=False, flags=()):
+    """Build a minimal report in the shape written by the JSON reporter"""
+    analysis = {
+        category: {'score': category_score + offset, 'concerns': [], 'positive_aspects': []}
+        for offset, category in enumerate(ComparativeAnalyzer.CATEGORIES)
+    }
+    analysis['compliance']['hipaa_mentioned'] = hipaa
+    analysis['overall_transparency_score'] = transparency
+    analysis['confidence_score'] = 80
+    analysis['missing_information'] = ['retention period']
+
+    return {
+        'app_name': app_name,
+        'url': f'https://{app_name.lower()}.example.com/privacy',
+        'analysis': analysis,
+        'scoring': {
+            'overall_score': overall,
+            'red_flags': [
+                {'description': desc, 'category': 'third_party_sharing', 'severity': 'high'}
+                for desc in flags
+            ]
+        }
+    }
+
+
+@pytest.fixture
+def analyses():
+    """Four sample app analyses"""
+    return [
+        make_analysis('Alpha', 40, 55, 30, hipaa=True, flags=['Sells data']),
+        make_analysis('Beta', 65, 70, 60, hipaa=True, flags=['Sells data', 'No retention']),
+        make_analysis('Gamma', 80, 45, 75),
+        make_analysis('Delta', 55, 60, 50, flags=['No retention']),
+    ]
+
+
+@pytest.fixture
+def analyzer(analyses):
+    """Create ComparativeAnalyzer instance"""
+    return ComparativeAnalyzer(analyses)
+
+
+def test_score_matrix_shape(analyzer):
+    """Test score matrix has one row per app and one column per category"""
+    assert analyzer._score_matrix.shape == (4, len(ComparativeAnalyzer.CATEGORIES))
+
+
+def test_category_stats_match_per_category_values(analyzer):
+    """Test vectorized category statistics match per-list computations"""
+    stats = analyzer.calculate_statistics()
+
+    for category in ComparativeAnalyzer.CATEGORIES:
+        values = np.array(analyzer.metrics['category_scores'][category], dtype=float)
+        category_stats = stats['category_stats'][category]
+
+        assert category_stats['mean'] == pytest.approx(values.mean())
+        assert category_stats['median'] == pytest.approx(np.median(values))
+        assert category_stats['std'] == pytest.approx(values.std())
+        assert category_stats['min'] == pytest.approx(values.min())
+        assert category_stats['max'] == pytest.approx(values.max())
+        assert category_stats['percentiles']['75'] == pytest.approx(np.percentile(values, 75))
+
+
+def test_red_flag_stats(analyzer):
+    """Test red flag frequencies are counted across apps"""
+    stats = analyzer.calculate_statistics()
+    red_flags = stats['red_flag_stats']
+
+    assert red_flags['total_flags'] == 4
+    assert red_flags['unique_flags'] == 2
+    assert red_flags['by_severity'] == {'high': 4}
+    assert red_flags['most_common'][0]['count'] == 2
+
+
+def test_compliance_stats(analyzer):
+    """Test compliance counts and percentages"""
+    stats = analyzer.calculate_statistics()
+    hipaa = stats['compliance_stats']['hipaa_mentioned']
+
+    assert hipaa['count'] == 2
+    assert hipaa['percentage'] == pytest.approx(50.0)
+
+
+def test_rankings_order(analyzer):
+    """Test overall ranking is sorted by score, highest first"""
+    stats = analyzer.calculate_statistics()
+    ranking = stats['rankings']['overall_risk']
+
+    assert [r['app_name'] for r in ranking] == ['Gamma', 'Beta', 'Delta', 'Alpha']
+    assert ranking[0]['percentile'] == pytest.approx(100.0)
+
+
+def test_clustering_covers_every_app(analyzer):
+    """Test every app lands in exactly one cluster"""
+    clusters = analyzer.calculate_statistics()['clusters']
+
+    assert clusters['n_clusters'] == 2
+    names = [app['app_name'] for c in clusters['clusters'] for app in c['apps']]
+    assert sorted(names) == ['Alpha', 'Beta', 'Delta', 'Gamma']
+    assert sum(c['size'] for c in clusters['clusters']) == 4
+
+
+def test_practices_use_quartile_thresholds(analyzer):
+    """Test best/worst practices pick apps at or beyond the quartiles"""
+    practices = analyzer.identify_practices()
+
+    best = [app['app_name'] for app in practices['best']['data_collection']]
+    worst = [app['app_name'] for app in practices['worst']['data_collection']]
+    assert best == ['Gamma']
+    assert worst == ['Alpha']
+    assert analyzer.identify_best_practices() == practices['best']
+
+
+def test_statistics_are_memoized(analyzer, mocker):
+    """Test repeated calls reuse the first statistics result"""
+    spy = mocker.spy(analyzer, '_compute_statistics')
+
+    first = analyzer.calculate_statistics()
+    assert analyzer.calculate_statistics() is first
+    assert analyzer.generate_comparative_report()['statistics'] is first
+    assert spy.call_count == 1
+
+
+def test_summary_table_round_trip(analyses, tmp_path):
+    """Test the Parquet summary is built from reports and reused while fresh"""
+    pytest.importorskip('pyarrow')
+    import orjson
+    from src.modules.comparative_analyzer import SUMMARY_FILENAME, load_summary_table
+
+    for analysis in analyses:
+        path = tmp_path / f"{analysis['app_name']}_report_20250101_000000.json"
+        path.write_bytes(orjson.dumps(analysis))
+
+    table = load_summary_table(str(tmp_path))
+    assert (tmp_path / SUMMARY_FILENAME).exists()
+    assert sorted(table['app_name']) == ['Alpha', 'Beta', 'Delta', 'Gamma']
+    assert table['red_flag_count'].sum() == 4
+    assert table['hipaa_mentioned'].sum() == 2
+    assert list(table['category']) == [''] * 4
+
+    cached = load_summary_table(str(tmp_path))
+    assert cached.equals(table)
+
+
+def test_loaded_reports_drop_unused_fields(analyses, tmp_path):
+    """Test reports are pruned to the fields comparative analysis reads"""
+    import orjson
+    from src.modules.comparative_analyzer import load_analyses_from_directory
+
+    report = dict(analyses[0], scraped_data={'text': 'policy ' * 1000}, reports={})
+    (tmp_path / 'Alpha_report_20250101_000000.json').write_bytes(orjson.dumps(report))
+
+    loaded = load_analyses_from_directory(str(tmp_path))
+    assert loaded == [analyses[0]]
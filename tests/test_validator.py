@@ -0,0 +1,75 @@
+"""Unit tests for validator module"""
+
+import pytest
+import numpy as np
+from scipy import stats
+from src.utils.outliers import zscore_outliers, zscore_outliers_numpy
+from src.utils.validator import AnalysisValidator
+
+
+@pytest.fixture
+def validator():
+    """Create AnalysisValidator instance"""
+    return AnalysisValidator()
+
+
+@pytest.fixture
+def analyses():
+    """Twelve apps with one clear outlier in risk score and one category"""
+    analyses = []
+    for i in range(12):
+        analyses.append({
+            'app_name': f'App{i}',
+            'overall_risk_score': 50 + (i % 3),
+            'overall_transparency_score': 60 + (i % 4),
+            'confidence_score': 80,
+            'red_flags': [{'finding': 'x'}] * (i % 2),
+            'categories': {
+                'Data Collection': {'score': 40 + (i % 2)},
+                'Data Sharing': {'score': 55 + (i % 5)}
+            }
+        })
+    analyses[3]['overall_risk_score'] = 99
+    analyses[7]['categories']['Data Collection']['score'] = 5
+    del analyses[5]['confidence_score']
+    return analyses
+
+
+def test_find_outliers_matches_scipy_zscore(validator):
+    """Test z-scores agree with scipy.stats.zscore on the valid values"""
+    values = [10, 11, 12, 10, 11, 12, 10, 11, 12, 10, 11, 90, None]
+    labels = [f'App{i}' for i in range(len(values))]
+
+    outliers = validator._find_outliers(values, labels, 'metric')
+
+    expected = np.abs(stats.zscore([v for v in values if v is not None]))
+    assert len(outliers) == 1
+    assert outliers[0]['app_name'] == 'App11'
+    assert outliers[0]['z_score'] == pytest.approx(expected[11])
+    assert outliers[0]['deviation'] == 'high'
+
+
+def test_find_outliers_needs_three_values(validator):
+    """Test metrics with fewer than 3 values report no outliers"""
+    assert validator._find_outliers([1, 100, None], ['A', 'B', 'C'], 'metric') == []
+
+
+def test_detect_anomalies(validator, analyses):
+    """Test anomalies are reported per metric and per category"""
+    anomalies = validator._detect_anomalies(analyses)
+
+    assert [o['app_name'] for o in anomalies['overall_risk_score']] == ['App3']
+    assert anomalies['confidence_score'] == []
+    assert list(anomalies['category_scores']) == ['Data Collection']
+    assert anomalies['category_scores']['Data Collection'][0]['deviation'] == 'low'
+
+
+def test_numpy_fallback_matches_kernel(analyses):
+    """Test the pure-NumPy fallback finds the same outliers as the active kernel"""
+    matrix = np.array([[50, 1], [51, 2], [52, 1], [99, 2], [50, np.nan]], dtype=np.float64)
+
+    expected = zscore_outliers_numpy(matrix, 1.5)
+    actual = zscore_outliers(matrix, 1.5)
+
+    for a, b in zip(actual, expected):
+        np.testing.assert_allclose(a, b)